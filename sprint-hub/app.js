@@ -105,6 +105,7 @@ const el = {
   projectsDeleteBtn: document.getElementById("projectsDeleteBtn"),
   projectsSaveBtn: document.getElementById("projectsSaveBtn"),
   projectsNewBtn: document.getElementById("projectsNewBtn"),
+  projectsSearchInput: document.getElementById("projectsSearchInput"),
   createTypeModal: document.getElementById("createTypeModal"),
   createFolderChoiceBtn: document.getElementById("createFolderChoiceBtn"),
   createFileChoiceBtn: document.getElementById("createFileChoiceBtn"),
@@ -177,6 +178,18 @@ let copyTargetOnPick = null;
 let autoSaveTimer = null;
 let autoSaveInFlight = false;
 let autoSavePending = false;
+let lastSavedSprintMarkdown = {};
+let lastSavedBacklogJson = "";
+let backlogRevision = "";
+let reportedBacklogError = "";
+let olderSprintsCursor = "";
+let olderSprintsLoading = false;
+const SPRINT_PAGE_SIZE = 12;
+const SPRINT_EDIT_MAX_OPS = 8;
+const CLIENT_ID = uid();
+let changeFeed = null;
+let deliveryRollup = { totals: null, projects: {}, sprints: {} };
+let deliveryRollupKey = "";
 let boardView = "sprints";
 let taskLayoutView = "projects";
 let selectedProjectKey = "";
@@ -201,6 +214,10 @@ let projectsTreeDirs = [];
 let projectsTreeFiles = [];
 let currentProjectFile = "";
 let currentProjectDir = "";
+let currentProjectFileContent = "";
+let currentProjectFileRevision = "";
+let projectsSearchTimer = null;
+let projectsSearchResults = null;
 let sprintModalOnSave = null;
 let sprintModalOnCopy = null;
 let sprintModalOnCopyMd = null;
@@ -210,6 +227,8 @@ let dragProjectKey = "";
 let pjsEntries = [];
 let teamEntries = [];
 let currentTeamFile = "";
+let currentTeamFileContent = "";
+let currentTeamFileRevision = "";
 let showInactiveTeamMembers = false;
 let currentTimelineProjectKey = "";
 let currentTimelineEntries = [];
@@ -356,16 +375,6 @@ function normalizeTeamArea(value) {
   return match || "";
 }
 
-function parseTeamAreaFromContent(content) {
-  const lines = String(content || "").split(/\r?\n/);
-  for (const raw of lines) {
-    const m = raw.match(/^\s*(?:Area|Área)\s*:\s*(.*)\s*$/i);
-    if (!m) continue;
-    return normalizeTeamArea(m[1]);
-  }
-  return "";
-}
-
 function getTeamEntryByNickname(nickname) {
   const target = String(nickname || "").trim().toLowerCase();
   if (!target) return null;
@@ -376,40 +385,6 @@ function getTeamAreaByNickname(nickname) {
   return getTeamEntryByNickname(nickname)?.area || "";
 }
 
-function parseTeamActiveFromContent(content) {
-  const lines = String(content || "").split(/\r?\n/);
-  for (const raw of lines) {
-    const m = raw.match(/^\s*Ativo\s*:\s*(.*)\s*$/i);
-    if (!m) continue;
-    const value = String(m[1] || "").trim().toLowerCase();
-    return value === "sim" || value === "yes" || value === "true" || value === "1";
-  }
-  return false;
-}
-
-function parseTeamAverageScore(content) {
-  const lines = String(content || "").split(/\r?\n/);
-  let inScoreBlock = false;
-  const scores = [];
-  for (const raw of lines) {
-    const line = String(raw || "").trim();
-    if (!line) continue;
-    if (/^placar tech innovation$/i.test(line)) {
-      inScoreBlock = true;
-      continue;
-    }
-    if (!inScoreBlock) continue;
-    if (/^#{1,6}\s+/.test(line)) break;
-    const m = line.match(/^[^:]+:\s*(-?\d+(?:[.,]\d+)?)\s*$/);
-    if (!m) continue;
-    const value = Number(String(m[1]).replace(",", "."));
-    if (!Number.isFinite(value)) continue;
-    scores.push(value);
-  }
-  if (!scores.length) return null;
-  return scores.reduce((sum, n) => sum + n, 0) / scores.length;
-}
-
 function isTeamMetricsFile(path) {
   return String(path || "") === TEAM_METRICS_VIRTUAL_PATH;
 }
@@ -523,51 +498,6 @@ function compareTimelineEntries(left, right) {
   return String(a.name).localeCompare(String(b.name));
 }
 
-function parseTimelineMarkdown(content) {
-  const lines = String(content || "").split(/\r?\n/);
-  const entries = [];
-  let current = null;
-  let descLines = [];
-
-  const flush = () => {
-    if (!current || !current.date || !current.name) {
-      current = null;
-      descLines = [];
-      return;
-    }
-    entries.push(
-      normalizeTimelineEntry({
-        ...current,
-        description: descLines.join(" ").trim(),
-      })
-    );
-    current = null;
-    descLines = [];
-  };
-
-  lines.forEach((raw) => {
-    const line = String(raw || "").trimEnd();
-    const heading = line.match(/^##\s+(\d{4}-\d{2}-\d{2})\s+\-\s+(.+)$/);
-    if (heading) {
-      flush();
-      current = {
-        date: heading[1],
-        name: heading[2].trim(),
-      };
-      return;
-    }
-    if (!current) return;
-    if (!line.trim()) {
-      if (descLines.length) descLines.push("");
-      return;
-    }
-    descLines.push(line.trim());
-  });
-
-  flush();
-  return entries.sort(compareTimelineEntries);
-}
-
 function formatTimelineMarkdown(projectKey, entries) {
   const projectName = normalizeProjectKey(projectKey) || "Project";
   const lines = [
@@ -628,44 +558,6 @@ function featuresToMarkdown(projectKey, entries) {
   return `${lines.join("\n").trim()}\n`;
 }
 
-function parseFeaturesMarkdown(content) {
-  const lines = String(content || "").split(/\r?\n/);
-  const entries = [];
-  let current = null;
-  const descLines = [];
-
-  const flush = () => {
-    if (!current) return;
-    entries.push({
-      id: current.id || uid(),
-      name: String(current.name || "").trim(),
-      description: descLines.join(" ").trim(),
-    });
-    current = null;
-    descLines.length = 0;
-  };
-
-  lines.forEach((raw) => {
-    const line = String(raw || "").trim();
-    if (!line) {
-      if (current && descLines.length) descLines.push("");
-      return;
-    }
-    if (/^#\s+/.test(line)) return;
-    if (/^_\s*.*\s*_$/i.test(line) && !current) return;
-    const featureMatch = line.match(/^##\s+(.+)$/);
-    if (featureMatch) {
-      flush();
-      current = { id: uid(), name: featureMatch[1].trim() };
-      return;
-    }
-    if (current) descLines.push(line);
-  });
-
-  flush();
-  return entries.filter((entry) => entry.name);
-}
-
 function formatTimelineDate(dateText) {
   const raw = String(dateText || "").trim();
   if (!raw) return "";
@@ -674,16 +566,6 @@ function formatTimelineDate(dateText) {
   return `${match[3]}/${match[2]}/${match[1]}`;
 }
 
-function parseTopicHeading(rawHeading) {
-  const raw = String(rawHeading || "").trim();
-  const m = raw.match(/^(.*?)\s*\[project:([^\]]+)\]\s*$/i);
-  if (!m) return { title: raw, projectKey: "" };
-  return {
-    title: (m[1] || "").trim() || raw,
-    projectKey: normalizeProjectKey(m[2]),
-  };
-}
-
 function formatTopicHeading(topic) {
   const title = String(topic.title || "").trim();
   const projectKey = normalizeProjectKey(topic.projectKey);
@@ -934,47 +816,31 @@ function updateProjectCatalogFromTree(dirs, files) {
   normalizeAllTopics();
 }
 
-async function refreshProjectControls() {
-  const next = {};
-  await Promise.all(
-    projectCatalog.map(async (projectKey) => {
-      try {
-        const payload = await fetchProjectFile(`${projectKey}/${PROJECT_CONTROL_FILE}`);
-        const control = normalizeProjectControl(projectKey, JSON.parse(payload.content || "{}"));
-        if (!control.status) control.status = inferProjectStatusFromSprints(projectKey);
-        next[projectKey] = control;
-      } catch {
-        next[projectKey] = normalizeProjectControl(projectKey, {
-          name: projectKey,
-          status: inferProjectStatusFromSprints(projectKey),
-        });
-      }
-    })
-  );
-  projectControls = next;
-}
-
-async function refreshProjectFeaturesCatalog() {
-  const next = {};
-  await Promise.all(
-    projectCatalog.map(async (projectKey) => {
-      try {
-        const payload = await fetchProjectFile(`${projectKey}/features.md`);
-        next[projectKey] = parseFeaturesMarkdown(payload.content || "");
-      } catch {
-        next[projectKey] = [];
-      }
-    })
-  );
-  projectFeaturesCatalog = next;
+async function refreshProjectSupportCatalogs(parts = ["control", "features"], projectKeys = projectCatalog) {
+  let bundles = [];
+  try {
+    if (projectKeys.length) bundles = (await fetchProjectBundles(projectKeys, parts, false)).projects || [];
+  } catch {
+    bundles = [];
+  }
+  const controls = projectKeys === projectCatalog ? {} : { ...projectControls };
+  const features = projectKeys === projectCatalog ? {} : { ...projectFeaturesCatalog };
+  projectKeys.forEach((projectKey, index) => {
+    const bundle = bundles[index] || {};
+    const control = normalizeProjectControl(projectKey, bundle.control || { name: projectKey });
+    if (!control.status) control.status = inferProjectStatusFromSprints(projectKey);
+    controls[projectKey] = control;
+    features[projectKey] = (bundle.features || []).map((entry) => ({ id: uid(), ...entry }));
+  });
+  if (parts.includes("control")) projectControls = controls;
+  if (parts.includes("features")) projectFeaturesCatalog = features;
 }
 
 async function refreshProjectCatalog() {
   try {
     const payload = await fetchProjectsTree();
     updateProjectCatalogFromTree(payload.dirs || [], payload.files || []);
-    await refreshProjectControls();
-    await refreshProjectFeaturesCatalog();
+    await refreshProjectSupportCatalogs();
   } catch {
     projectCatalog = [];
     projectControls = {};
@@ -1084,202 +950,6 @@ function normalizeTaskAreas(value) {
   return Array.from(new Set(rawValues.map((entry) => normalizeTeamArea(entry)).filter(Boolean)));
 }
 
-function parseItemTextAndResponsibles(rawText) {
-  let text = String(rawText || "").trim();
-  let priority = "normal";
-  let blocked = false;
-  let blockedReason = "";
-  let followed = false;
-  let featureName = "";
-  let status = "";
-  let areas = [];
-
-  const blockedReasonMatch = text.match(/\[BLOCKED\s*:\s*([^\]]+)\]/i);
-  if (blockedReasonMatch) {
-    blocked = true;
-    blockedReason = String(blockedReasonMatch[1] || "").trim();
-  }
-
-  const featureMatch = text.match(/\[FEATURE\s*:\s*([^\]]+)\]/i);
-  if (featureMatch) {
-    featureName = String(featureMatch[1] || "").trim();
-  }
-
-  const statusMatch = text.match(/\[STATUS\s*:\s*([^\]]+)\]/i);
-  if (statusMatch) {
-    status = normalizeTaskFlowStatus(statusMatch[1]);
-  }
-
-  const areaMatch = text.match(/\[AREA\s*:\s*([^\]]+)\]/i);
-  if (areaMatch) {
-    areas = normalizeTaskAreas(areaMatch[1]);
-  }
-
-  const metaMatches = text.match(/\[(HIGH|BLOCKED|FOLLOWED)\]/gi) || [];
-  metaMatches.forEach((m) => {
-    if (/HIGH/i.test(m)) priority = "high";
-    if (/BLOCKED/i.test(m)) blocked = true;
-    if (/FOLLOWED/i.test(m)) followed = true;
-  });
-  text = text
-    .replace(/\s*\[FEATURE\s*:\s*[^\]]+\]/gi, "")
-    .replace(/\s*\[STATUS\s*:\s*[^\]]+\]/gi, "")
-    .replace(/\s*\[AREA\s*:\s*[^\]]+\]/gi, "")
-    .replace(/\s*\[BLOCKED\s*:\s*[^\]]+\]/gi, "")
-    .replace(/\s*\[(HIGH|BLOCKED|FOLLOWED)\]/gi, "")
-    .trim();
-
-  const m = text.match(/^(.*)\(([^()]*)\)\s*$/);
-  if (!m) return { text, responsibles: [], priority, blocked, blockedReason, followed, featureName, status, areas };
-
-  const body = m[1].trim();
-  const namesRaw = m[2].trim();
-  if (!/[A-Za-z]/.test(namesRaw)) return { text, responsibles: [], priority, blocked, blockedReason, followed, featureName, status, areas };
-
-  const responsibles = namesRaw
-    .split(/\s*\+\s*|\s*,\s*/)
-    .map((x) => x.trim())
-    .filter(Boolean);
-
-  if (!responsibles.length) return { text, responsibles: [], priority, blocked, blockedReason, followed, featureName, status, areas };
-  return { text: body || text, responsibles, priority, blocked, blockedReason, followed, featureName, status, areas };
-}
-
-function parseSprintMarkdown(fileName, markdown) {
-  const rawLines = markdown.split(/\r?\n/).map((x) => x.trimEnd());
-  let name = fileName.replace(/\.md$/i, "");
-  let goal = "";
-  const topics = [];
-  let currentTopic = null;
-
-  for (const lineRaw of rawLines) {
-    const line = lineRaw.trim();
-    if (!line) continue;
-
-    if (line.startsWith("# ")) {
-      const v = line.slice(2).trim();
-      name = v.replace(/^Sprint\s+/i, "").trim() || name;
-      continue;
-    }
-
-    if (/^Goal:\s*/i.test(line)) {
-      goal = line.replace(/^Goal:\s*/i, "").trim();
-      continue;
-    }
-
-    if (/^##\s+/.test(line)) {
-      const heading = parseTopicHeading(line.replace(/^##\s+/, "").trim());
-      currentTopic = {
-        id: uid(),
-        title: heading.title,
-        projectKey: heading.projectKey,
-        status: "",
-        startDate: "",
-        deliveryDate: "",
-        description: "",
-        items: [],
-      };
-      topics.push(currentTopic);
-      continue;
-    }
-
-    if (/^- \[[ xX]\]\s+/.test(line)) {
-      if (!currentTopic) {
-        currentTopic = { id: uid(), title: "Updates", projectKey: "", status: "", startDate: "", deliveryDate: "", description: "", items: [] };
-        topics.push(currentTopic);
-      }
-      const done = /^- \[[xX]\]/.test(line);
-      const parsed = parseItemTextAndResponsibles(line.replace(/^- \[[ xX]\]\s+/, "").trim());
-        if (parsed.text) {
-          currentTopic.items.push({
-            id: uid(),
-            text: parsed.text,
-            done,
-            projectKey: currentTopic.projectKey,
-            responsibles: parsed.responsibles,
-            status: parsed.status,
-            areas: parsed.areas,
-            priority: parsed.priority,
-            blocked: parsed.blocked,
-            blockedReason: parsed.blockedReason,
-          followed: parsed.followed,
-          featureName: parsed.featureName,
-        });
-      }
-      continue;
-    }
-
-    if (/^- /.test(line)) {
-      if (!currentTopic) {
-        currentTopic = { id: uid(), title: "Updates", projectKey: "", status: "", startDate: "", deliveryDate: "", description: "", items: [] };
-        topics.push(currentTopic);
-      }
-      const parsed = parseItemTextAndResponsibles(line.replace(/^- /, "").trim());
-        if (parsed.text) {
-          currentTopic.items.push({
-            id: uid(),
-            text: parsed.text,
-            done: false,
-            projectKey: currentTopic.projectKey,
-            responsibles: parsed.responsibles,
-            status: parsed.status,
-            areas: parsed.areas,
-            priority: parsed.priority,
-            blocked: parsed.blocked,
-            blockedReason: parsed.blockedReason,
-          followed: parsed.followed,
-          featureName: parsed.featureName,
-        });
-      }
-      continue;
-    }
-
-    if (/^Status:\s*/i.test(line)) {
-      if (!currentTopic) {
-        currentTopic = { id: uid(), title: "Updates", projectKey: "", status: "", startDate: "", deliveryDate: "", description: "", items: [] };
-        topics.push(currentTopic);
-      }
-      currentTopic.status = normalizeProjectStatus(line.replace(/^Status:\s*/i, "").trim());
-      continue;
-    }
-
-    if (/^Start Date:\s*/i.test(line)) {
-      if (!currentTopic) {
-        currentTopic = { id: uid(), title: "Updates", projectKey: "", status: "", startDate: "", deliveryDate: "", description: "", items: [] };
-        topics.push(currentTopic);
-      }
-      currentTopic.startDate = normalizeTopicStartDate(line.replace(/^Start Date:\s*/i, "").trim());
-      continue;
-    }
-
-    if (/^Delivery Date:\s*/i.test(line)) {
-      if (!currentTopic) {
-        currentTopic = { id: uid(), title: "Updates", projectKey: "", status: "", startDate: "", deliveryDate: "", description: "", items: [] };
-        topics.push(currentTopic);
-      }
-      currentTopic.deliveryDate = normalizeTopicDeliveryDate(line.replace(/^Delivery Date:\s*/i, "").trim());
-      continue;
-    }
-
-    if (!currentTopic) {
-      currentTopic = { id: uid(), title: "Updates", projectKey: "", status: "", startDate: "", deliveryDate: "", description: "", items: [] };
-      topics.push(currentTopic);
-    }
-
-    currentTopic.description = currentTopic.description
-      ? `${currentTopic.description} ${line}`.trim()
-      : line;
-  }
-
-  return {
-    id: uid(),
-    name,
-    goal,
-    fileName,
-    topics,
-  };
-}
-
 function sprintToMarkdown(sprint) {
   const lines = [`# Sprint ${sprint.name}`, ""];
   if (sprint.goal) lines.push(`Goal: ${sprint.goal}`, "");
@@ -1316,47 +986,125 @@ function sprintToMarkdown(sprint) {
   return lines.join("\n").trim() + "\n";
 }
 
-async function fetchSprintFiles() {
-  const res = await fetch("/api/sprint-files");
-  if (!res.ok) throw new Error("Failed to load sprint files");
+async function fetchSprints(params = {}) {
+  const query = new URLSearchParams(params).toString();
+  const res = await fetch(`/api/sprints${query ? `?${query}` : ""}`, { cache: "no-cache" });
+  if (!res.ok) throw new Error("Failed to load sprints");
   return res.json();
 }
 
+function hydrateSprintModel(model) {
+  return {
+    id: uid(),
+    name: model.name,
+    goal: model.goal,
+    fileName: model.fileName,
+    revision: model.revision || "",
+    topics: (model.topics || []).map((topic) => ({
+      id: uid(),
+      ...topic,
+      items: (topic.items || []).map((item) => ({ id: uid(), ...item })),
+    })),
+  };
+}
+
 async function fetchProjectsTree() {
-  const res = await fetch("/api/projects/tree");
+  const res = await fetch("/api/projects/tree", { cache: "no-cache" });
   if (!res.ok) throw new Error("Failed to load projects tree");
   return res.json();
 }
 
+async function searchNotes(query, scope = "") {
+  const params = new URLSearchParams({ q: query });
+  if (scope) params.set("scope", scope);
+  const res = await fetch(`/api/search?${params.toString()}`);
+  if (!res.ok) throw new Error("Failed to search notes");
+  return res.json();
+}
+
 async function fetchProjectFile(relPath) {
   const url = `/api/projects/file?path=${encodeURIComponent(relPath)}`;
-  const res = await fetch(url);
+  const res = await fetch(url, { cache: "no-cache" });
   if (!res.ok) throw new Error("Failed to load project file");
   return res.json();
 }
 
-async function fetchProjectTimeline(projectKey) {
-  const relPath = `${normalizeProjectKey(projectKey)}/timeline.md`;
-  try {
-    return await fetchProjectFile(relPath);
-  } catch (err) {
-    if (!normalizeProjectKey(projectKey)) throw err;
-    const content = formatTimelineMarkdown(projectKey, []);
-    await saveProjectFile(relPath, content);
-    return { path: relPath, content };
+async function fetchProjectBundles(projectKeys, include = null, withContent = true) {
+  const params = new URLSearchParams();
+  projectKeys.forEach((projectKey) => params.append("project", projectKey));
+  if (include) params.set("include", include.join(","));
+  if (!withContent) params.set("content", "0");
+  const res = await fetch(`/api/projects/bundle?${params.toString()}`, { cache: "no-cache" });
+  if (!res.ok) throw new Error("Failed to load project files");
+  return res.json();
+}
+
+async function loadProjectBundle(projectKey) {
+  const key = normalizeProjectKey(projectKey);
+  const bundle = (await fetchProjectBundles([key])).projects[0];
+  const defaults = {
+    "timeline.md": formatTimelineMarkdown(key, []),
+    "features.md": formatFeaturesMarkdown(key),
+  };
+  const missing = Object.keys(defaults).filter((name) => !bundle.files[name]);
+  bundle.created = missing.length > 0;
+  if (bundle.created) {
+    await saveProjectFiles(missing.map((name) => ({ path: `${key}/${name}`, content: defaults[name] })));
+    bundle.timeline = bundle.timeline || [];
+    bundle.features = bundle.features || [];
   }
+  return bundle;
+}
+
+function isHighSurrogate(code) {
+  return code >= 0xd800 && code <= 0xdbff;
+}
+
+function isLowSurrogate(code) {
+  return code >= 0xdc00 && code <= 0xdfff;
 }
 
-async function saveProjectFile(relPath, content) {
+function textEdits(before, after) {
+  const limit = Math.min(before.length, after.length);
+  let start = 0;
+  while (start < limit && before.charCodeAt(start) === after.charCodeAt(start)) start += 1;
+  if (start > 0 && isHighSurrogate(before.charCodeAt(start - 1))) start -= 1;
+  let tail = 0;
+  while (tail < limit - start && before.charCodeAt(before.length - 1 - tail) === after.charCodeAt(after.length - 1 - tail)) tail += 1;
+  if (tail > 0 && isLowSurrogate(before.charCodeAt(before.length - tail))) tail -= 1;
+  return [{ start, end: before.length - tail, text: after.slice(start, after.length - tail) }];
+}
+
+function textSaveBody(path, content, previous) {
+  if (!previous?.revision) return { path, content };
+  return { path, base: previous.revision, edits: textEdits(previous.content, content) };
+}
+
+async function saveProjectFile(relPath, content, previous = null) {
+  if (previous?.revision && previous.content === content) return { path: relPath, revision: previous.revision };
   const res = await fetch("/api/projects/file/save", {
     method: "POST",
-    headers: { "Content-Type": "application/json" },
-    body: JSON.stringify({ path: relPath, content }),
+    headers: { "Content-Type": "application/json", "X-Client-Id": CLIENT_ID },
+    body: JSON.stringify(textSaveBody(relPath, content, previous)),
   });
   if (!res.ok) {
     const txt = await res.text();
     throw new Error(txt || "Failed to save project file");
   }
+  return res.json();
+}
+
+async function saveProjectFiles(files) {
+  const res = await fetch("/api/projects/bundle/save", {
+    method: "POST",
+    headers: { "Content-Type": "application/json", "X-Client-Id": CLIENT_ID },
+    body: JSON.stringify({ files }),
+  });
+  if (!res.ok) {
+    const txt = await res.text();
+    throw new Error(txt || "Failed to save project files");
+  }
+  return res.json();
 }
 
 async function saveProjectTimeline(projectKey, entries) {
@@ -1368,7 +1116,7 @@ async function saveProjectTimeline(projectKey, entries) {
 async function createProjectFolder(relPath) {
   const res = await fetch("/api/projects/folder/create", {
     method: "POST",
-    headers: { "Content-Type": "application/json" },
+    headers: { "Content-Type": "application/json", "X-Client-Id": CLIENT_ID },
     body: JSON.stringify({ path: relPath }),
   });
   if (!res.ok) {
@@ -1380,7 +1128,7 @@ async function createProjectFolder(relPath) {
 async function createProjectFile(relPath) {
   const res = await fetch("/api/projects/file/create", {
     method: "POST",
-    headers: { "Content-Type": "application/json" },
+    headers: { "Content-Type": "application/json", "X-Client-Id": CLIENT_ID },
     body: JSON.stringify({ path: relPath }),
   });
   if (res.ok) return;
@@ -1398,7 +1146,7 @@ async function createProjectFile(relPath) {
 async function deleteProjectFile(relPath) {
   const res = await fetch("/api/projects/file/delete", {
     method: "POST",
-    headers: { "Content-Type": "application/json" },
+    headers: { "Content-Type": "application/json", "X-Client-Id": CLIENT_ID },
     body: JSON.stringify({ path: relPath }),
   });
   if (res.ok) return;
@@ -1416,7 +1164,7 @@ async function deleteProjectFile(relPath) {
 }
 
 async function fetchPjsFile() {
-  const res = await fetch("/api/pjs");
+  const res = await fetch("/api/pjs", { cache: "no-cache" });
   if (!res.ok) throw new Error("Failed to load PJs file");
   return res.json();
 }
@@ -1424,7 +1172,7 @@ async function fetchPjsFile() {
 async function savePjsFile(content) {
   const res = await fetch("/api/pjs/save", {
     method: "POST",
-    headers: { "Content-Type": "application/json" },
+    headers: { "Content-Type": "application/json", "X-Client-Id": CLIENT_ID },
     body: JSON.stringify({ content }),
   });
   if (!res.ok) {
@@ -1434,40 +1182,42 @@ async function savePjsFile(content) {
 }
 
 async function fetchTeamMembersFile() {
-  const res = await fetch("/api/team-members");
+  const res = await fetch("/api/team-members?summary=1", { cache: "no-cache" });
   if (!res.ok) throw new Error("Failed to load Team files");
   return res.json();
 }
 
 async function fetchTeamMetricsFile() {
-  const res = await fetch("/api/team-metrics");
+  const res = await fetch("/api/team-metrics", { cache: "no-cache" });
   if (!res.ok) throw new Error("Failed to load Team metrics file");
   return res.json();
 }
 
 async function fetchTeamMemberFile(path) {
   const url = `/api/team-member/file?path=${encodeURIComponent(path)}`;
-  const res = await fetch(url);
+  const res = await fetch(url, { cache: "no-cache" });
   if (!res.ok) throw new Error("Failed to load Team member file");
   return res.json();
 }
 
-async function saveTeamMemberFile(path, content) {
+async function saveTeamMemberFile(path, content, previous = null) {
+  if (previous?.revision && previous.content === content) return { path, revision: previous.revision };
   const res = await fetch("/api/team-member/file/save", {
     method: "POST",
-    headers: { "Content-Type": "application/json" },
-    body: JSON.stringify({ path, content }),
+    headers: { "Content-Type": "application/json", "X-Client-Id": CLIENT_ID },
+    body: JSON.stringify(textSaveBody(path, content, previous)),
   });
   if (!res.ok) {
     const txt = await res.text();
     throw new Error(txt || "Failed to save Team member file");
   }
+  return res.json();
 }
 
 async function createTeamMemberFile(path, content) {
   const res = await fetch("/api/team-member/file/create", {
     method: "POST",
-    headers: { "Content-Type": "application/json" },
+    headers: { "Content-Type": "application/json", "X-Client-Id": CLIENT_ID },
     body: JSON.stringify({ path, content }),
   });
   if (!res.ok) {
@@ -1479,7 +1229,7 @@ async function createTeamMemberFile(path, content) {
 async function deleteTeamMemberFile(path) {
   const res = await fetch("/api/team-member/file/delete", {
     method: "POST",
-    headers: { "Content-Type": "application/json" },
+    headers: { "Content-Type": "application/json", "X-Client-Id": CLIENT_ID },
     body: JSON.stringify({ path }),
   });
   if (!res.ok) {
@@ -1741,10 +1491,9 @@ async function loadTeamMembersFromFiles() {
     path: String(m.path || "").trim(),
     name: String(m.name || "").trim(),
     nickname: String(m.nickname || "").trim(),
-    content: String(m.content || ""),
-    active: parseTeamActiveFromContent(m.content || ""),
-    area: parseTeamAreaFromContent(m.content || ""),
-    average: parseTeamAverageScore(m.content || ""),
+    active: Boolean(m.active),
+    area: normalizeTeamArea(m.area),
+    average: Number.isFinite(m.averageScore) ? m.averageScore : null,
   }));
   const fromFiles = Array.from(
     new Set(teamEntries.filter((x) => x.active).map((x) => x.nickname).filter(Boolean))
@@ -1812,6 +1561,8 @@ async function openTeamMember(path) {
   currentTeamFile = payload.path;
   el.teamCurrentFile.textContent = `tech/team/${payload.path}`;
   el.teamEditor.value = payload.content || "";
+  currentTeamFileContent = el.teamEditor.value;
+  currentTeamFileRevision = payload.revision || "";
   const metricsMode = isTeamMetricsFile(currentTeamFile);
   el.teamEditor.readOnly = metricsMode;
   el.teamSaveBtn.disabled = metricsMode;
@@ -1860,7 +1611,10 @@ async function inactivateCurrentTeamMember() {
   const confirmed = window.confirm(`Inativar membro "tech/team/${currentTeamFile}" (Ativo: Não)?`);
   if (!confirmed) return;
   const updatedContent = setTeamActiveLine(el.teamEditor.value, "Não");
-  await saveTeamMemberFile(currentTeamFile, updatedContent);
+  await saveTeamMemberFile(currentTeamFile, updatedContent, {
+    content: currentTeamFileContent,
+    revision: currentTeamFileRevision,
+  });
   await refreshTeamModalData(currentTeamFile);
   setStatus(`file-based (\`tech/team/*.md\`) - member inactivated`);
 }
@@ -1868,7 +1622,10 @@ async function inactivateCurrentTeamMember() {
 async function saveCurrentTeamMember() {
   if (!currentTeamFile) return;
   if (isTeamMetricsFile(currentTeamFile)) return;
-  await saveTeamMemberFile(currentTeamFile, el.teamEditor.value);
+  await saveTeamMemberFile(currentTeamFile, el.teamEditor.value, {
+    content: currentTeamFileContent,
+    revision: currentTeamFileRevision,
+  });
   await refreshTeamModalData(currentTeamFile);
   setStatus("file-based (`tech/team/*.md`) - member saved");
 }
@@ -1965,32 +1722,458 @@ async function runCreateMeetingFlow() {
   setStatus("file-based (`tech/sprints/*.md`) - meeting file created");
 }
 
+function splitSprintMarkdown(markdown) {
+  const head = [];
+  const blocks = [];
+  String(markdown || "")
+    .split("\n")
+    .forEach((line) => {
+      if (line.startsWith("## ")) blocks.push([line]);
+      else if (blocks.length) blocks[blocks.length - 1].push(line);
+      else head.push(line);
+    });
+  return { head: head.join("\n"), blocks: blocks.map((block) => block.join("\n").trim()) };
+}
+
+function sameBlocksWithout(shorter, longer, index) {
+  return shorter.every((block, i) => block === longer[i < index ? i : i + 1]);
+}
+
+function firstBlockDifference(left, right) {
+  let index = 0;
+  while (index < left.length && index < right.length && left[index] === right[index]) index += 1;
+  return index;
+}
+
+function planSprintEdits(name, previous, next) {
+  if (typeof previous !== "string") return null;
+  const before = splitSprintMarkdown(previous);
+  const after = splitSprintMarkdown(next);
+  if (before.head !== after.head) return null;
+
+  if (after.blocks.length === before.blocks.length + 1) {
+    const index = firstBlockDifference(before.blocks, after.blocks);
+    if (!sameBlocksWithout(before.blocks, after.blocks, index)) return null;
+    return [{ op: "topic/add", sprint: name, index, topics: before.blocks.length, markdown: after.blocks[index] }];
+  }
+  if (after.blocks.length === before.blocks.length - 1) {
+    const index = firstBlockDifference(before.blocks, after.blocks);
+    if (!sameBlocksWithout(after.blocks, before.blocks, index)) return null;
+    const block = before.blocks[index];
+    return [{ op: "topic/remove", sprint: name, topic: index, expect: block.split("\n")[0], block }];
+  }
+  if (after.blocks.length !== before.blocks.length) return null;
+
+  const edits = [];
+  for (let topicIndex = 0; topicIndex < before.blocks.length; topicIndex += 1) {
+    if (before.blocks[topicIndex] === after.blocks[topicIndex]) continue;
+    const oldLines = before.blocks[topicIndex].split("\n");
+    const newLines = after.blocks[topicIndex].split("\n");
+    if (oldLines.length !== newLines.length || oldLines[0] !== newLines[0]) return null;
+    let itemIndex = -1;
+    for (let i = 1; i < oldLines.length; i += 1) {
+      const isItem = oldLines[i].startsWith("- [");
+      if (isItem) itemIndex += 1;
+      if (oldLines[i] === newLines[i]) continue;
+      if (!isItem || !newLines[i].startsWith("- [") || /\(no items\)$/.test(oldLines[i]) || /\(no items\)$/.test(newLines[i])) {
+        return null;
+      }
+      const base = { sprint: name, topic: topicIndex, item: itemIndex, expect: oldLines[i] };
+      if (oldLines[i].slice(5) === newLines[i].slice(5)) {
+        edits.push({ op: "item/toggle", ...base, done: newLines[i].startsWith("- [x]") });
+      } else {
+        edits.push({ op: "item/save", ...base, line: newLines[i] });
+      }
+    }
+  }
+  return edits.length <= SPRINT_EDIT_MAX_OPS ? edits : null;
+}
+
+function pairTopicMoves(edits) {
+  const removals = edits.filter((edit) => edit.op === "topic/remove");
+  removals.forEach((removal) => {
+    const addition = edits.find((edit) => edit.op === "topic/add" && edit.sprint !== removal.sprint && edit.markdown === removal.block);
+    if (!addition) return;
+    edits.splice(edits.indexOf(addition), 1);
+    edits.splice(edits.indexOf(removal), 1, {
+      op: "topic/move",
+      from: removal.sprint,
+      to: addition.sprint,
+      topic: removal.topic,
+      expect: removal.expect,
+      index: addition.index,
+      targetTopics: addition.topics,
+    });
+  });
+  return edits;
+}
+
+function sprintEditNames(edit) {
+  return [edit.sprint, edit.from, edit.to].filter(Boolean);
+}
+
+async function postSprintEdits(edits) {
+  const ops = edits.map(({ block, ...edit }) => edit);
+  const res = await fetch("/api/sprints/edits", {
+    method: "POST",
+    headers: { "Content-Type": "application/json", "X-Client-Id": CLIENT_ID },
+    body: JSON.stringify({ ops }),
+  });
+  if (res.status === 409) {
+    const body = await res.json().catch(() => ({}));
+    const names = body.sprints?.length ? body.sprints : edits.flatMap(sprintEditNames);
+    return { conflicts: [...new Set(names)], error: body.error || "Sprint changed on disk" };
+  }
+  if (!res.ok) return null;
+  rememberSprintRevisions((await res.json()).revisions);
+  return { conflicts: [] };
+}
+
+function rememberSprintRevisions(revisions) {
+  Object.entries(revisions || {}).forEach(([name, revision]) => {
+    const sprint = state.sprints.find((s) => s.name === name);
+    if (sprint) sprint.revision = revision;
+  });
+}
+
+async function applySprintEdits(files) {
+  const planned = new Set();
+  let edits = [];
+  files.forEach((file) => {
+    const fileEdits = planSprintEdits(file.name, lastSavedSprintMarkdown[file.name], file.content);
+    if (!fileEdits) return;
+    planned.add(file.name);
+    edits.push(...fileEdits);
+  });
+  edits = pairTopicMoves(edits);
+  const conflicts = new Set();
+  let error = "";
+  let result = { conflicts: [] };
+  while (edits.length) {
+    result = await postSprintEdits(edits);
+    if (!result?.conflicts.length) break;
+    result.conflicts.forEach((name) => conflicts.add(name));
+    error = result.error;
+    edits = edits.filter((edit) => !sprintEditNames(edit).some((name) => conflicts.has(name)));
+    result = { conflicts: [] };
+  }
+  if (conflicts.size) {
+    await Promise.all([...conflicts].map((name) => reloadSprintFromServer(name).catch((err) => console.error("Failed to reload sprint:", err))));
+    render();
+    window.alert(`${error}. Reloaded ${[...conflicts].join(", ")} from disk; your unsaved edits there were discarded.`);
+  }
+  return files.filter((file) => {
+    if (conflicts.has(file.name)) return false;
+    if (!result || !planned.has(file.name)) return true;
+    lastSavedSprintMarkdown[file.name] = file.content;
+    return false;
+  });
+}
+
+function planBacklogOps(previous, next) {
+  const before = new Map(previous.map((item) => [item.id, item]));
+  const after = new Map(next.map((item) => [item.id, item]));
+  const ops = [];
+  previous.forEach((item) => {
+    if (after.has(item.id)) return;
+    const sprint = state.sprints.find((s) => s.topics.some((topic) => topic.items.some((entry) => entry.id === item.id)));
+    ops.push(sprint ? { op: "move", id: item.id, sprint: sprint.name } : { op: "delete", id: item.id });
+  });
+  next.forEach((item, index) => {
+    const old = before.get(item.id);
+    if (!old) ops.push({ op: "add", id: item.id, index, item });
+    else if (JSON.stringify(old) !== JSON.stringify(item)) ops.push({ op: "update", id: item.id, item });
+  });
+  const kept = previous.filter((item) => after.has(item.id)).map((item) => item.id);
+  const order = next.filter((item) => before.has(item.id)).map((item) => item.id);
+  if (kept.join("\n") !== order.join("\n")) ops.push({ op: "order", ids: next.map((item) => item.id) });
+  return ops;
+}
+
+async function applyBacklogOps(backlog) {
+  if (!lastSavedBacklogJson) return false;
+  const ops = planBacklogOps(JSON.parse(lastSavedBacklogJson), backlog);
+  if (!ops.length) return true;
+  try {
+    const res = await fetch("/api/backlog/ops", {
+      method: "POST",
+      headers: { "Content-Type": "application/json", "X-Client-Id": CLIENT_ID },
+      body: JSON.stringify({ ops }),
+    });
+    return res.ok;
+  } catch {
+    return false;
+  }
+}
+
+function applyBacklogOp(items, op) {
+  if (op.op === "replace") {
+    items.splice(0, items.length, ...(op.items || []).filter((item) => item && typeof item === "object"));
+    return;
+  }
+  if (op.op === "order") {
+    const ids = (op.ids || []).map((id) => String(id));
+    const rank = new Map(ids.map((id, index) => [id, index]));
+    const position = (item) => rank.get(String(item.id || "")) ?? ids.length;
+    items.sort((a, b) => position(a) - position(b));
+    return;
+  }
+  const id = String(op.id || op.item?.id || "");
+  const index = items.findIndex((item) => String(item.id || "") === id);
+  if (op.op === "add" || op.op === "update") {
+    const item = { ...op.item, id };
+    if (index >= 0) items[index] = item;
+    else if (op.op === "add" && Number.isInteger(op.index)) items.splice(Math.max(0, Math.min(op.index, items.length)), 0, item);
+    else items.push(item);
+  } else if (index >= 0) {
+    items.splice(index, 1);
+  }
+}
+
+function reportBacklogError(error) {
+  if ((error || "") === reportedBacklogError) return;
+  reportedBacklogError = error || "";
+  if (error) window.alert(`Backlog changes are not saved until tech/backlog.json is repaired: ${error}`);
+}
+
+function rememberSavedBacklog(revision) {
+  lastSavedBacklogJson = JSON.stringify((state.backlog || []).map((item) => ({ ...normalizeBacklogItem(item) })));
+  backlogRevision = revision || "";
+}
+
+async function reloadBacklogFromServer() {
+  const res = await fetch("/api/backlog", { cache: "no-cache" });
+  if (!res.ok) throw new Error("Failed to load backlog");
+  const payload = await res.json();
+  state.backlog = (payload.backlog || []).map((item) => normalizeBacklogItem(item));
+  rememberSavedBacklog(payload.revision);
+  reportBacklogError(payload.error);
+}
+
+async function applyBacklogChange(change) {
+  if ("error" in change) reportBacklogError(change.error);
+  if (change.origin === CLIENT_ID && change.previous === backlogRevision) {
+    backlogRevision = change.revision;
+    return;
+  }
+  const current = JSON.stringify((state.backlog || []).map((item) => ({ ...normalizeBacklogItem(item) })));
+  if (current !== lastSavedBacklogJson) return;
+  if (change.origin === CLIENT_ID || !change.ops || change.previous !== backlogRevision) {
+    await reloadBacklogFromServer();
+    return;
+  }
+  const items = (state.backlog || []).slice();
+  change.ops.forEach((op) => applyBacklogOp(items, op));
+  state.backlog = items.map((item) => normalizeBacklogItem(item));
+  rememberSavedBacklog(change.revision);
+}
+
+async function postWhenReady(url, body, attempts = 4) {
+  for (let attempt = 1; ; attempt += 1) {
+    const res = await fetch(url, {
+      method: "POST",
+      headers: { "Content-Type": "application/json", "X-Client-Id": CLIENT_ID },
+      body,
+    });
+    if (res.status !== 503 || attempt >= attempts) return res;
+    const wait = Number(res.headers.get("Retry-After")) || 1;
+    await new Promise((resolve) => setTimeout(resolve, wait * 1000 * attempt));
+  }
+}
+
 async function saveAllToFiles() {
   if (dataMode !== "files") {
     window.alert("File mode is not active. Start with server.py.");
     return;
   }
 
-  const payload = {
-    files: state.sprints.map((sprint) => ({
+  const changedFiles = state.sprints
+    .map((sprint) => ({
       name: sprint.name,
       content: sprintToMarkdown(sprint),
-    })),
-    backlog: (state.backlog || []).map((item) => ({
-      ...normalizeBacklogItem(item),
-    })),
-  };
+    }))
+    .filter((file) => lastSavedSprintMarkdown[file.name] !== file.content);
+  const files = await applySprintEdits(changedFiles);
+  const backlog = (state.backlog || []).map((item) => ({
+    ...normalizeBacklogItem(item),
+  }));
+  const backlogJson = JSON.stringify(backlog);
+  const payload = { files };
+  if (backlogJson !== lastSavedBacklogJson) {
+    if (await applyBacklogOps(backlog)) lastSavedBacklogJson = backlogJson;
+    else payload.backlog = backlog;
+  }
+  if (!files.length && !payload.backlog) return;
 
-  const res = await fetch("/api/sprint-files/save-all", {
-    method: "POST",
-    headers: { "Content-Type": "application/json" },
-    body: JSON.stringify(payload),
-  });
+  const res = await postWhenReady("/api/sprint-files/save-all", JSON.stringify(payload));
 
   if (!res.ok) {
     const msg = await res.text();
     throw new Error(msg || "Save failed");
   }
+  rememberSprintRevisions((await res.json()).revisions);
+  files.forEach((file) => {
+    lastSavedSprintMarkdown[file.name] = file.content;
+  });
+  if (payload.backlog) lastSavedBacklogJson = backlogJson;
+}
+
+async function loadOlderSprints(all = false) {
+  if (dataMode !== "files" || !olderSprintsCursor || olderSprintsLoading) return;
+  olderSprintsLoading = true;
+  try {
+    const payload = await fetchSprints(all ? { cursor: olderSprintsCursor } : { cursor: olderSprintsCursor, latest: SPRINT_PAGE_SIZE });
+    const known = new Set(state.sprints.map((sprint) => sprint.name));
+    const older = payload.sprints.map((model) => hydrateSprintModel(model)).filter((sprint) => !known.has(sprint.name));
+    older.forEach((sprint) => {
+      sprint.topics = sprint.topics.map((topic) => normalizeTopic(topic));
+      lastSavedSprintMarkdown[sprint.name] = sprintToMarkdown(sprint);
+    });
+    state.sprints = [...older, ...state.sprints];
+    olderSprintsCursor = payload.range?.nextCursor || "";
+  } catch (err) {
+    console.error("Failed to load older sprints:", err);
+    olderSprintsCursor = "";
+  } finally {
+    olderSprintsLoading = false;
+  }
+  render();
+}
+
+function sprintHistoryNeeded() {
+  return boardView === "projects" || Boolean(normalizeSearchText(taskSearchText));
+}
+
+function sprintHistoryPending() {
+  return dataMode === "files" && Boolean(olderSprintsCursor) && sprintHistoryNeeded();
+}
+
+function maybeLoadOlderSprints() {
+  if (!olderSprintsCursor || olderSprintsLoading) return;
+  if (sprintHistoryNeeded()) {
+    loadOlderSprints(true);
+    return;
+  }
+  const oldestId = state.sprints[0]?.id || "";
+  if (state.activeSprintId === oldestId || deliveryStartSprintId === oldestId) {
+    loadOlderSprints();
+  }
+}
+
+function renderSprintHistoryLoading() {
+  el.boardMeta.textContent = "Loading sprint history...";
+  el.topicsGrid.innerHTML = "";
+  const msg = document.createElement("p");
+  msg.className = "muted";
+  msg.textContent = "Loading older sprints...";
+  el.topicsGrid.appendChild(msg);
+}
+
+function hydrateSprintTopic(topic) {
+  return normalizeTopic({ id: uid(), ...topic, items: (topic.items || []).map((item) => ({ id: uid(), ...item })) });
+}
+
+async function reloadSprintFromServer(name) {
+  const payload = await fetchSprints({ from: name, to: name });
+  const model = (payload.sprints || []).find((item) => item.name === name);
+  if (!model) return;
+  const fresh = hydrateSprintModel(model);
+  fresh.topics = fresh.topics.map((topic) => normalizeTopic(topic));
+  const sprint = state.sprints.find((item) => item.name === name);
+  if (sprint) {
+    sprint.goal = fresh.goal;
+    sprint.topics = fresh.topics;
+    sprint.revision = fresh.revision;
+  } else {
+    state.sprints.push(fresh);
+  }
+  lastSavedSprintMarkdown[name] = sprintToMarkdown(sprint || fresh);
+}
+
+async function applySprintChange(change) {
+  const sprint = state.sprints.find((item) => item.name === change.name);
+  if (sprint && sprint.revision === change.revision) return;
+  if (sprint && lastSavedSprintMarkdown[sprint.name] !== sprintToMarkdown(sprint)) return;
+  if (change.deleted) {
+    if (!sprint) return;
+    state.sprints = state.sprints.filter((item) => item !== sprint);
+    delete lastSavedSprintMarkdown[sprint.name];
+    if (state.activeSprintId === sprint.id) state.activeSprintId = state.sprints[state.sprints.length - 1]?.id || null;
+    return;
+  }
+  if (!sprint || sprint.revision !== change.previous) {
+    if (sprint || !change.previous) await reloadSprintFromServer(change.name);
+    return;
+  }
+  sprint.goal = change.goal;
+  (change.diff || [])
+    .slice()
+    .reverse()
+    .forEach((op) => {
+      sprint.topics.splice(op.from[0], op.from[1] - op.from[0], ...op.topics.map((topic) => hydrateSprintTopic(topic)));
+    });
+  sprint.revision = change.revision;
+  lastSavedSprintMarkdown[sprint.name] = sprintToMarkdown(sprint);
+}
+
+async function applyProjectChange(change) {
+  const rel = change.path.replace(/^projects\//, "");
+  const projectKey = rel.slice(0, Math.max(0, rel.lastIndexOf("/")));
+  if (projectCatalog.includes(projectKey)) {
+    if (/(^|\/)(project\.json)$/.test(rel)) await refreshProjectSupportCatalogs(["control"], [projectKey]);
+    if (/(^|\/)(features\.md)$/.test(rel)) await refreshProjectSupportCatalogs(["features"], [projectKey]);
+  }
+  if (el.projectsModal.classList.contains("hidden")) return;
+  if (change.deleted || !change.previous) {
+    const payload = await fetchProjectsTree();
+    projectsTreeDirs = payload.dirs || [];
+    projectsTreeFiles = payload.files || [];
+    renderProjectsTree();
+  }
+  if (rel === currentProjectFile && !change.deleted && el.projectsEditor.value === currentProjectFileContent) {
+    await openProjectFile(rel);
+  }
+}
+
+async function handleChangeEvent(change) {
+  if (change.kind === "sprint") {
+    if (change.origin === CLIENT_ID) return;
+    await applySprintChange(change);
+  } else if (change.kind === "backlog") {
+    await applyBacklogChange(change);
+  } else if (change.kind === "project") {
+    await applyProjectChange(change);
+  } else if (change.kind === "team") {
+    await loadTeamMembersFromFiles();
+  } else {
+    return;
+  }
+  render();
+}
+
+function connectChangeFeed() {
+  if (dataMode !== "files" || changeFeed || typeof EventSource === "undefined") return;
+  let queue = Promise.resolve();
+  changeFeed = new EventSource("/api/events");
+  changeFeed.addEventListener("change", (event) => {
+    const change = JSON.parse(event.data);
+    queue = queue.then(() => handleChangeEvent(change)).catch((err) => console.error("Failed to apply change:", err));
+  });
+  changeFeed.addEventListener("reset", () => {
+    queue = queue.then(async () => {
+      await Promise.all(state.sprints.map((sprint) => applySprintChange({ name: sprint.name, revision: "", previous: null })));
+      await applyBacklogChange({ kind: "backlog", previous: null });
+      render();
+    });
+  });
+}
+
+function rememberSavedState() {
+  lastSavedSprintMarkdown = {};
+  state.sprints.forEach((sprint) => {
+    lastSavedSprintMarkdown[sprint.name] = sprintToMarkdown(sprint);
+  });
+  rememberSavedBacklog(backlogRevision);
 }
 
 async function copyTextToClipboard(text) {
@@ -2311,9 +2494,9 @@ async function openTimelineModal(projectKey) {
     window.alert("Select a project folder first.");
     return;
   }
-  const payload = await fetchProjectTimeline(normalized);
+  const bundle = await loadProjectBundle(normalized);
   currentTimelineProjectKey = normalized;
-  currentTimelineEntries = parseTimelineMarkdown(payload.content);
+  currentTimelineEntries = bundle.timeline.map((entry) => normalizeTimelineEntry(entry)).sort(compareTimelineEntries);
   el.timelineTitle.textContent = `Timeline - ${normalized}`;
   el.timelineSubtitle.textContent = `Review and add important events for ${normalized}.`;
   el.timelineEventNameInput.value = "";
@@ -2364,18 +2547,10 @@ async function openFeaturesModal(projectKey) {
     window.alert("Select a project folder first.");
     return;
   }
-  const relPath = `${normalized}/features.md`;
-  let payload;
-  try {
-    payload = await fetchProjectFile(relPath);
-  } catch {
-    const content = formatFeaturesMarkdown(normalized);
-    await saveProjectFile(relPath, content);
-    await refreshProjectsModalData();
-    payload = await fetchProjectFile(relPath);
-  }
+  const bundle = await loadProjectBundle(normalized);
+  if (bundle.created) await refreshProjectsModalData();
   currentFeaturesProjectKey = normalized;
-  currentFeaturesEntries = parseFeaturesMarkdown(payload.content || "");
+  currentFeaturesEntries = bundle.features.map((entry) => ({ id: uid(), ...entry }));
   projectFeaturesCatalog[normalized] = [...currentFeaturesEntries];
   el.featuresTitle.textContent = `Features - ${normalized}`;
   el.featuresSubtitle.textContent = "Review project features and descriptions.";
@@ -2607,10 +2782,62 @@ function renderProjectTreeNode(node) {
 
 function renderProjectsTree() {
   el.projectsTree.innerHTML = "";
+  if (projectsSearchResults) {
+    renderProjectsSearchResults();
+    return;
+  }
   const tree = buildTreeFromPaths(projectsTreeDirs, projectsTreeFiles);
   el.projectsTree.appendChild(renderProjectTreeNode(tree));
 }
 
+function renderProjectsSearchResults() {
+  const ul = document.createElement("ul");
+  if (!projectsSearchResults.results.length) {
+    const empty = document.createElement("li");
+    empty.className = "projects-tree-node muted";
+    empty.textContent = "No matches";
+    ul.appendChild(empty);
+  }
+  projectsSearchResults.results.forEach((result) => {
+    const li = document.createElement("li");
+    li.className = "projects-tree-node";
+    const file = document.createElement("div");
+    file.className = `projects-tree-file projects-search-result ${currentProjectFile === result.path ? "active" : ""}`;
+    file.textContent = result.path;
+    const snippet = document.createElement("small");
+    snippet.className = "muted";
+    snippet.textContent = result.snippet;
+    file.appendChild(snippet);
+    file.addEventListener("click", () => openProjectFile(result.path));
+    li.appendChild(file);
+    ul.appendChild(li);
+  });
+  el.projectsTree.appendChild(ul);
+}
+
+function scheduleProjectsSearch() {
+  if (projectsSearchTimer) clearTimeout(projectsSearchTimer);
+  projectsSearchTimer = setTimeout(async () => {
+    projectsSearchTimer = null;
+    const query = String(el.projectsSearchInput?.value || "").trim();
+    if (!query) {
+      projectsSearchResults = null;
+      renderProjectsTree();
+      return;
+    }
+    let results;
+    try {
+      results = await searchNotes(query, "projects");
+    } catch (err) {
+      console.error("Search failed:", err);
+      results = { results: [] };
+    }
+    if (String(el.projectsSearchInput?.value || "").trim() !== query) return;
+    projectsSearchResults = results;
+    renderProjectsTree();
+  }, 180);
+}
+
 async function openProjectFile(relPath) {
   const payload = await fetchProjectFile(relPath);
   currentProjectFile = payload.path;
@@ -2618,6 +2845,8 @@ async function openProjectFile(relPath) {
   currentProjectDir = idx >= 0 ? currentProjectFile.slice(0, idx) : "";
   el.projectsCurrentFile.textContent = `projects/${payload.path}`;
   el.projectsEditor.value = payload.content || "";
+  currentProjectFileContent = el.projectsEditor.value;
+  currentProjectFileRevision = payload.revision || "";
   renderProjectsTree();
 }
 
@@ -2633,8 +2862,7 @@ async function refreshProjectsModalData() {
   projectsTreeDirs = payload.dirs || [];
   projectsTreeFiles = payload.files || [];
   updateProjectCatalogFromTree(projectsTreeDirs, projectsTreeFiles);
-  await refreshProjectControls();
-  await refreshProjectFeaturesCatalog();
+  await refreshProjectSupportCatalogs();
   if (currentProjectFile && !projectsTreeFiles.includes(currentProjectFile)) {
     currentProjectFile = "";
   }
@@ -4275,11 +4503,63 @@ function moveDraggedTaskToTaskboardColumn(columnId) {
   return true;
 }
 
+function deliveryRollupText() {
+  const totals = selectedProjectKey ? deliveryRollup.projects[selectedProjectKey] : deliveryRollup.totals;
+  if (!totals) return "";
+  return ` ${totals.items} tasks, ${totals.done} done, ${totals.blocked} blocked, ${totals.carriedOver} carried over.`;
+}
+
+function deliveryPeriodCounts(sprint) {
+  const entry = deliveryRollup.sprints[sprint.name];
+  if (!entry) return null;
+  return selectedProjectKey ? entry.projects?.[selectedProjectKey] || null : entry;
+}
+
+function appendDeliveryPeriodRollup(cell, sprint) {
+  const counts = deliveryPeriodCounts(sprint);
+  if (!counts?.items) return;
+  const summary = document.createElement("span");
+  summary.className = "delivery-period-count";
+  summary.textContent = [
+    `${counts.done}/${counts.items} done`,
+    counts.blocked ? `${counts.blocked} blocked` : "",
+    counts.carriedOver ? `${counts.carriedOver} carried` : "",
+  ].filter(Boolean).join(" | ");
+  const bar = document.createElement("div");
+  bar.className = "delivery-period-rollup";
+  bar.innerHTML = "<i></i>";
+  bar.querySelector("i").style.width = `${Math.round((counts.done / counts.items) * 100)}%`;
+  cell.append(summary, bar);
+}
+
+async function refreshDeliveryRollup() {
+  const range = getDeliverySprintRange([...state.sprints]);
+  if (dataMode !== "files" || !range.length) return;
+  const params = new URLSearchParams({ from: range[0].name, to: range[range.length - 1].name, perSprint: "1" });
+  const key = [params.toString(), ...range.map((sprint) => sprint.revision || "")].join("\n");
+  if (key === deliveryRollupKey) return;
+  deliveryRollupKey = key;
+  try {
+    const res = await fetch(`/api/rollups?${params}`, { cache: "no-cache" });
+    if (!res.ok || key !== deliveryRollupKey) return;
+    const payload = await res.json();
+    deliveryRollup = {
+      totals: payload.totals,
+      projects: payload.projects || {},
+      sprints: Object.fromEntries((payload.sprints || []).map((entry) => [entry.name, entry])),
+    };
+    if (taskLayoutView === "delivery") render();
+  } catch (err) {
+    console.error("Failed to load rollups:", err);
+  }
+}
+
 function renderDeliveryView() {
   el.boardTitle.textContent = "Delivery";
-  el.boardMeta.textContent = selectedProjectKey
+  el.boardMeta.textContent = (selectedProjectKey
     ? `Delivery plan for ${selectedProjectKey} across sprints.`
-    : "Delivery plan across sprints and projects.";
+    : "Delivery plan across sprints and projects.") + deliveryRollupText();
+  refreshDeliveryRollup();
   el.topicsGrid.innerHTML = "";
   el.topicsGrid.classList.remove("taskboard-grid", "project-taskboard-grid", "workload-grid");
   el.topicsGrid.classList.add("delivery-grid");
@@ -4363,6 +4643,7 @@ function renderDeliveryView() {
       `;
       cell.querySelector("strong").textContent = sprint.name;
       cell.querySelector("span").textContent = sprint.goal || "No sprint goal";
+      appendDeliveryPeriodRollup(cell, sprint);
       detailHead.appendChild(cell);
     });
 
@@ -4517,6 +4798,7 @@ function renderDeliveryView() {
     `;
     cell.querySelector("strong").textContent = sprint.name;
     cell.querySelector("span").textContent = sprint.goal || "No sprint goal";
+    appendDeliveryPeriodRollup(cell, sprint);
     head.appendChild(cell);
   });
 
@@ -5239,7 +5521,8 @@ function render() {
   renderWorkloadDateRangeInputs();
   renderBoardProjectSelect();
   renderBacklogProjectFilter();
-  if (taskLayoutView === "taskboard") renderTaskboard();
+  if (sprintHistoryPending()) renderSprintHistoryLoading();
+  else if (taskLayoutView === "taskboard") renderTaskboard();
   else if (taskLayoutView === "members" && boardView !== "projects") renderSprintMembers();
   else if (taskLayoutView === "delivery") renderDeliveryView();
   else if (taskLayoutView === "workload") renderWorkloadView();
@@ -5280,6 +5563,7 @@ function render() {
     el.editSprintBtn.title = "";
   }
   updateFocusModeButton();
+  maybeLoadOlderSprints();
 }
 
 function createSprint() {
@@ -5360,8 +5644,9 @@ function addTopic(e) {
 
 async function loadFromFiles() {
   try {
-    const payload = await fetchSprintFiles();
-    const parsed = payload.files.map((f) => parseSprintMarkdown(f.name, f.content));
+    const payload = await fetchSprints({ latest: SPRINT_PAGE_SIZE });
+    const parsed = payload.sprints.map((model) => hydrateSprintModel(model));
+    olderSprintsCursor = payload.range?.nextCursor || "";
     state = {
       activeSprintId: parsed[parsed.length - 1]?.id || null,
       sprints: parsed,
@@ -5375,8 +5660,12 @@ async function loadFromFiles() {
     }
     normalizeAllTopics();
     normalizeAllBacklog();
+    backlogRevision = payload.backlogRevision || "";
+    reportBacklogError(payload.backlogError);
+    rememberSavedState();
     dataMode = "files";
     setStatus("file-based (`tech/sprints/*.md`)");
+    connectChangeFeed();
   } catch (err) {
     state = loadStateLocal();
     normalizeAllTopics();
@@ -5757,7 +6046,13 @@ el.projectsCloseBtn.addEventListener("click", closeProjectsModal);
 el.projectsSaveBtn.addEventListener("click", async () => {
   if (!currentProjectFile) return;
   try {
-    await saveProjectFile(currentProjectFile, el.projectsEditor.value);
+    const content = el.projectsEditor.value;
+    const saved = await saveProjectFile(currentProjectFile, content, {
+      content: currentProjectFileContent,
+      revision: currentProjectFileRevision,
+    });
+    currentProjectFileContent = content;
+    currentProjectFileRevision = saved.revision || "";
     setStatus("file-based (`tech/sprints/*.md`) - project file saved");
   } catch (err) {
     window.alert(`Failed to save file: ${err.message}`);
@@ -5779,6 +6074,7 @@ el.projectsDeleteBtn.addEventListener("click", async () => {
 el.projectsNewBtn.addEventListener("click", () => {
   openCreateTypeModal();
 });
+el.projectsSearchInput?.addEventListener("input", scheduleProjectsSearch);
 el.createFolderChoiceBtn.addEventListener("click", async () => {
   try {
     await runCreateFolderFlow();
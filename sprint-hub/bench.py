@@ -0,0 +1,315 @@
+import argparse
+import importlib
+import io
+import json
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import urllib.request
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+BASELINE_FILE = BASE_DIR / ".cache" / "bench-baseline.json"
+SIZES = {
+  "small": {"sprints": 20, "topics": 4, "items": 6, "projects": 10, "members": 8, "notes": 2, "note_kb": 2},
+  "medium": {"sprints": 80, "topics": 5, "items": 7, "projects": 40, "members": 14, "notes": 3, "note_kb": 4},
+  "large": {"sprints": 200, "topics": 6, "items": 8, "projects": 100, "members": 20, "notes": 4, "note_kb": 8},
+}
+FIRST_NAMES = ["Ana", "Bruno", "Carla", "Diego", "Elisa", "Felipe", "Gui", "Hary", "Iris", "Joao", "Lia", "Nu", "Otavio", "Paula", "Rafa", "Vicco"]
+WORDS = "ajustar fluxo tela api deploy filtro relatorio login boleto voucher pedido sync dashboard query notificacao roteiro modelo teste".split()
+STATUSES = ["Planejamento", "Desenvolvimento", "Teste", "Acompanhamento", "Bloqueado", "Finalizado"]
+ITEM_STATUSES = ["", "", "Doing", "Testing"]
+AREAS = ["Back", "Front", "Mobile", "Data", "QA", "UX/UI"]
+SPRINTS_PER_YEAR = 26
+
+
+def sprint_names(count: int):
+  names = []
+  year, number = 26, 2
+  while len(names) < count:
+    names.append(f"{year:02d}-{number:02d}")
+    number += 1
+    if number > SPRINTS_PER_YEAR:
+      year, number = year + 1, 1
+  return names
+
+
+def sentence(rng: random.Random, words: int) -> str:
+  return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def item_line(rng: random.Random, members: list, features: list) -> str:
+  names = " + ".join(rng.sample(members, rng.randint(1, 3)))
+  parts = [f"- [{'x' if rng.random() < 0.4 else ' '}] {sentence(rng, rng.randint(2, 6))} ({names})"]
+  if features and rng.random() < 0.4:
+    parts.append(f"[FEATURE: {rng.choice(features)}]")
+  status = rng.choice(ITEM_STATUSES)
+  if status:
+    parts.append(f"[STATUS: {status}]")
+  if rng.random() < 0.6:
+    parts.append(f"[AREA: {', '.join(rng.sample(AREAS, rng.randint(1, 2)))}]")
+  if rng.random() < 0.1:
+    parts.append("[HIGH]")
+  if rng.random() < 0.1:
+    parts.append("[BLOCKED]")
+  if rng.random() < 0.05:
+    parts.append("[FOLLOWED]")
+  return " ".join(parts)
+
+
+def generate_corpus(root: Path, sprints: int, topics: int, items: int, projects: int, members: int = 12, notes: int = 2, note_kb: int = 2, seed: int = 7):
+  rng = random.Random(seed)
+  tech = root / "tech"
+  for folder in (tech / "sprints", tech / "team", root / "projects"):
+    folder.mkdir(parents=True, exist_ok=True)
+
+  people = [f"{FIRST_NAMES[index % len(FIRST_NAMES)]} {index // len(FIRST_NAMES) + 1}" for index in range(members)]
+  nicknames = [name.replace(" ", "") for name in people]
+  for name, nickname in zip(people, nicknames):
+    scores = "\n".join(f"{label}: {rng.randint(2, 5)}" for label in ("Qualidade de Código", "Contribuição Técnica", "Organização", "Autonomia", "Colaboração", "Representação"))
+    (tech / "team" / f"{name}.md").write_text(f"# {name}\n\nNickname: {nickname}\nAtivo: Sim\nÁrea: {rng.choice(AREAS)}\n\nPlacar Tech Innovation\n{scores}\n", encoding="utf-8")
+
+  keys = [f"project {index:03d}" for index in range(projects)]
+  features = {key: [sentence(rng, 2) for _ in range(3)] for key in keys}
+  paragraph = sentence(rng, 12) + ".\n"
+  for key in keys:
+    folder = root / "projects" / key
+    (folder / "notes").mkdir(parents=True, exist_ok=True)
+    (folder / "project.json").write_text(json.dumps({"name": key, "status": rng.choice(STATUSES)}, indent=2) + "\n", encoding="utf-8")
+    (folder / "features.md").write_text(f"# Features - {key}\n\n" + "".join(f"## {name}\n\n" for name in features[key]), encoding="utf-8")
+    for index in range(notes):
+      body = paragraph * max(1, note_kb * 1024 // len(paragraph))
+      (folder / "notes" / f"note {index:02d}.md").write_text(f"# Note {index}\n\n{body}", encoding="utf-8")
+
+  for name in sprint_names(sprints):
+    lines = [f"# Sprint {name}", ""]
+    for key in rng.sample(keys, min(topics, len(keys))):
+      lines.extend([f"## {key.title()} [project:{key}]", f"Status: {rng.choice(STATUSES)}", "Start Date: 2026-01-05", "Delivery Date: 2026-01-16", ""])
+      lines.extend(item_line(rng, nicknames, features[key]) for _ in range(items))
+      lines.append("")
+    (tech / "sprints" / f"{name}.md").write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
+
+  backlog = [{"id": f"bench-{index}", "text": sentence(rng, 4), "projectKey": rng.choice(keys) if keys else ""} for index in range(items * 4)]
+  (tech / "backlog.json").write_text(json.dumps({"items": backlog}, ensure_ascii=False, indent=2), encoding="utf-8")
+  (tech / "pjs.md").write_text("# PJs\n", encoding="utf-8")
+
+
+def measure(fn, setup=None, repeat: int = 5):
+  times = []
+  for _ in range(repeat):
+    if setup:
+      setup()
+    started = time.perf_counter()
+    fn()
+    times.append((time.perf_counter() - started) * 1000)
+  if setup:
+    setup()
+  tracemalloc.start()
+  try:
+    fn()
+    retained, peak = tracemalloc.get_traced_memory()
+  finally:
+    tracemalloc.stop()
+  return {
+    "median_ms": round(statistics.median(times), 3),
+    "min_ms": round(min(times), 3),
+    "peak_kb": round(peak / 1024, 1),
+    "retained_kb": round(retained / 1024, 1),
+  }
+
+
+def reset_caches(server):
+  with server.content_cache.lock:
+    server.content_cache.entries.clear()
+    server.content_cache.total = 0
+  with server._sprint_models_lock:
+    server._sprint_models.clear()
+  with server._projects_tree_lock:
+    server._projects_tree.update({"dirs": {}, "revision": "", "listing": None})
+  server._project_sprints_index = None
+  server.PROJECT_SPRINTS_INDEX_FILE.unlink(missing_ok=True)
+
+
+def run_cases(server, repeat: int):
+  results = {}
+  files = server.read_sprint_files()
+  contents = [file_data["content"] for file_data in files]
+  cold = lambda: reset_caches(server)
+
+  def sync():
+    server.sync_project_sprints_files(server.read_sprint_files())
+    server.file_writer.flush()
+
+  results["parse_project_tasks"] = measure(lambda: [server.parse_project_tasks_from_sprint_markdown(content) for content in contents], repeat=repeat)
+  results["sync_project_sprints/cold"] = measure(sync, cold, repeat)
+  results["sync_project_sprints/unchanged"] = measure(sync, repeat=repeat)
+
+  last = server.SPRINTS_DIR / files[-1]["name"]
+  original = last.read_text(encoding="utf-8")
+  flips = iter(range(repeat * 4))
+
+  def edit_one_sprint():
+    content = original.replace("- [ ]", "- [x]", 1) if next(flips) % 2 == 0 else original
+    server.write_text_file(last, content, wait=True)
+
+  results["sync_project_sprints/one-edit"] = measure(sync, edit_one_sprint, repeat)
+  server.write_text_file(last, original, wait=True)
+  sync()
+
+  sprints = server._project_sprints_index
+  order = sorted(sprints)
+  names = [path.name for path in sorted(server.PROJECTS_DIR.iterdir()) if path.is_dir()]
+  results["build_project_sprints_markdown"] = measure(
+    lambda: [server.build_project_sprints_markdown(name, server.collect_project_sprint_topics(name, order, sprints)) for name in names],
+    repeat=repeat,
+  )
+  results["list_team_members/cold"] = measure(server.list_team_members, cold, repeat)
+  results["list_team_members/warm"] = measure(server.list_team_members, repeat=repeat)
+  results["projects_tree/cold"] = measure(server.refresh_projects_tree, cold, repeat)
+  results["projects_tree/warm"] = measure(server.refresh_projects_tree, repeat=repeat)
+
+  limit = server.request_body_limit("/api/sprints/edits")
+  body = json.dumps({"ops": [{"op": "item/save", "line": "- [ ] " + "x" * (limit - 64)}]}).encode("utf-8")
+  results["read_json_body/large-string"] = measure(lambda: server.read_json_body(io.BytesIO(body), len(body)), repeat=repeat)
+
+  quiet = type("BenchHandler", (server.Handler,), {"log_message": lambda self, *args: None})
+  httpd = server.ThreadingHTTPServer(("127.0.0.1", 0), quiet)
+  threading.Thread(target=httpd.serve_forever, daemon=True).start()
+  base = f"http://127.0.0.1:{httpd.server_address[1]}"
+  try:
+    for route in ("/api/sprints", "/api/projects/tree", "/api/team-members", "/api/rollups", "/api/tasks/query?blocked=1", "/api/search?q=deploy"):
+      fetch = lambda: urllib.request.urlopen(base + route).read()
+      fetch()
+      results[f"GET {route}"] = measure(fetch, repeat=repeat)
+  finally:
+    httpd.shutdown()
+    httpd.server_close()
+  return results
+
+
+def worker(args):
+  params = SIZES[args.size]
+  root = Path(tempfile.mkdtemp(prefix="sprint-hub-bench-"))
+  try:
+    generate_corpus(root, **params)
+    os.environ["SPRINT_HUB_ROOT"] = str(root)
+    os.environ["SPRINT_HUB_CACHE_DIR"] = str(root / ".cache")
+    sys.path.insert(0, str(BASE_DIR))
+    server = importlib.import_module("server")
+    server.ensure_project_support_files()
+    results = run_cases(server, args.repeat)
+    server.file_writer.flush()
+  finally:
+    shutil.rmtree(root, ignore_errors=True)
+  json.dump(results, sys.stdout)
+
+
+def compare(results: dict, baseline: dict, threshold: float, min_ms: float):
+  regressions = []
+  for key, current in results.items():
+    previous = baseline.get(key)
+    if not previous:
+      continue
+    slower = current["min_ms"] - previous["min_ms"]
+    if slower > min_ms and current["min_ms"] > previous["min_ms"] * (1 + threshold):
+      regressions.append(f"{key}: {previous['min_ms']:.2f} ms -> {current['min_ms']:.2f} ms")
+    grown = current["peak_kb"] - previous["peak_kb"]
+    if grown > 64 and current["peak_kb"] > previous["peak_kb"] * (1 + threshold):
+      regressions.append(f"{key}: peak {previous['peak_kb']:.0f} KB -> {current['peak_kb']:.0f} KB")
+  return regressions
+
+
+def run(args):
+  results = {}
+  for size in args.sizes.split(","):
+    if size not in SIZES:
+      raise SystemExit(f"Unknown size: {size} (choose from {', '.join(SIZES)})")
+    print(f"[{size}] {json.dumps(SIZES[size])}", file=sys.stderr)
+    output = subprocess.run(
+      [sys.executable, __file__, "worker", "--size", size, "--repeat", str(args.repeat)],
+      check=True,
+      stdout=subprocess.PIPE,
+      text=True,
+    ).stdout
+    for case, stats in json.loads(output).items():
+      results[f"{size}/{case}"] = stats
+
+  baseline_path = Path(args.baseline)
+  try:
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))["results"]
+  except (OSError, ValueError, KeyError):
+    baseline = {}
+  width = max(len(key) for key in results)
+  print(f"{'case':<{width}}  {'median ms':>10}  {'min ms':>9}  {'peak KB':>9}  {'baseline':>9}")
+  for key, stats in results.items():
+    previous = baseline.get(key, {}).get("min_ms")
+    delta = f"{(stats['min_ms'] / previous - 1) * 100:+.0f}%" if previous else "-"
+    print(f"{key:<{width}}  {stats['median_ms']:>10.2f}  {stats['min_ms']:>9.2f}  {stats['peak_kb']:>9.0f}  {delta:>9}")
+
+  if args.json:
+    Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+  if args.save_baseline:
+    baseline_path.parent.mkdir(parents=True, exist_ok=True)
+    baseline_path.write_text(json.dumps({"python": sys.version.split()[0], "results": {**baseline, **results}}, indent=2), encoding="utf-8")
+    print(f"Baseline saved to {baseline_path}")
+    return 0
+  regressions = compare(results, baseline, args.threshold, args.min_ms)
+  for line in regressions:
+    print(f"REGRESSION {line}")
+  return 1 if regressions else 0
+
+
+def generate(args):
+  root = Path(args.root)
+  generate_corpus(root, args.sprints, args.topics, args.items, args.projects, args.members, args.notes, args.note_kb, args.seed)
+  print(f"Corpus written to {root}")
+  return 0
+
+
+def main():
+  parser = argparse.ArgumentParser(description="Sprint Hub microbenchmarks over a synthetic tech/ + projects/ corpus.")
+  commands = parser.add_subparsers(dest="command")
+
+  run_parser = commands.add_parser("run", help="time parsers, project sync, tree walk and GET endpoints per corpus size")
+  run_parser.add_argument("--sizes", default="small,medium,large", help=f"comma separated presets: {', '.join(SIZES)}")
+  run_parser.add_argument("--repeat", type=int, default=5)
+  run_parser.add_argument("--baseline", default=str(BASELINE_FILE))
+  run_parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline instead of comparing")
+  run_parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown before a case counts as a regression (0.25 = 25%%)")
+  run_parser.add_argument("--min-ms", type=float, default=2.0, help="ignore slowdowns smaller than this many ms")
+  run_parser.add_argument("--json", help="also write the results to this file")
+
+  generate_parser = commands.add_parser("generate", help="write a synthetic corpus to a folder")
+  generate_parser.add_argument("root")
+  generate_parser.add_argument("--sprints", type=int, default=200)
+  generate_parser.add_argument("--topics", type=int, default=6)
+  generate_parser.add_argument("--items", type=int, default=8)
+  generate_parser.add_argument("--projects", type=int, default=100)
+  generate_parser.add_argument("--members", type=int, default=20)
+  generate_parser.add_argument("--notes", type=int, default=4)
+  generate_parser.add_argument("--note-kb", type=int, default=8)
+  generate_parser.add_argument("--seed", type=int, default=7)
+
+  worker_parser = commands.add_parser("worker")
+  worker_parser.add_argument("--size", required=True)
+  worker_parser.add_argument("--repeat", type=int, default=5)
+
+  args = parser.parse_args()
+  if args.command == "generate":
+    return generate(args)
+  if args.command == "worker":
+    return worker(args)
+  if args.command is None:
+    args = run_parser.parse_args([])
+  return run(args)
+
+
+if __name__ == "__main__":
+  sys.exit(main())
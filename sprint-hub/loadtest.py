@@ -0,0 +1,488 @@
+import argparse
+import http.client
+import json
+import os
+import random
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from urllib.parse import quote
+
+from bench import SIZES, generate_corpus
+
+BASE_DIR = Path(__file__).resolve().parent
+AUTOSAVE_DELAY_SECONDS = 0.26
+STARTUP_TIMEOUT_SECONDS = 30.0
+
+
+def free_port() -> int:
+  with socket.socket() as sock:
+    sock.bind(("127.0.0.1", 0))
+    return sock.getsockname()[1]
+
+
+class ServerProcess:
+  def __init__(self, root: Path, args: list):
+    self.root = root
+    self.port = free_port()
+    env = {**os.environ, "SPRINT_HUB_ROOT": str(root), "SPRINT_HUB_CACHE_DIR": str(root / ".cache"), "SPRINT_HUB_PORT": str(self.port)}
+    self.log = open(root / "server.log", "w", encoding="utf-8")
+    self.proc = subprocess.Popen([sys.executable, str(BASE_DIR / "server.py"), *args], env=env, stdout=self.log, stderr=subprocess.STDOUT)
+    deadline = time.monotonic() + STARTUP_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+      if self.proc.poll() is not None:
+        raise RuntimeError(f"server exited with {self.proc.returncode}, see {root / 'server.log'}")
+      try:
+        with socket.create_connection(("127.0.0.1", self.port), timeout=0.2):
+          return
+      except OSError:
+        time.sleep(0.05)
+    self.stop()
+    raise RuntimeError("server did not start")
+
+  def stop(self):
+    if self.proc.poll() is None:
+      self.proc.send_signal(signal.SIGTERM)
+      try:
+        self.proc.wait(timeout=STARTUP_TIMEOUT_SECONDS)
+      except subprocess.TimeoutExpired:
+        self.proc.kill()
+        self.proc.wait()
+    self.log.close()
+
+
+class Client:
+  def __init__(self, port: int, client_id: str):
+    self.conn = http.client.HTTPConnection("127.0.0.1", port, timeout=STARTUP_TIMEOUT_SECONDS)
+    self.client_id = client_id
+    self.etags = {}
+    self.bodies = {}
+
+  def request(self, method: str, path: str, payload=None):
+    headers = {"X-Client-Id": self.client_id}
+    body = None
+    if payload is not None:
+      body = json.dumps(payload).encode("utf-8")
+      headers["Content-Type"] = "application/json"
+    elif path in self.etags:
+      headers["If-None-Match"] = self.etags[path]
+    try:
+      self.conn.request(method, path, body, headers)
+      response = self.conn.getresponse()
+      data = response.read()
+    except (OSError, http.client.HTTPException):
+      self.conn.close()
+      raise
+    if response.will_close:
+      self.conn.close()
+    if method == "GET" and response.status == 304:
+      return response.status, self.bodies.get(path, b"")
+    if method == "GET" and response.getheader("ETag"):
+      self.etags[path] = response.getheader("ETag")
+      self.bodies[path] = data
+    return response.status, data
+
+
+class Recorder:
+  def __init__(self):
+    self.lock = threading.Lock()
+    self.latencies = {}
+    self.errors = {}
+
+  def add(self, endpoint: str, seconds: float, ok: bool):
+    with self.lock:
+      self.latencies.setdefault(endpoint, []).append(seconds * 1000)
+      if not ok:
+        self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+
+
+def percentile(values: list, fraction: float) -> float:
+  ordered = sorted(values)
+  return ordered[min(len(ordered) - 1, max(0, int(round(fraction * len(ordered) + 0.5)) - 1))]
+
+
+def toggle_line(content: str, rng: random.Random) -> str:
+  lines = content.split("\n")
+  items = [index for index, line in enumerate(lines) if line.startswith("- [")]
+  if not items:
+    return content
+  index = rng.choice(items)
+  line = lines[index]
+  lines[index] = line.replace("- [ ]", "- [x]", 1) if line.startswith("- [ ]") else line.replace("- [x]", "- [ ]", 1)
+  return "\n".join(lines)
+
+
+def retag_line(line: str, tab: int, edit: int) -> str:
+  head, _, tail = line.partition(" (")
+  return f"{head.split(' #')[0]} #{tab}.{edit} ({tail}" if tail else f"{head.split(' #')[0]} #{tab}.{edit}"
+
+
+def rename_line(content: str, rng: random.Random, tab: int, edit: int) -> str:
+  lines = content.split("\n")
+  items = [index for index, line in enumerate(lines) if line.startswith("- [")]
+  if not items:
+    return content
+  index = rng.choice(items)
+  lines[index] = retag_line(lines[index], tab, edit)
+  return "\n".join(lines)
+
+
+def sprint_item_slots(content: str) -> list:
+  slots = []
+  topic = -1
+  item = 0
+  for line_no, line in enumerate(content.split("\n")):
+    if line.startswith("## "):
+      topic += 1
+      item = 0
+    elif line.startswith("- [") and topic >= 0:
+      slots.append((line_no, topic, item))
+      item += 1
+  return slots
+
+
+class SharedFiles:
+  def __init__(self, root: Path, sprint: str, note: str):
+    self.sprint = sprint
+    self.sprint_lines = (root / "tech" / "sprints" / f"{sprint}.md").read_text(encoding="utf-8").split("\n")
+    self.slots = sprint_item_slots("\n".join(self.sprint_lines))
+    self.note = note
+    items = json.loads((root / "tech" / "backlog.json").read_text(encoding="utf-8"))["items"]
+    self.backlog_ids = [item["id"] for item in items[:8]]
+
+  def check(self, live: Path, tabs: list) -> list:
+    problems = []
+    lines = (live / "tech" / "sprints" / f"{self.sprint}.md").read_text(encoding="utf-8").split("\n")
+    for line_no, _, _ in self.slots:
+      chain = {}
+      for tab in tabs:
+        for ack_line, expect, line in tab.sprint_acks:
+          if ack_line != line_no:
+            continue
+          if expect in chain:
+            problems.append(f"lost update {self.sprint}.md:{line_no + 1}: two saves acknowledged against {expect!r}")
+          chain[expect] = line
+      current = self.sprint_lines[line_no]
+      while current in chain:
+        current = chain.pop(current)
+      if chain:
+        problems.append(f"lost update {self.sprint}.md:{line_no + 1}: {len(chain)} acknowledged saves are not in the final line's history")
+      if lines[line_no] != current:
+        problems.append(f"lost update {self.sprint}.md:{line_no + 1}: {lines[line_no]!r} instead of {current!r}")
+
+    note_lines = set((live / "projects" / self.note).read_text(encoding="utf-8").split("\n"))
+    for tab in tabs:
+      problems.extend(f"lost note append {self.note}: {line!r}" for line in tab.note_acks if line not in note_lines)
+      problems.extend(f"rejected note append written {self.note}: {line!r}" for line in tab.note_rejects if line in note_lines)
+
+    final = {item["id"]: item for item in json.loads((live / "tech" / "backlog.json").read_text(encoding="utf-8"))["items"]}
+    added = set()
+    updates = {}
+    for tab in tabs:
+      for op in tab.backlog_acks:
+        if op["op"] == "add":
+          added.add(op["id"])
+        elif op["op"] == "delete":
+          added.discard(op["id"])
+        else:
+          updates.setdefault(op["id"], []).append(op["item"])
+    present = {item_id for item_id in final if item_id.startswith("load-")}
+    problems.extend(f"lost backlog add {item_id}" for item_id in sorted(added - present))
+    problems.extend(f"unexpected backlog item {item_id}" for item_id in sorted(present - added))
+    problems.extend(f"backlog item {item_id} holds no acknowledged update" for item_id, values in sorted(updates.items()) if final.get(item_id) not in values)
+    return problems
+
+  def final_saves(self, live: Path) -> list:
+    sprint = (live / "tech" / "sprints" / f"{self.sprint}.md").read_text(encoding="utf-8")
+    note = (live / "projects" / self.note).read_text(encoding="utf-8")
+    items = json.loads((live / "tech" / "backlog.json").read_text(encoding="utf-8"))["items"]
+    return [
+      ("/api/sprint-files/save-all", {"files": [{"name": f"{self.sprint}.md", "content": sprint}]}),
+      ("/api/projects/file/save", {"path": self.note, "content": note}),
+      ("/api/backlog/ops", {"ops": [{"op": "replace", "items": items}]}),
+    ]
+
+
+class Tab(threading.Thread):
+  def __init__(self, index: int, port: int, recorder: Recorder, sprints: dict, notes: dict, shared: SharedFiles, args):
+    super().__init__(name=f"tab-{index}", daemon=True)
+    self.index = index
+    self.client = Client(port, f"loadtest-{index}")
+    self.recorder = recorder
+    self.sprints = sprints
+    self.notes = notes
+    self.args = args
+    self.rng = random.Random(args.seed * 1000 + index)
+    self.saves = []
+    self.shared = shared
+    self.shared_lines = []
+    self.shared_note = ("", "")
+    self.sprint_acks = []
+    self.note_acks = []
+    self.note_rejects = []
+    self.backlog_acks = []
+    self.backlog_added = []
+    self.conflicts = 0
+
+  def call(self, endpoint: str, method: str, path: str, payload=None, accept=(200, 304)):
+    started = time.perf_counter()
+    try:
+      status, data = self.client.request(method, path, payload)
+    except (OSError, http.client.HTTPException):
+      status, data = 0, b""
+    self.recorder.add(endpoint, time.perf_counter() - started, status in accept)
+    return status, data
+
+  def load_shared_sprint(self):
+    name = self.shared.sprint
+    status, data = self.call("GET /api/sprint-files", "GET", f"/api/sprint-files?from={name}&to={name}")
+    if status in (200, 304):
+      self.shared_lines = json.loads(data)["files"][0]["content"].split("\n")
+
+  def load_shared_note(self):
+    status, data = self.call("GET /api/projects/file", "GET", f"/api/projects/file?path={quote(self.shared.note)}")
+    if status in (200, 304):
+      payload = json.loads(data)
+      self.shared_note = (payload["revision"], payload["content"])
+
+  def edit_shared_sprint(self, edit: int):
+    line_no, topic, item = self.rng.choice(self.shared.slots)
+    expect = self.shared_lines[line_no]
+    line = retag_line(expect, self.index, edit)
+    payload = {"sprint": self.shared.sprint, "topic": topic, "item": item, "expect": expect, "line": line}
+    status, _ = self.call("POST /api/sprints/item/save", "POST", "/api/sprints/item/save", payload, accept=(200, 409))
+    if status == 200:
+      self.sprint_acks.append((line_no, expect, line))
+      self.shared_lines[line_no] = line
+    elif status == 409:
+      self.conflicts += 1
+      self.load_shared_sprint()
+
+  def edit_shared_note(self, edit: int):
+    revision, content = self.shared_note
+    line = f"- tab {self.index} shared edit {edit}"
+    offset = len(content.encode("utf-16-le")) // 2
+    payload = {"path": self.shared.note, "base": revision, "edits": [{"start": offset, "end": offset, "text": f"\n{line}"}]}
+    status, data = self.call("POST /api/projects/file/save", "POST", "/api/projects/file/save", payload, accept=(200, 409))
+    if status == 200:
+      self.note_acks.append(line)
+      self.shared_note = (json.loads(data)["revision"], f"{content}\n{line}")
+    elif status == 409:
+      self.note_rejects.append(line)
+      self.conflicts += 1
+      self.load_shared_note()
+
+  def edit_shared_backlog(self, edit: int):
+    roll = self.rng.random()
+    if roll < 0.4 or not self.backlog_added:
+      item_id = f"load-{self.index}-{edit}"
+      op = {"op": "add", "id": item_id, "index": self.rng.randint(0, 8), "item": {"id": item_id, "text": f"tab {self.index} edit {edit}"}}
+    elif roll < 0.6:
+      op = {"op": "delete", "id": self.rng.choice(self.backlog_added)}
+    else:
+      item_id = self.rng.choice(self.shared.backlog_ids)
+      op = {"op": "update", "id": item_id, "item": {"id": item_id, "text": f"tab {self.index} edit {edit}"}}
+    status, _ = self.call("POST /api/backlog/ops", "POST", "/api/backlog/ops", {"ops": [op]})
+    if status != 200:
+      return
+    self.backlog_acks.append(op)
+    if op["op"] == "add":
+      self.backlog_added.append(op["id"])
+    elif op["op"] == "delete":
+      self.backlog_added.remove(op["id"])
+
+  def think(self, mean: float):
+    time.sleep(self.rng.expovariate(1 / mean) * self.args.pace if mean else 0)
+
+  def run(self):
+    for path in ("/api/sprints", "/api/projects/tree", "/api/team-members"):
+      self.call(f"GET {path}", "GET", path)
+    self.load_shared_sprint()
+    self.load_shared_note()
+    deadline = time.monotonic() + self.args.duration
+    edit = 0
+    while time.monotonic() < deadline:
+      if self.rng.random() < self.args.shared:
+        edit += 1
+        roll = self.rng.random()
+        if roll < 0.4:
+          self.edit_shared_sprint(edit)
+        elif roll < 0.7:
+          self.edit_shared_note(edit)
+        else:
+          self.edit_shared_backlog(edit)
+        self.think(0.15)
+        continue
+      roll = self.rng.random()
+      if roll < 0.6 and self.sprints:
+        name = self.rng.choice(sorted(self.sprints))
+        for _ in range(self.rng.randint(1, 4)):
+          edit += 1
+          mutate = toggle_line if self.rng.random() < 0.6 else lambda content, rng: rename_line(content, rng, self.index, edit)
+          self.sprints[name] = mutate(self.sprints[name], self.rng)
+          self.think(0.15)
+        time.sleep(AUTOSAVE_DELAY_SECONDS * self.args.pace)
+        request = ("/api/sprint-files/save-all", {"files": [{"name": f"{name}.md", "content": self.sprints[name]}]})
+      elif roll < 0.85 and self.notes:
+        rel = self.rng.choice(sorted(self.notes))
+        for _ in range(self.rng.randint(1, 6)):
+          edit += 1
+          self.notes[rel] += f"\n- tab {self.index} edit {edit}\n"
+          self.think(0.1)
+        time.sleep(AUTOSAVE_DELAY_SECONDS * self.args.pace)
+        request = ("/api/projects/file/save", {"path": rel, "content": self.notes[rel]})
+      else:
+        path = self.rng.choice(["/api/sprints", "/api/projects/tree", "/api/rollups", f"/api/projects/file?path={sorted(self.notes)[0]}" if self.notes else "/api/pjs"])
+        self.call(f"GET {path.split('?')[0]}", "GET", path.replace(" ", "%20"))
+        self.think(0.2)
+        continue
+      status, _ = self.call(f"POST {request[0]}", "POST", *request)
+      if status == 200:
+        self.saves.append(request)
+
+
+def tree_files(root: Path) -> dict:
+  files = {}
+  for top in ("tech", "projects"):
+    for path in (root / top).rglob("*"):
+      rel = path.relative_to(root)
+      if path.is_file() and not any(part.startswith(".") for part in rel.parts):
+        files[rel.as_posix()] = path.read_bytes()
+  return files
+
+
+def replay(fixture: Path, saves: list, server_args: list) -> Path:
+  root = Path(tempfile.mkdtemp(prefix="sprint-hub-replay-"))
+  shutil.copytree(fixture, root, dirs_exist_ok=True)
+  server = ServerProcess(root, server_args)
+  try:
+    client = Client(server.port, "loadtest-replay")
+    for path, payload in saves:
+      status, data = client.request("POST", path, payload)
+      if status != 200:
+        raise RuntimeError(f"replay of {path} failed with {status}: {data[:200]!r}")
+  finally:
+    server.stop()
+  return root
+
+
+def compare_trees(live: Path, expected: Path) -> list:
+  left = tree_files(live)
+  right = tree_files(expected)
+  problems = []
+  for rel in sorted(set(left) | set(right)):
+    if rel not in left:
+      problems.append(f"missing {rel}")
+    elif rel not in right:
+      problems.append(f"unexpected {rel}")
+    elif left[rel] != right[rel]:
+      problems.append(f"differs {rel}")
+  return problems
+
+
+def main():
+  parser = argparse.ArgumentParser(description="Drive a Sprint Hub server with simulated autosaving tabs and verify the files on disk against a serial replay.")
+  parser.add_argument("--tabs", type=int, default=8)
+  parser.add_argument("--duration", type=float, default=10.0, help="seconds each tab keeps editing")
+  parser.add_argument("--size", default="medium", choices=sorted(SIZES))
+  parser.add_argument("--pace", type=float, default=1.0, help="multiplier for think time and the 260 ms autosave debounce (0 = no pauses)")
+  parser.add_argument("--seed", type=int, default=7)
+  parser.add_argument("--shared", type=float, default=0.3, help="fraction of edits that go to the sprint, note and backlog shared by every tab")
+  parser.add_argument("--server-arg", action="append", default=[], help="extra argument for server.py (repeatable)")
+  parser.add_argument("--keep", action="store_true", help="keep the fixture folders for inspection")
+  parser.add_argument("--json", help="also write the report to this file")
+  args = parser.parse_args()
+
+  work = Path(tempfile.mkdtemp(prefix="sprint-hub-load-"))
+  fixture = work / "fixture"
+  live = work / "live"
+  generate_corpus(fixture, **SIZES[args.size], seed=args.seed)
+  shutil.copytree(fixture, live)
+
+  server = ServerProcess(live, args.server_arg)
+  recorder = Recorder()
+  try:
+    sprint_names = sorted(path.stem for path in (live / "tech" / "sprints").glob("*.md"))
+    note_paths = sorted(path.relative_to(live / "projects").as_posix() for path in (live / "projects").glob("*/notes/*.md"))
+    shared = SharedFiles(live, sprint_names.pop(), note_paths.pop())
+    Client(server.port, "loadtest-warmup").request("GET", "/api/sprints")
+    tabs = []
+    for index in range(args.tabs):
+      owned_sprints = {name: (live / "tech" / "sprints" / f"{name}.md").read_text(encoding="utf-8") for name in sprint_names[-1 - index::-args.tabs][:3]}
+      owned_notes = {rel: (live / "projects" / rel).read_text(encoding="utf-8") for rel in note_paths[index::args.tabs][:3]}
+      tabs.append(Tab(index, server.port, recorder, owned_sprints, owned_notes, shared, args))
+    started = time.perf_counter()
+    for tab in tabs:
+      tab.start()
+    for tab in tabs:
+      tab.join()
+    elapsed = time.perf_counter() - started
+  finally:
+    server.stop()
+
+  lost = shared.check(live, tabs)
+  expected = replay(fixture, [save for tab in tabs for save in tab.saves] + shared.final_saves(live), args.server_arg)
+  problems = compare_trees(live, expected)
+
+  total = sum(len(values) for values in recorder.latencies.values())
+  errors = sum(recorder.errors.values())
+  report = {
+    "tabs": args.tabs,
+    "size": args.size,
+    "seconds": round(elapsed, 2),
+    "requests": total,
+    "throughput_rps": round(total / elapsed, 1),
+    "error_rate": round(errors / total, 4) if total else 0,
+    "saves": sum(len(tab.saves) for tab in tabs),
+    "shared_acknowledged": sum(len(tab.sprint_acks) + len(tab.note_acks) + len(tab.backlog_acks) for tab in tabs),
+    "shared_conflicts": sum(tab.conflicts for tab in tabs),
+    "lost": lost,
+    "mismatches": problems,
+    "endpoints": {
+      endpoint: {
+        "count": len(values),
+        "errors": recorder.errors.get(endpoint, 0),
+        "p50_ms": round(percentile(values, 0.50), 2),
+        "p95_ms": round(percentile(values, 0.95), 2),
+        "p99_ms": round(percentile(values, 0.99), 2),
+      }
+      for endpoint, values in sorted(recorder.latencies.items())
+    },
+  }
+
+  width = max(len(endpoint) for endpoint in report["endpoints"])
+  print(f"{args.tabs} tabs, {args.size} corpus, {elapsed:.1f} s: {total} requests, {report['throughput_rps']} req/s, error rate {report['error_rate']:.2%}")
+  print(f"{'endpoint':<{width}}  {'count':>6}  {'errors':>6}  {'p50 ms':>8}  {'p95 ms':>8}  {'p99 ms':>8}")
+  for endpoint, stats in report["endpoints"].items():
+    print(f"{endpoint:<{width}}  {stats['count']:>6}  {stats['errors']:>6}  {stats['p50_ms']:>8.2f}  {stats['p95_ms']:>8.2f}  {stats['p99_ms']:>8.2f}")
+  if problems:
+    print(f"Final files differ from the serial replay of {report['saves']} saves:")
+    for line in problems[:20]:
+      print(f"  {line}")
+  else:
+    print(f"Final files match the serial replay of {report['saves']} saves.")
+  if lost:
+    print(f"Shared files lost acknowledged writes ({report['shared_acknowledged']} acknowledged, {report['shared_conflicts']} rejected with 409):")
+    for line in lost[:20]:
+      print(f"  {line}")
+  else:
+    print(f"Shared files kept all {report['shared_acknowledged']} acknowledged writes; {report['shared_conflicts']} were rejected with 409.")
+  if args.json:
+    Path(args.json).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+  if args.keep:
+    print(f"Kept {live} and {expected}")
+  else:
+    shutil.rmtree(work, ignore_errors=True)
+    shutil.rmtree(expected, ignore_errors=True)
+  return 1 if problems or lost or errors else 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
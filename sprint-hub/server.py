@@ -1,24 +1,1001 @@
+import argparse
+import asyncio
+import bisect
+import cProfile
+import difflib
+import errno
+import gzip
+import hashlib
+import inspect
+import io
 import json
+import math
+import os
+import queue
+import pstats
 import re
+import signal
+import sqlite3
+import tempfile
+import threading
+import time
+import unicodedata
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from urllib.parse import parse_qs, urlparse
 
 
 BASE_DIR = Path(__file__).resolve().parent
-ROOT_DIR = BASE_DIR.parent
+ROOT_DIR = Path(os.environ.get("SPRINT_HUB_ROOT") or BASE_DIR.parent).resolve()
 SPRINTS_DIR = ROOT_DIR / "tech" / "sprints"
 TEAM_DIR = ROOT_DIR / "tech" / "team"
 TEAM_METRICS_FILE = ROOT_DIR / "tech" / "métricas.md"
 PJS_FILE = ROOT_DIR / "tech" / "pjs.md"
 PROJECTS_DIR = ROOT_DIR / "projects"
 BACKLOG_FILE = ROOT_DIR / "tech" / "backlog.json"
+BACKLOG_JOURNAL_FILE = ROOT_DIR / "tech" / ".backlog.journal"
 HOST = "127.0.0.1"
-PORT = 8765
+PORT = int(os.environ.get("SPRINT_HUB_PORT") or 8765)
 PROJECT_SPRINTS_FROM = "26-01"
 TIMELINE_FILE_NAME = "timeline.md"
 PROJECT_CONTROL_FILE_NAME = "project.json"
 PROJECT_FEATURES_FILE_NAME = "features.md"
+PROJECT_STATUS_OPTIONS = ["Planejamento", "Desenvolvimento", "Teste", "Acompanhamento", "Bloqueado", "Finalizado"]
+TEAM_AREAS = ["Back", "Front", "Mobile", "Data", "QA", "UX/UI", "Mkt"]
+TEAM_AREA_ALIASES = {
+  "back": "Back",
+  "backend": "Back",
+  "back-end": "Back",
+  "front": "Front",
+  "frontend": "Front",
+  "front-end": "Front",
+  "mobile": "Mobile",
+  "data": "Data",
+  "qa": "QA",
+  "test": "QA",
+  "tests": "QA",
+  "teste": "QA",
+  "testes": "QA",
+  "ux": "UX/UI",
+  "ui": "UX/UI",
+  "ux/ui": "UX/UI",
+  "ui/ux": "UX/UI",
+  "design": "UX/UI",
+  "mkt": "Mkt",
+  "marketing": "Mkt",
+}
+SPRINT_MODEL_CACHE_SIZE = 512
+SEARCH_RESCAN_SECONDS = 5.0
+SEARCH_PAGE_SIZE = 20
+SEARCH_SNIPPET_CHARS = 180
+PROJECT_SPRINTS_FILE_NAME = "sprints.md"
+CACHE_DIR = Path(os.environ.get("SPRINT_HUB_CACHE_DIR") or BASE_DIR / ".cache").resolve()
+PROJECT_SPRINTS_INDEX_FILE = CACHE_DIR / "project-sprints-index.json"
+PROJECT_SPRINTS_INDEX_VERSION = 1
+READ_CACHE_MAX_BYTES = 32 * 1024 * 1024
+WARM_START_FILE = CACHE_DIR / "warm-start.json"
+WARM_START_VERSION = 2
+WARM_START_POOL_THRESHOLD = 16
+WARM_START_DERIVED = ("revision", "member", "json")
+TASK_STORE_FILE = CACHE_DIR / "tasks.sqlite3"
+TASK_STORE_VERSION = 1
+TASK_QUERY_LIMIT = 100
+BACKLOG_COMPACT_OPS = 200
+BACKLOG_COMPACT_IDLE_SECONDS = 10.0
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+RESPONSE_SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+SLOW_REQUEST_MS = float(os.environ.get("SPRINT_HUB_SLOW_MS") or 0)
+SLOW_REQUEST_DIR = CACHE_DIR / "slow-requests"
+SLOW_REQUEST_KEEP = 50
+SERVER_WORKERS = 16
+SERVER_QUEUE_SIZE = 64
+SERVER_RETRY_AFTER_SECONDS = 1
+MAX_EVENT_STREAMS = 64
+REQUEST_TIMEOUT_SECONDS = 30.0
+REQUEST_READ_CHUNK = 64 * 1024
+RESPONSE_WRITE_CHUNK = 64 * 1024
+REQUEST_BODY_DEFAULT_LIMIT = 256 * 1024
+REQUEST_BODY_LIMITS = {
+  "/api/sprint-files/save-all": 16 * 1024 * 1024,
+  "/api/projects/file/save": 8 * 1024 * 1024,
+  "/api/projects/file/create": 8 * 1024 * 1024,
+  "/api/projects/bundle/save": 16 * 1024 * 1024,
+  "/api/team-member/file/save": 2 * 1024 * 1024,
+  "/api/team-member/file/create": 2 * 1024 * 1024,
+  "/api/team-members/save": 1024 * 1024,
+  "/api/pjs/save": 2 * 1024 * 1024,
+  "/api/backlog/ops": 4 * 1024 * 1024,
+  "/api/sprints/topic/add": 1024 * 1024,
+  "/api/sprints/topic/move": 1024 * 1024,
+  "/api/sprints/edits": 4 * 1024 * 1024,
+}
+SAVE_ALL_MIN_INTERVAL_SECONDS = 0.25
+SAVE_ALL_CLIENTS_MAX = 256
+ASYNC_KEEPALIVE_SECONDS = 15.0
+ASYNC_WRITE_TIMEOUT_SECONDS = 30.0
+ASYNC_MAX_HEADER_BYTES = 64 * 1024
+SPRINT_EDIT_ROUTES = (
+  "/api/sprints/item/toggle",
+  "/api/sprints/item/save",
+  "/api/sprints/topic/add",
+  "/api/sprints/topic/remove",
+  "/api/sprints/topic/move",
+  "/api/sprints/edits",
+)
+SPRINT_EDIT_MAX_OPS = 256
+CHANGE_POLL_SECONDS = 1.0
+CHANGE_HISTORY_SIZE = 256
+CHANGE_KEEPALIVE_SECONDS = 15.0
+WRITE_RETRY_SECONDS = 1.0
+WRITE_RETRY_MAX_SECONDS = 30.0
+WRITE_RETRY_LIMIT = 8
+WRITE_PERMANENT_ERRNOS = {errno.EACCES, errno.EINVAL, errno.EISDIR, errno.ENAMETOOLONG, errno.ENOENT, errno.ENOTDIR, errno.EPERM, errno.EROFS}
+WRITE_WAIT_MAX_SECONDS = 30.0
+STATIC_INDEX_FILE_NAME = "index.html"
+STATIC_ASSET_TYPES = {
+  "app.js": "text/javascript; charset=utf-8",
+  "styles.css": "text/css; charset=utf-8",
+}
+
+
+def content_revision(content: str) -> str:
+  return hashlib.sha1(str(content or "").encode("utf-8")).hexdigest()[:16]
+
+
+def file_stamp(path: Path):
+  try:
+    stat = path.stat()
+  except OSError:
+    return None
+  return (stat.st_mtime_ns, stat.st_size)
+
+
+TEMP_FILE_PREFIX = ".sprint-hub-"
+
+
+def stage_text(path: Path, content: str) -> str:
+  path.parent.mkdir(parents=True, exist_ok=True)
+  try:
+    mode = path.stat().st_mode & 0o777
+  except OSError:
+    mode = 0o644
+  fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=TEMP_FILE_PREFIX, suffix=".tmp")
+  try:
+    with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as handle:
+      handle.write(content)
+      handle.flush()
+      os.fsync(handle.fileno())
+    os.chmod(tmp_name, mode)
+  except BaseException:
+    discard_staged([tmp_name])
+    raise
+  return tmp_name
+
+
+def discard_staged(tmp_names: list):
+  for tmp_name in tmp_names:
+    try:
+      os.unlink(tmp_name)
+    except OSError:
+      pass
+
+
+def fsync_dir(directory: Path):
+  if not hasattr(os, "O_DIRECTORY"):
+    return
+  try:
+    dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+  except OSError:
+    return
+  try:
+    os.fsync(dir_fd)
+  except OSError:
+    pass
+  finally:
+    os.close(dir_fd)
+
+
+def atomic_write_text(path: Path, content: str):
+  atomic_write_texts([(path, content)])
+
+
+def atomic_write_texts(items: list):
+  staged = []
+  try:
+    for path, content in items:
+      staged.append(stage_text(path, content))
+    for tmp_name, (path, _) in zip(staged, items):
+      os.replace(tmp_name, path)
+  except BaseException:
+    discard_staged(staged)
+    raise
+  for directory in dict.fromkeys(path.parent for path, _ in items):
+    fsync_dir(directory)
+
+
+class WriteFailed(OSError):
+  pass
+
+
+def check_write_target(path: Path, content=""):
+  if path.is_dir():
+    raise IsADirectoryError(errno.EISDIR, "Is a directory", str(path))
+  if content is None:
+    return
+  path.parent.mkdir(parents=True, exist_ok=True)
+  if not os.access(path.parent, os.W_OK | os.X_OK):
+    raise PermissionError(errno.EACCES, "Permission denied", str(path.parent))
+
+
+class FileWriter:
+  def __init__(self):
+    self.pending = OrderedDict()
+    self.in_flight = {}
+    self.retrying = {}
+    self.attempts = {}
+    self.failures = {}
+    self.revision = 0
+    self.durable = 0
+    self.written = 0
+    self.coalesced = 0
+    self.errors = 0
+    self.last_error = ""
+    self.cond = threading.Condition()
+    self.thread = None
+
+  def _submit(self, path: Path, content, group: int = 0) -> int:
+    key = str(path)
+    with self.cond:
+      self.revision += 1
+      if self.pending.pop(key, None) is not None or self.retrying.pop(key, None) is not None:
+        self.coalesced += 1
+      self.attempts.pop(key, None)
+      self.pending[key] = (path, content, self.revision, group)
+      if self.thread is None or not self.thread.is_alive():
+        self.thread = threading.Thread(target=self._run, name="file-writer", daemon=True)
+        self.thread.start()
+      self.cond.notify_all()
+      return self.revision
+
+  def write(self, path: Path, content: str) -> int:
+    check_write_target(path)
+    return self._submit(path, str(content or ""))
+
+  def write_many(self, items: list, atomic: bool = False) -> int:
+    for path, _ in items:
+      check_write_target(path)
+    with self.cond:
+      group = self.revision + 1 if atomic and len(items) > 1 else 0
+      for path, content in items:
+        self._submit(path, str(content or ""), group)
+      return self.revision
+
+  def delete(self, path: Path) -> int:
+    check_write_target(path, None)
+    return self._submit(path, None)
+
+  def _queued(self, key: str):
+    entry = self.pending.get(key) or self.in_flight.get(key)
+    if entry is None and key in self.retrying:
+      entry = self.retrying[key][0]
+    return entry
+
+  def lookup(self, path: Path):
+    with self.cond:
+      entry = self._queued(str(path))
+    if entry is None:
+      return False, None
+    return True, entry[1]
+
+  def _entries(self):
+    return list(self.in_flight.values()) + list(self.pending.values()) + [entry for entry, _ in self.retrying.values()]
+
+  def queued_in(self, directory: Path):
+    with self.cond:
+      entries = self._entries()
+    return [(path, content) for path, content, *_ in entries if path.parent == directory]
+
+  def latest(self) -> int:
+    with self.cond:
+      return self.revision
+
+  def pending_revision(self, path: Path) -> int:
+    with self.cond:
+      entry = self._queued(str(path))
+    return entry[2] if entry else 0
+
+  def _update_durable(self):
+    waiting = [entry[2] for entry in self._entries()]
+    self.durable = min(waiting) - 1 if waiting else self.revision
+    self.cond.notify_all()
+
+  def _flush(self, batch: list):
+    if len(batch) > 1:
+      atomic_write_texts([(path, content) for _, (path, content, *_) in batch])
+      for _, (path, content, *_) in batch:
+        content_cache.store(path, content)
+        search_index.touch(path)
+      return
+    _, (path, content, *_) = batch[0]
+    if content is None:
+      try:
+        path.unlink()
+      except FileNotFoundError:
+        pass
+      content_cache.invalidate(path)
+    else:
+      atomic_write_text(path, content)
+      content_cache.store(path, content)
+    search_index.touch(path)
+
+  def _take(self):
+    while True:
+      now = time.monotonic()
+      for key in [key for key, (_, due) in self.retrying.items() if due <= now]:
+        self.pending[key] = self.retrying.pop(key)[0]
+      if self.pending:
+        return self.pending.popitem(last=False)
+      self.cond.wait(min(due for _, due in self.retrying.values()) - now if self.retrying else None)
+
+  def _fail(self, key: str, entry: tuple, exc: OSError):
+    path, _, revision, _ = entry
+    with self.cond:
+      self.errors += 1
+      self.last_error = f"{path}: {exc}"
+      self.in_flight.pop(key, None)
+      attempts = self.attempts.pop(key, 0) + 1
+      if key in self.pending:
+        pass
+      elif exc.errno in WRITE_PERMANENT_ERRNOS or attempts >= WRITE_RETRY_LIMIT:
+        self.failures[key] = (revision, self.last_error)
+        metrics.count("write_failures")
+      else:
+        self.attempts[key] = attempts
+        delay = min(WRITE_RETRY_SECONDS * 2 ** (attempts - 1), WRITE_RETRY_MAX_SECONDS)
+        self.retrying[key] = (entry, time.monotonic() + delay)
+      self._update_durable()
+
+  def _run(self):
+    while True:
+      with self.cond:
+        key, entry = self._take()
+        batch = [(key, entry)]
+        if entry[3]:
+          batch.extend((other, self.pending.pop(other)) for other in [other for other, queued in self.pending.items() if queued[3] == entry[3]])
+        self.in_flight.update(batch)
+      try:
+        self._flush(batch)
+      except OSError as exc:
+        for key, entry in batch:
+          self._fail(key, entry, exc)
+        continue
+      for _, (_, content, *_) in batch:
+        if content is not None:
+          metrics.count("disk_writes")
+          metrics.count("disk_written_bytes", len(content.encode("utf-8")))
+      with self.cond:
+        for key, _ in batch:
+          self.written += 1
+          self.in_flight.pop(key, None)
+          self.failures.pop(key, None)
+        self._update_durable()
+
+  def failed(self, revision: int, since: int = 0):
+    with self.cond:
+      return [message for failed_revision, message in self.failures.values() if since < failed_revision <= revision]
+
+  def wait(self, revision: int, timeout: float = WRITE_WAIT_MAX_SECONDS, since: int = 0) -> bool:
+    def settled():
+      return self.durable >= revision or not any(since < entry[2] <= revision for entry in self._entries())
+
+    with self.cond:
+      durable = self.cond.wait_for(settled, timeout)
+    failed = self.failed(revision, since)
+    if failed:
+      raise WriteFailed(errno.EIO, failed[0])
+    return durable
+
+  def flush(self, timeout: float = WRITE_WAIT_MAX_SECONDS) -> bool:
+    with self.cond:
+      revision = self.revision
+      return self.cond.wait_for(lambda: self.durable >= revision, timeout)
+
+  def status(self):
+    with self.cond:
+      return {
+        "revision": self.revision,
+        "durable": self.durable,
+        "pending": len(self.pending) + len(self.in_flight) + len(self.retrying),
+        "retrying": len(self.retrying),
+        "written": self.written,
+        "coalesced": self.coalesced,
+        "errors": self.errors,
+        "failed": sorted(message for _, message in self.failures.values()),
+        "last_error": self.last_error,
+      }
+
+
+file_writer = FileWriter()
+
+
+class ContentCache:
+  def __init__(self, max_bytes: int):
+    self.max_bytes = max_bytes
+    self.entries = OrderedDict()
+    self.total = 0
+    self.hits = 0
+    self.misses = 0
+    self.lock = threading.Lock()
+
+  def _entry(self, path: Path):
+    key = str(path)
+    queued, content = file_writer.lookup(path)
+    if queued:
+      if content is None:
+        raise FileNotFoundError(key)
+      return {"stamp": None, "content": content.replace("\r\n", "\n").replace("\r", "\n"), "derived": {}}
+    stamp = file_stamp(path)
+    with self.lock:
+      entry = self.entries.get(key)
+      if entry and stamp and entry["stamp"] == stamp:
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry
+    if stamp is None:
+      self.invalidate(path)
+      raise FileNotFoundError(key)
+    with timed("disk"):
+      content = path.read_text(encoding="utf-8", errors="ignore")
+    metrics.count("disk_reads")
+    metrics.count("disk_read_bytes", len(content.encode("utf-8")))
+    note_file_access("read")
+    with self.lock:
+      self.misses += 1
+      return self._put(key, stamp, content)
+
+  def _put(self, key: str, stamp, content: str):
+    old = self.entries.pop(key, None)
+    if old:
+      self.total -= len(old["content"])
+    entry = {"stamp": stamp, "content": content, "derived": {}}
+    self.entries[key] = entry
+    self.total += len(content)
+    while self.total > self.max_bytes and len(self.entries) > 1:
+      _, evicted = self.entries.popitem(last=False)
+      self.total -= len(evicted["content"])
+    return entry
+
+  def read_text(self, path: Path) -> str:
+    return self._entry(path)["content"]
+
+  def derive(self, path: Path, name: str, build):
+    entry = self._entry(path)
+    derived = entry["derived"]
+    if name not in derived:
+      derived[name] = build(entry["content"])
+    return derived[name]
+
+  def store(self, path: Path, content: str):
+    stamp = file_stamp(path)
+    if stamp is None:
+      self.invalidate(path)
+      return
+    text = str(content or "").replace("\r\n", "\n").replace("\r", "\n")
+    with self.lock:
+      self._put(str(path), stamp, text)
+
+  def seed(self, path: Path, stamp, content: str, derived: dict):
+    with self.lock:
+      if str(path) in self.entries:
+        return
+      self._put(str(path), stamp, content)["derived"].update(derived)
+
+  def export(self, root: Path):
+    prefix = f"{root}{os.sep}"
+    with self.lock:
+      return {
+        key: {
+          "stamp": list(entry["stamp"]),
+          "content": entry["content"],
+          "derived": {name: value for name, value in entry["derived"].items() if name in WARM_START_DERIVED},
+        }
+        for key, entry in self.entries.items()
+        if key.startswith(prefix) and entry["stamp"]
+      }
+
+  def invalidate(self, path: Path):
+    with self.lock:
+      old = self.entries.pop(str(path), None)
+      if old:
+        self.total -= len(old["content"])
+
+
+content_cache = ContentCache(READ_CACHE_MAX_BYTES)
+
+
+def read_text_cached(path: Path) -> str:
+  return content_cache.read_text(path)
+
+
+def iter_json(payload: dict):
+  yield b"{"
+  for index, (key, value) in enumerate(payload.items()):
+    yield (b", " if index else b"") + json.dumps(str(key), ensure_ascii=False).encode("utf-8") + b": "
+    if inspect.isgenerator(value):
+      yield b"["
+      for position, item in enumerate(value):
+        yield (b", " if position else b"") + json.dumps(item, ensure_ascii=False).encode("utf-8")
+      yield b"]"
+    else:
+      yield json.dumps(value, ensure_ascii=False).encode("utf-8")
+  yield b"}"
+
+
+def stamps_etag(paths, extra: str = "") -> str:
+  digest = hashlib.sha1(str(extra).encode("utf-8"))
+  for path in paths:
+    pending = file_writer.pending_revision(path)
+    stamp = ("pending", pending) if pending else file_stamp(path)
+    digest.update(f"{path}\0{stamp}\n".encode("utf-8"))
+  return f'"{digest.hexdigest()[:20]}"'
+
+
+SEARCH_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def normalize_search_text(text: str) -> str:
+  decomposed = unicodedata.normalize("NFKD", str(text or ""))
+  return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+
+
+def search_tokens(text: str):
+  return SEARCH_TOKEN_RE.findall(normalize_search_text(text))
+
+
+class SearchIndex:
+  def __init__(self):
+    self.docs = {}
+    self.postings = {}
+    self.vocabulary = None
+    self.dirty = set()
+    self.scanned_at = 0.0
+    self.lock = threading.Lock()
+
+  def roots(self):
+    return [
+      ("projects", PROJECTS_DIR, "**/*.md"),
+      ("sprints", SPRINTS_DIR, "*.md"),
+      ("team", TEAM_DIR, "*.md"),
+    ]
+
+  def scope_of(self, path: Path):
+    for scope, root, pattern in self.roots():
+      try:
+        rel = path.resolve().relative_to(root.resolve())
+      except ValueError:
+        continue
+      if path.suffix.lower() == ".md" and (pattern.startswith("**") or len(rel.parts) == 1):
+        return scope, rel.as_posix()
+    return None
+
+  def touch(self, path: Path):
+    if self.scope_of(path):
+      with self.lock:
+        self.dirty.add(str(path.resolve()))
+
+  def _remove(self, key: str):
+    doc = self.docs.pop(key, None)
+    if not doc:
+      return
+    for term in doc["terms"]:
+      postings = self.postings.get(term)
+      if postings:
+        postings.pop(key, None)
+        if not postings:
+          self.postings.pop(term, None)
+          self.vocabulary = None
+
+  def _add(self, key: str, path: Path, scope: str, rel: str, stamp):
+    self._remove(key)
+    try:
+      content = read_text_cached(path)
+    except OSError:
+      return
+    terms = {}
+    for token in search_tokens(content):
+      terms[token] = terms.get(token, 0) + 1
+    for token in search_tokens(rel):
+      terms[token] = terms.get(token, 0) + 3
+    self.docs[key] = {"path": path, "scope": scope, "rel": rel, "stamp": stamp, "terms": terms, "length": sum(terms.values())}
+    for term, count in terms.items():
+      postings = self.postings.get(term)
+      if postings is None:
+        postings = self.postings[term] = {}
+        self.vocabulary = None
+      postings[key] = count
+
+  def refresh(self, force: bool = False):
+    with self.lock:
+      now = time.monotonic()
+      if force or now - self.scanned_at >= SEARCH_RESCAN_SECONDS:
+        seen = set()
+        for scope, root, pattern in self.roots():
+          if not root.is_dir():
+            continue
+          for path in root.glob(pattern):
+            if not path.is_file():
+              continue
+            key = str(path.resolve())
+            seen.add(key)
+            stamp = file_stamp(path)
+            doc = self.docs.get(key)
+            if not doc or doc["stamp"] != stamp:
+              self._add(key, path, scope, path.relative_to(root).as_posix(), stamp)
+        for key in [key for key in self.docs if key not in seen]:
+          self._remove(key)
+        self.dirty.clear()
+        self.scanned_at = now
+        return
+      for key in list(self.dirty):
+        path = Path(key)
+        stamp = file_stamp(path)
+        target = self.scope_of(path)
+        if stamp is None or not target:
+          self._remove(key)
+        elif not self.docs.get(key) or self.docs[key]["stamp"] != stamp:
+          self._add(key, path, target[0], target[1], stamp)
+      self.dirty.clear()
+
+  def export(self):
+    with self.lock:
+      return {
+        key: {**doc, "path": str(doc["path"]), "stamp": list(doc["stamp"]) if doc["stamp"] else None}
+        for key, doc in self.docs.items()
+      }
+
+  def restore(self, docs: dict):
+    with self.lock:
+      for key, doc in docs.items():
+        stamp = tuple(doc.get("stamp") or ())
+        if key in self.docs or not stamp or file_stamp(Path(key)) != stamp:
+          continue
+        self.docs[key] = {**doc, "path": Path(doc["path"]), "stamp": stamp}
+        for term, count in doc["terms"].items():
+          self.postings.setdefault(term, {})[key] = count
+      self.vocabulary = None
+
+  def _expand(self, token: str, prefix: bool):
+    if not prefix:
+      return [token] if token in self.postings else []
+    if self.vocabulary is None:
+      self.vocabulary = sorted(self.postings)
+    start = bisect.bisect_left(self.vocabulary, token)
+    terms = []
+    for term in self.vocabulary[start:]:
+      if not term.startswith(token):
+        break
+      terms.append(term)
+    return terms
+
+  def search(self, query: str, scope: str = "", offset: int = 0, limit: int = SEARCH_PAGE_SIZE):
+    self.refresh()
+    tokens = search_tokens(query)
+    if not tokens:
+      return 0, []
+    with self.lock:
+      total_docs = max(len(self.docs), 1)
+      avg_length = sum(doc["length"] for doc in self.docs.values()) / total_docs
+      scores = None
+      for i, token in enumerate(tokens):
+        token_scores = {}
+        for term in self._expand(token, prefix=i == len(tokens) - 1):
+          postings = self.postings[term]
+          idf = math.log(1 + (total_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+          for key, tf in postings.items():
+            doc = self.docs[key]
+            if scope and doc["scope"] != scope:
+              continue
+            norm = tf * 2.2 / (tf + 1.2 * (0.25 + 0.75 * doc["length"] / max(avg_length, 1)))
+            token_scores[key] = max(token_scores.get(key, 0.0), idf * norm)
+        if scores is None:
+          scores = token_scores
+        else:
+          scores = {key: score + token_scores[key] for key, score in scores.items() if key in token_scores}
+        if not scores:
+          return 0, []
+      ranked = sorted(scores.items(), key=lambda pair: (-pair[1], self.docs[pair[0]]["rel"]))
+      page = [(self.docs[key], score) for key, score in ranked[offset:offset + limit]]
+    results = []
+    for doc, score in page:
+      line_no, snippet = search_snippet(doc["path"], tokens)
+      results.append(
+        {
+          "scope": doc["scope"],
+          "path": doc["rel"],
+          "score": round(score, 4),
+          "line": line_no,
+          "snippet": snippet,
+        }
+      )
+    return len(ranked), results
+
+
+def search_snippet(path: Path, tokens: list):
+  try:
+    lines = read_text_cached(path).split("\n")
+  except OSError:
+    return 0, ""
+  for i, line in enumerate(lines):
+    normalized = normalize_search_text(line)
+    if any(token in normalized for token in tokens):
+      text = line.strip()
+      if len(text) > SEARCH_SNIPPET_CHARS:
+        pos = max(normalized.find(next(token for token in tokens if token in normalized)) - SEARCH_SNIPPET_CHARS // 3, 0)
+        text = ("..." if pos else "") + line[pos:pos + SEARCH_SNIPPET_CHARS].strip() + "..."
+      return i + 1, text
+  return 0, next((line.strip() for line in lines if line.strip()), "")[:SEARCH_SNIPPET_CHARS]
+
+
+search_index = SearchIndex()
+
+
+request_context = threading.local()
+
+
+def histogram_observe(histogram: dict, buckets: tuple, value: float):
+  histogram["buckets"][bisect.bisect_left(buckets, value)] += 1
+  histogram["sum"] += value
+  histogram["count"] += 1
+
+
+def histogram_lines(name: str, labels: str, histogram: dict, buckets: tuple):
+  lines = []
+  total = 0
+  for bound, count in zip(buckets + ("+Inf",), histogram["buckets"]):
+    total += count
+    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {total}')
+  lines.append(f"{name}_sum{{{labels}}} {histogram['sum']:.6f}")
+  lines.append(f"{name}_count{{{labels}}} {histogram['count']}")
+  return lines
+
+
+class Metrics:
+  def __init__(self):
+    self.lock = threading.Lock()
+    self.requests = {}
+    self.latency = {}
+    self.sizes = {}
+    self.phases = {}
+    self.files = {}
+    self.gauges = {}
+    self.counters = {
+      "requests_rejected_busy": 0,
+      "requests_rejected_too_large": 0,
+      "disk_read_bytes": 0,
+      "disk_reads": 0,
+      "disk_written_bytes": 0,
+      "disk_writes": 0,
+      "write_failures": 0,
+      "sprint_model_hits": 0,
+      "sprint_model_misses": 0,
+    }
+
+  def count(self, name: str, amount: int = 1):
+    with self.lock:
+      self.counters[name] += amount
+
+  def observe(self, method: str, route: str, status: int, seconds: float, size: int, phases: dict, files: dict):
+    key = (method, route)
+    with self.lock:
+      self.requests[key + (status,)] = self.requests.get(key + (status,), 0) + 1
+      if route == "/api/events":
+        return
+      latency = self.latency.setdefault(key, {"buckets": [0] * (len(LATENCY_BUCKETS) + 1), "sum": 0.0, "count": 0})
+      histogram_observe(latency, LATENCY_BUCKETS, seconds)
+      sizes = self.sizes.setdefault(key, {"buckets": [0] * (len(RESPONSE_SIZE_BUCKETS) + 1), "sum": 0.0, "count": 0})
+      histogram_observe(sizes, RESPONSE_SIZE_BUCKETS, size)
+      for phase, spent in phases.items():
+        self.phases[(route, phase)] = self.phases.get((route, phase), 0.0) + spent
+      for kind, touched in files.items():
+        if touched:
+          self.files[(route, kind)] = self.files.get((route, kind), 0) + touched
+
+  def render(self) -> str:
+    with self.lock:
+      requests = dict(self.requests)
+      latency = {key: {**value, "buckets": list(value["buckets"])} for key, value in self.latency.items()}
+      sizes = {key: {**value, "buckets": list(value["buckets"])} for key, value in self.sizes.items()}
+      phases = dict(self.phases)
+      files = dict(self.files)
+      counters = dict(self.counters)
+    writer = file_writer.status()
+    with content_cache.lock:
+      cache_hits, cache_misses, cache_bytes = content_cache.hits, content_cache.misses, content_cache.total
+    lines = [
+      "# HELP sprint_hub_requests_total Requests handled, by method, route and status.",
+      "# TYPE sprint_hub_requests_total counter",
+    ]
+    for (method, route, status), count in sorted(requests.items()):
+      lines.append(f'sprint_hub_requests_total{{method="{method}",route="{route}",status="{status}"}} {count}')
+    lines.extend(["# HELP sprint_hub_request_duration_seconds Request latency.", "# TYPE sprint_hub_request_duration_seconds histogram"])
+    for (method, route), histogram in sorted(latency.items()):
+      lines.extend(histogram_lines("sprint_hub_request_duration_seconds", f'method="{method}",route="{route}"', histogram, LATENCY_BUCKETS))
+    lines.extend(["# HELP sprint_hub_response_bytes Response body size.", "# TYPE sprint_hub_response_bytes histogram"])
+    for (method, route), histogram in sorted(sizes.items()):
+      lines.extend(histogram_lines("sprint_hub_response_bytes", f'method="{method}",route="{route}"', histogram, RESPONSE_SIZE_BUCKETS))
+    lines.extend(["# HELP sprint_hub_request_phase_seconds_total Time spent per request phase (phases can nest).", "# TYPE sprint_hub_request_phase_seconds_total counter"])
+    for (route, phase), spent in sorted(phases.items()):
+      lines.append(f'sprint_hub_request_phase_seconds_total{{route="{route}",phase="{phase}"}} {spent:.6f}')
+    lines.extend(["# HELP sprint_hub_request_files_total Files read from disk or queued for writing by requests.", "# TYPE sprint_hub_request_files_total counter"])
+    for (route, kind), touched in sorted(files.items()):
+      lines.append(f'sprint_hub_request_files_total{{route="{route}",kind="{kind}"}} {touched}')
+    for name, help_text in (
+      ("disk_read_bytes", "Bytes read from disk by the content cache."),
+      ("disk_reads", "Files read from disk by the content cache."),
+      ("disk_written_bytes", "Bytes written to disk by the writer and the backlog journal."),
+      ("disk_writes", "Files written to disk by the writer and the backlog journal."),
+      ("write_failures", "Queued writes dropped after a permanent error or too many retries."),
+      ("requests_rejected_busy", "Requests answered 503 because the worker queue or the event stream slots were full."),
+      ("requests_rejected_too_large", "Requests answered 413 because the body exceeded the route limit."),
+    ):
+      lines.extend([f"# HELP sprint_hub_{name}_total {help_text}", f"# TYPE sprint_hub_{name}_total counter", f"sprint_hub_{name}_total {counters[name]}"])
+    caches = {
+      "content": (cache_hits, cache_misses),
+      "sprint_model": (counters["sprint_model_hits"], counters["sprint_model_misses"]),
+    }
+    lines.extend(["# HELP sprint_hub_cache_requests_total Cache lookups by result.", "# TYPE sprint_hub_cache_requests_total counter"])
+    for cache, (hits, misses) in caches.items():
+      lines.append(f'sprint_hub_cache_requests_total{{cache="{cache}",result="hit"}} {hits}')
+      lines.append(f'sprint_hub_cache_requests_total{{cache="{cache}",result="miss"}} {misses}')
+    lines.extend(["# HELP sprint_hub_cache_hit_ratio Hits over lookups since start.", "# TYPE sprint_hub_cache_hit_ratio gauge"])
+    for cache, (hits, misses) in caches.items():
+      lines.append(f'sprint_hub_cache_hit_ratio{{cache="{cache}"}} {hits / (hits + misses) if hits + misses else 0:.4f}')
+    for name, read in sorted(self.gauges.items()):
+      lines.extend([f"# TYPE sprint_hub_{name} gauge", f"sprint_hub_{name} {read()}"])
+    lines.extend([
+      "# HELP sprint_hub_content_cache_bytes Bytes held by the content cache.",
+      "# TYPE sprint_hub_content_cache_bytes gauge",
+      f"sprint_hub_content_cache_bytes {cache_bytes}",
+      "# HELP sprint_hub_write_queue_pending Paths waiting for the background writer.",
+      "# TYPE sprint_hub_write_queue_pending gauge",
+      f"sprint_hub_write_queue_pending {writer['pending']}",
+      "# HELP sprint_hub_writes_coalesced_total Queued writes replaced by a newer write of the same path.",
+      "# TYPE sprint_hub_writes_coalesced_total counter",
+      f"sprint_hub_writes_coalesced_total {writer['coalesced']}",
+      "# HELP sprint_hub_write_errors_total Failed background write attempts.",
+      "# TYPE sprint_hub_write_errors_total counter",
+      f"sprint_hub_write_errors_total {writer['errors']}",
+    ])
+    return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
+
+
+def begin_request_metrics():
+  request_context.started = time.perf_counter()
+  request_context.phases = {}
+  request_context.files = {"read": 0, "write": 0}
+
+
+@contextmanager
+def timed(phase: str):
+  phases = getattr(request_context, "phases", None)
+  if phases is None:
+    yield
+    return
+  started = time.perf_counter()
+  try:
+    yield
+  finally:
+    phases[phase] = phases.get(phase, 0.0) + time.perf_counter() - started
+
+
+def note_file_access(kind: str):
+  files = getattr(request_context, "files", None)
+  if files is not None:
+    files[kind] += 1
+
+
+def server_timing_header() -> str:
+  phases = getattr(request_context, "phases", None) or {}
+  parts = [f"{phase};dur={spent * 1000:.1f}" for phase, spent in phases.items()]
+  files = getattr(request_context, "files", None)
+  if files and (files["read"] or files["write"]):
+    parts.append(f'files;desc="read={files["read"]} write={files["write"]}"')
+  parts.append(f"total;dur={(time.perf_counter() - request_context.started) * 1000:.1f}")
+  return ", ".join(parts)
+
+
+def metrics_route(path: str, status: int) -> str:
+  if status == 404:
+    return "not_found"
+  path = urlparse(path).path
+  return path if path.startswith("/api/") else "static"
+
+
+def start_request_profile():
+  if SLOW_REQUEST_MS <= 0:
+    return None
+  profiler = cProfile.Profile()
+  try:
+    profiler.enable()
+  except ValueError:
+    return None
+  return profiler
+
+
+def dump_slow_request(profiler, method: str, route: str, seconds: float):
+  SLOW_REQUEST_DIR.mkdir(parents=True, exist_ok=True)
+  name = f"{time.strftime('%Y%m%d-%H%M%S')}-{int(seconds * 1000)}ms-{method}-{re.sub(r'[^a-zA-Z0-9]+', '-', route).strip('-')}"
+  profiler.dump_stats(str(SLOW_REQUEST_DIR / f"{name}.prof"))
+  summary = io.StringIO()
+  pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(25)
+  (SLOW_REQUEST_DIR / f"{name}.txt").write_text(summary.getvalue(), encoding="utf-8")
+  print(f"Slow request {method} {route}: {seconds * 1000:.0f} ms, profile in {SLOW_REQUEST_DIR / name}.prof", flush=True)
+  dumps = sorted(SLOW_REQUEST_DIR.glob("*.prof"))
+  for old in dumps[:-SLOW_REQUEST_KEEP]:
+    old.unlink(missing_ok=True)
+    old.with_suffix(".txt").unlink(missing_ok=True)
+
+
+def write_text_file(path: Path, content: str, wait: bool = False) -> int:
+  revision = file_writer.write(path, content)
+  note_file_access("write")
+  search_index.touch(path)
+  change_feed.publish(path, getattr(request_context, "origin", ""))
+  if wait:
+    with timed("wait"):
+      file_writer.wait(revision, since=revision - 1)
+  return revision
+
+
+def write_text_files(items: list, wait: bool = False) -> int:
+  revision = file_writer.write_many(items, atomic=True)
+  origin = getattr(request_context, "origin", "")
+  for path, _ in items:
+    note_file_access("write")
+    search_index.touch(path)
+    change_feed.publish(path, origin)
+  if wait:
+    with timed("wait"):
+      file_writer.wait(revision, since=revision - len(items))
+  return revision
+
+
+def delete_file(path: Path) -> int:
+  revision = file_writer.delete(path)
+  search_index.touch(path)
+  change_feed.publish(path, getattr(request_context, "origin", ""))
+  file_writer.wait(revision, since=revision - 1)
+  return revision
+
+
+def file_exists(path: Path) -> bool:
+  queued, content = file_writer.lookup(path)
+  if queued:
+    return content is not None
+  return path.is_file()
+
+
+def write_text_if_changed(path: Path, content: str) -> bool:
+  data = str(content or "").encode("utf-8")
+  queued, pending = file_writer.lookup(path)
+  if queued:
+    if pending is not None and pending.encode("utf-8") == data:
+      return False
+    write_text_file(path, content)
+    return True
+  try:
+    if path.is_file() and path.stat().st_size == len(data) and path.read_bytes() == data:
+      return False
+  except OSError:
+    pass
+  write_text_file(path, content)
+  return True
 
 
 def safe_name(name: str) -> str:
@@ -110,20 +1087,71 @@ def replace_nickname_line(content: str, nickname: str) -> str:
   return "\n".join(out).rstrip() + "\n"
 
 
-def list_team_members():
+def parse_team_area_from_content(content: str) -> str:
+  for raw in str(content or "").splitlines():
+    m = re.match(r"^\s*(?:Area|Área)\s*:\s*(.*)$", raw, flags=re.IGNORECASE)
+    if m:
+      return normalize_team_area(m.group(1))
+  return ""
+
+
+def parse_team_active_from_content(content: str) -> bool:
+  for raw in str(content or "").splitlines():
+    m = re.match(r"^\s*Ativo\s*:\s*(.*)$", raw, flags=re.IGNORECASE)
+    if m:
+      return js_trim(m.group(1)).lower() in ("sim", "yes", "true", "1")
+  return False
+
+
+def parse_team_average_score(content: str):
+  in_score_block = False
+  scores = []
+  for raw in str(content or "").splitlines():
+    line = js_trim(raw)
+    if not line:
+      continue
+    if line.lower() == "placar tech innovation":
+      in_score_block = True
+      continue
+    if not in_score_block:
+      continue
+    if re.match(r"^#{1,6}\s+", line):
+      break
+    m = re.match(r"^[^:]+:\s*(-?\d+(?:[.,]\d+)?)$", line)
+    if m:
+      scores.append(float(m.group(1).replace(",", ".")))
+  if not scores:
+    return None
+  return sum(scores) / len(scores)
+
+
+def parse_team_member_fields(path: Path, content: str):
+  return {
+    "name": parse_member_name_from_content(path, content),
+    "nickname": parse_nickname_from_content(content),
+    "area": parse_team_area_from_content(content),
+    "active": parse_team_active_from_content(content),
+    "averageScore": parse_team_average_score(content),
+  }
+
+
+def iter_team_members(summary: bool = False):
   TEAM_DIR.mkdir(parents=True, exist_ok=True)
-  members = []
   for path in sorted(TEAM_DIR.glob("*.md")):
-    content = path.read_text(encoding="utf-8", errors="ignore")
-    members.append(
-      {
-        "path": path.name,
-        "name": parse_member_name_from_content(path, content),
-        "nickname": parse_nickname_from_content(content),
-        "content": content,
-      }
-    )
-  return members
+    fields = content_cache.derive(path, "member", lambda content: parse_team_member_fields(path, content))
+    if summary:
+      yield {"path": path.name, **fields}
+      continue
+    yield {
+      "path": path.name,
+      "name": fields["name"],
+      "nickname": fields["nickname"],
+      "content": read_text_cached(path),
+    }
+
+
+def list_team_members(summary: bool = False):
+  return list(iter_team_members(summary))
 
 
 def parse_sprint_code(name: str):
@@ -192,6 +1220,278 @@ def parse_project_tasks_from_sprint_markdown(content: str):
   return tasks
 
 
+LINE_SPLIT_RE = re.compile(r"\r?\n")
+WHITESPACE_RE = re.compile(r"\s+")
+ISO_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+TOPIC_HEADING_RE = re.compile(r"^(.*?)\s*\[project:([^\]]+)\]\s*$", re.IGNORECASE)
+SPRINT_TITLE_PREFIX_RE = re.compile(r"^Sprint\s+", re.IGNORECASE)
+GOAL_RE = re.compile(r"^Goal:\s*", re.IGNORECASE)
+TOPIC_RE = re.compile(r"^##\s+")
+CHECKBOX_ITEM_RE = re.compile(r"^- \[([ xX])\]\s+")
+BULLET_ITEM_RE = re.compile(r"^- ")
+STATUS_LINE_RE = re.compile(r"^Status:\s*", re.IGNORECASE)
+START_DATE_LINE_RE = re.compile(r"^Start Date:\s*", re.IGNORECASE)
+DELIVERY_DATE_LINE_RE = re.compile(r"^Delivery Date:\s*", re.IGNORECASE)
+ITEM_BLOCKED_REASON_RE = re.compile(r"\[BLOCKED\s*:\s*([^\]]+)\]", re.IGNORECASE)
+ITEM_FEATURE_RE = re.compile(r"\[FEATURE\s*:\s*([^\]]+)\]", re.IGNORECASE)
+ITEM_STATUS_RE = re.compile(r"\[STATUS\s*:\s*([^\]]+)\]", re.IGNORECASE)
+ITEM_AREA_RE = re.compile(r"\[AREA\s*:\s*([^\]]+)\]", re.IGNORECASE)
+ITEM_FLAG_RE = re.compile(r"\[(HIGH|BLOCKED|FOLLOWED)\]", re.IGNORECASE)
+ITEM_TAG_STRIP_RES = [
+  re.compile(r"\s*\[FEATURE\s*:\s*[^\]]+\]", re.IGNORECASE),
+  re.compile(r"\s*\[STATUS\s*:\s*[^\]]+\]", re.IGNORECASE),
+  re.compile(r"\s*\[AREA\s*:\s*[^\]]+\]", re.IGNORECASE),
+  re.compile(r"\s*\[BLOCKED\s*:\s*[^\]]+\]", re.IGNORECASE),
+  re.compile(r"\s*\[(HIGH|BLOCKED|FOLLOWED)\]", re.IGNORECASE),
+]
+ITEM_RESPONSIBLES_RE = re.compile(r"^(.*)\(([^()]*)\)\s*$")
+RESPONSIBLES_SPLIT_RE = re.compile(r"\s*\+\s*|\s*,\s*")
+ASCII_LETTER_RE = re.compile(r"[A-Za-z]")
+
+
+def js_trim(value) -> str:
+  return str(value or "").strip().strip("\ufeff").strip()
+
+
+def normalize_project_key(raw) -> str:
+  return WHITESPACE_RE.sub(" ", js_trim(raw))
+
+
+def normalize_project_status(raw) -> str:
+  value = js_trim(raw).lower()
+  if not value:
+    return ""
+  for status in PROJECT_STATUS_OPTIONS:
+    if status.lower() == value:
+      return status
+  return ""
+
+
+def normalize_topic_date(value) -> str:
+  date = js_trim(value)
+  return date if ISO_DATE_RE.fullmatch(date) else ""
+
+
+def normalize_team_area(value) -> str:
+  raw = WHITESPACE_RE.sub(" ", js_trim(value).lower())
+  if not raw:
+    return ""
+  if raw in TEAM_AREA_ALIASES:
+    return TEAM_AREA_ALIASES[raw]
+  for area in TEAM_AREAS:
+    if area.lower() == raw:
+      return area
+  return ""
+
+
+def normalize_task_flow_status(value) -> str:
+  raw = js_trim(value).lower()
+  return raw if raw in ("open", "doing", "testing") else ""
+
+
+def normalize_task_areas(value):
+  raw_values = value if isinstance(value, list) else [entry.strip() for entry in str(value or "").split(",")]
+  areas = []
+  for entry in raw_values:
+    area = normalize_team_area(entry)
+    if area and area not in areas:
+      areas.append(area)
+  return areas
+
+
+def parse_item_text_and_responsibles(raw_text: str):
+  text = js_trim(raw_text)
+  parsed = {
+    "text": text,
+    "responsibles": [],
+    "priority": "normal",
+    "blocked": False,
+    "blockedReason": "",
+    "followed": False,
+    "featureName": "",
+    "status": "",
+    "areas": [],
+  }
+
+  blocked_reason_m = ITEM_BLOCKED_REASON_RE.search(text)
+  if blocked_reason_m:
+    parsed["blocked"] = True
+    parsed["blockedReason"] = js_trim(blocked_reason_m.group(1))
+  feature_m = ITEM_FEATURE_RE.search(text)
+  if feature_m:
+    parsed["featureName"] = js_trim(feature_m.group(1))
+  status_m = ITEM_STATUS_RE.search(text)
+  if status_m:
+    parsed["status"] = normalize_task_flow_status(status_m.group(1))
+  area_m = ITEM_AREA_RE.search(text)
+  if area_m:
+    parsed["areas"] = normalize_task_areas(area_m.group(1))
+  for flag in ITEM_FLAG_RE.findall(text):
+    flag = flag.upper()
+    if flag == "HIGH":
+      parsed["priority"] = "high"
+    elif flag == "BLOCKED":
+      parsed["blocked"] = True
+    elif flag == "FOLLOWED":
+      parsed["followed"] = True
+  for strip_re in ITEM_TAG_STRIP_RES:
+    text = strip_re.sub("", text)
+  text = js_trim(text)
+  parsed["text"] = text
+
+  m = ITEM_RESPONSIBLES_RE.match(text)
+  if not m:
+    return parsed
+  body = js_trim(m.group(1))
+  names_raw = js_trim(m.group(2))
+  if not ASCII_LETTER_RE.search(names_raw):
+    return parsed
+  responsibles = [js_trim(name) for name in RESPONSIBLES_SPLIT_RE.split(names_raw) if js_trim(name)]
+  if not responsibles:
+    return parsed
+  parsed["text"] = body or text
+  parsed["responsibles"] = responsibles
+  return parsed
+
+
+def new_sprint_topic(title: str = "Updates", project_key: str = ""):
+  return {
+    "title": title,
+    "projectKey": project_key,
+    "status": "",
+    "startDate": "",
+    "deliveryDate": "",
+    "description": "",
+    "items": [],
+  }
+
+
+def parse_sprint_markdown(file_name: str, markdown: str):
+  name = re.sub(r"\.md$", "", str(file_name or ""), flags=re.IGNORECASE)
+  goal = ""
+  topics = []
+  current_topic = None
+
+  def ensure_topic():
+    nonlocal current_topic
+    if current_topic is None:
+      current_topic = new_sprint_topic()
+      topics.append(current_topic)
+    return current_topic
+
+  for raw_line in LINE_SPLIT_RE.split(str(markdown or "")):
+    line = js_trim(raw_line)
+    if not line:
+      continue
+
+    if line.startswith("# "):
+      value = js_trim(line[2:])
+      name = js_trim(SPRINT_TITLE_PREFIX_RE.sub("", value, count=1)) or name
+      continue
+
+    if GOAL_RE.match(line):
+      goal = js_trim(GOAL_RE.sub("", line, count=1))
+      continue
+
+    if TOPIC_RE.match(line):
+      heading = js_trim(TOPIC_RE.sub("", line, count=1))
+      heading_m = TOPIC_HEADING_RE.match(heading)
+      if heading_m:
+        title = js_trim(heading_m.group(1)) or heading
+        project_key = normalize_project_key(heading_m.group(2))
+      else:
+        title, project_key = heading, ""
+      current_topic = new_sprint_topic(title, project_key)
+      topics.append(current_topic)
+      continue
+
+    checkbox_m = CHECKBOX_ITEM_RE.match(line)
+    if checkbox_m or BULLET_ITEM_RE.match(line):
+      topic = ensure_topic()
+      if checkbox_m:
+        done = checkbox_m.group(1) in ("x", "X")
+        body = line[checkbox_m.end():]
+      else:
+        done = False
+        body = line[2:]
+      parsed = parse_item_text_and_responsibles(body)
+      if parsed["text"]:
+        topic["items"].append(
+          {
+            "text": parsed["text"],
+            "done": done,
+            "projectKey": topic["projectKey"],
+            "responsibles": parsed["responsibles"],
+            "status": parsed["status"],
+            "areas": parsed["areas"],
+            "priority": parsed["priority"],
+            "blocked": parsed["blocked"],
+            "blockedReason": parsed["blockedReason"],
+            "followed": parsed["followed"],
+            "featureName": parsed["featureName"],
+          }
+        )
+      continue
+
+    if STATUS_LINE_RE.match(line):
+      ensure_topic()["status"] = normalize_project_status(STATUS_LINE_RE.sub("", line, count=1))
+      continue
+    if START_DATE_LINE_RE.match(line):
+      ensure_topic()["startDate"] = normalize_topic_date(START_DATE_LINE_RE.sub("", line, count=1))
+      continue
+    if DELIVERY_DATE_LINE_RE.match(line):
+      ensure_topic()["deliveryDate"] = normalize_topic_date(DELIVERY_DATE_LINE_RE.sub("", line, count=1))
+      continue
+
+    topic = ensure_topic()
+    topic["description"] = js_trim(f"{topic['description']} {line}") if topic["description"] else line
+
+  return {
+    "name": name,
+    "goal": goal,
+    "fileName": file_name,
+    "topics": topics,
+  }
+
+
+_sprint_models_lock = threading.Lock()
+_sprint_models = OrderedDict()
+
+
+def remember_sprint_model(file_name: str, model: dict):
+  with _sprint_models_lock:
+    _sprint_models[(file_name, model["revision"])] = model
+    while len(_sprint_models) > SPRINT_MODEL_CACHE_SIZE:
+      _sprint_models.popitem(last=False)
+
+
+def parse_sprint_file(path: Path):
+  revision = content_cache.derive(path, "revision", content_revision)
+  key = (path.name, revision)
+  with _sprint_models_lock:
+    model = _sprint_models.get(key)
+    if model is not None:
+      _sprint_models.move_to_end(key)
+  if model is not None:
+    metrics.count("sprint_model_hits")
+    return model
+  metrics.count("sprint_model_misses")
+  with timed("parse"):
+    model = parse_sprint_markdown(path.name, read_text_cached(path))
+  model["revision"] = revision
+  remember_sprint_model(path.name, model)
+  return model
+
+
+def load_sprint_source(path_name: str):
+  path = Path(path_name)
+  stamp = file_stamp(path)
+  content = path.read_text(encoding="utf-8", errors="ignore")
+  model = parse_sprint_markdown(path.name, content)
+  model["revision"] = content_revision(content)
+  return stamp, content, model
+
+
 def build_project_sprints_markdown(project_name: str, sprint_topics: dict):
   lines = [
     f"# Sprints - {project_name}",
@@ -295,124 +1595,1984 @@ def ensure_project_support_files():
     ensure_project_control_file(path)
 
 
-def sync_project_sprints_files(files: list):
-  PROJECTS_DIR.mkdir(parents=True, exist_ok=True)
-  ensure_project_support_files()
-  sprint_topics_by_project = {}
-  dedupe_by_project = {}
+def parse_timeline_markdown(content: str):
+  entries = []
+  current = None
+  desc_lines = []
+  for raw in str(content or "").splitlines():
+    line = raw.rstrip()
+    heading = re.match(r"^##\s+(\d{4}-\d{2}-\d{2})\s+-\s+(.+)$", line)
+    if heading:
+      if current:
+        entries.append({**current, "description": js_trim(" ".join(desc_lines))})
+      current = {"date": heading.group(1), "name": js_trim(heading.group(2))}
+      desc_lines = []
+      continue
+    if not current:
+      continue
+    if not line.strip():
+      if desc_lines:
+        desc_lines.append("")
+      continue
+    desc_lines.append(line.strip())
+  if current:
+    entries.append({**current, "description": js_trim(" ".join(desc_lines))})
+  return sorted((entry for entry in entries if entry["name"]), key=lambda entry: (entry["date"], entry["name"]))
 
-  for file_data in files:
-    sprint_name = safe_name(str(file_data.get("name", "")).replace(".md", ""))
-    if not is_sprint_after_threshold(sprint_name):
+
+def parse_features_markdown(content: str):
+  entries = []
+  current = None
+  desc_lines = []
+  for raw in str(content or "").splitlines():
+    line = js_trim(raw)
+    if not line:
+      if current and desc_lines:
+        desc_lines.append("")
+      continue
+    if re.match(r"^#\s+", line):
+      continue
+    if not current and re.match(r"^_.*_$", line):
+      continue
+    feature = re.match(r"^##\s+(.+)$", line)
+    if feature:
+      if current:
+        entries.append({**current, "description": js_trim(" ".join(desc_lines))})
+      current = {"name": js_trim(feature.group(1))}
+      desc_lines = []
       continue
+    if current:
+      desc_lines.append(line)
+  if current:
+    entries.append({**current, "description": js_trim(" ".join(desc_lines))})
+  return [entry for entry in entries if entry["name"]]
 
-    content = str(file_data.get("content", ""))
-    for project_key, topic_name, done, body in parse_project_tasks_from_sprint_markdown(content):
-      project_name = str(project_key or "").strip()
-      if not project_name:
+
+def parse_project_control(content: str):
+  try:
+    control = json.loads(content or "{}")
+  except ValueError:
+    return None
+  return control if isinstance(control, dict) else None
+
+
+PROJECT_BUNDLE_PARSERS = {
+  TIMELINE_FILE_NAME: ("timeline", parse_timeline_markdown),
+  PROJECT_FEATURES_FILE_NAME: ("features", parse_features_markdown),
+  PROJECT_CONTROL_FILE_NAME: ("control", parse_project_control),
+}
+PROJECT_BUNDLE_FILES = {
+  "timeline": TIMELINE_FILE_NAME,
+  "features": PROJECT_FEATURES_FILE_NAME,
+  "control": PROJECT_CONTROL_FILE_NAME,
+  "sprints": PROJECT_SPRINTS_FILE_NAME,
+}
+
+
+def project_file_entry(rel: str, path: Path, with_content: bool = True):
+  if not file_exists(path):
+    return None
+  content = read_text_cached(path)
+  entry = {"path": rel, "revision": content_cache.derive(path, "revision", content_revision)}
+  if with_content:
+    entry["content"] = content
+  return entry
+
+
+def read_project_bundle(project: str, include: list, with_content: bool = True):
+  key = safe_rel_projects_path(project).rstrip("/")
+  project_dir = resolve_projects_file(key)
+  bundle = {"project": key, "files": {}}
+  for part in include:
+    name = PROJECT_BUNDLE_FILES[part]
+    path = project_dir / name
+    entry = project_file_entry(f"{key}/{name}", path, with_content)
+    bundle["files"][name] = entry
+    if name in PROJECT_BUNDLE_PARSERS:
+      field, parse = PROJECT_BUNDLE_PARSERS[name]
+      bundle[field] = content_cache.derive(path, field, parse) if entry else None
+  return bundle
+
+
+def project_bundle_paths(projects: list, include: list, paths: list):
+  out = []
+  for project in projects:
+    project_dir = resolve_projects_file(safe_rel_projects_path(project).rstrip("/"))
+    out.extend(project_dir / PROJECT_BUNDLE_FILES[part] for part in include)
+  out.extend(resolve_projects_file(safe_rel_projects_path(rel)) for rel in paths)
+  return out
+
+
+_project_sprints_lock = threading.Lock()
+_project_sprints_index = None
+
+
+def load_project_sprints_index():
+  try:
+    payload = json.loads(read_text_cached(PROJECT_SPRINTS_INDEX_FILE))
+  except (OSError, ValueError):
+    return None
+  if not isinstance(payload, dict):
+    return None
+  if payload.get("version") != PROJECT_SPRINTS_INDEX_VERSION or payload.get("after") != PROJECT_SPRINTS_FROM:
+    return None
+  sprints = payload.get("sprints")
+  if not isinstance(sprints, dict):
+    return None
+  return {name: entry for name, entry in sprints.items() if isinstance(entry, dict)}
+
+
+def save_project_sprints_index(sprints: dict):
+  CACHE_DIR.mkdir(parents=True, exist_ok=True)
+  payload = {
+    "version": PROJECT_SPRINTS_INDEX_VERSION,
+    "after": PROJECT_SPRINTS_FROM,
+    "sprints": sprints,
+  }
+  write_text_if_changed(PROJECT_SPRINTS_INDEX_FILE, json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+
+
+def collect_project_sprint_topics(project_name: str, sprint_order: list, sprints: dict):
+  sprint_topics = {}
+  seen = set()
+  for sprint_name in sprint_order:
+    for project_key, topic_name, done, body in sprints[sprint_name]["tasks"]:
+      if str(project_key or "").strip() != project_name:
         continue
       task_line = f"- [{'x' if done else ' '}] {body}"
       dedupe_key = (sprint_name, topic_name, task_line)
-      seen = dedupe_by_project.setdefault(project_name, set())
       if dedupe_key in seen:
         continue
       seen.add(dedupe_key)
-      project_map = sprint_topics_by_project.setdefault(project_name, {})
-      sprint_map = project_map.setdefault(sprint_name, {})
+      sprint_map = sprint_topics.setdefault(sprint_name, {})
       sprint_map.setdefault(topic_name, []).append(task_line)
+  return sprint_topics
 
-  synced = 0
-  for path in sorted(PROJECTS_DIR.iterdir()):
-    if not path.is_dir():
-      continue
-    project_name = path.name
-    ensure_project_timeline_file(path)
-    content = build_project_sprints_markdown(project_name, sprint_topics_by_project.get(project_name, {}))
-    out = path / "sprints.md"
-    out.write_text(content, encoding="utf-8", newline="\n")
-    synced += 1
+
+def write_project_sprints_file(project_dir: Path, sprint_order: list, sprints: dict) -> bool:
+  project_name = project_dir.name
+  content = build_project_sprints_markdown(project_name, collect_project_sprint_topics(project_name, sprint_order, sprints))
+  return write_text_if_changed(project_dir / PROJECT_SPRINTS_FILE_NAME, content)
+
+
+@timed("sync")
+def sync_project_sprints_files(files: list, partial: bool = False):
+  global _project_sprints_index
+  PROJECTS_DIR.mkdir(parents=True, exist_ok=True)
+  with _project_sprints_lock:
+    previous = _project_sprints_index
+    if previous is None:
+      previous = load_project_sprints_index()
+    full_rebuild = previous is None
+    previous = previous or {}
+    if full_rebuild and partial:
+      files = read_sprint_files()
+      partial = False
+
+    sprints = {}
+    if partial:
+      present = {path.stem for path in sprint_file_paths()}
+      sprints = {name: entry for name, entry in previous.items() if name in present}
+    seen = set()
+    affected = set()
+    for file_data in files:
+      sprint_name = safe_name(str(file_data.get("name", "")).replace(".md", ""))
+      if not is_sprint_after_threshold(sprint_name) or sprint_name in seen:
+        continue
+      seen.add(sprint_name)
+      content = str(file_data.get("content", ""))
+      revision = content_revision(content)
+      entry = previous.get(sprint_name)
+      if not entry or entry.get("revision") != revision:
+        tasks = [list(task) for task in parse_project_tasks_from_sprint_markdown(content)]
+        old_tasks = (entry or {}).get("tasks") or []
+        affected.update(str(task[0] or "").strip() for task in old_tasks)
+        affected.update(str(task[0] or "").strip() for task in tasks)
+        entry = {"revision": revision, "tasks": tasks}
+      sprints[sprint_name] = entry
+    for sprint_name, entry in previous.items():
+      if sprint_name not in sprints:
+        affected.update(str(task[0] or "").strip() for task in entry.get("tasks") or [])
+    sprint_order = sorted(sprints, key=sprint_sort_key)
+
+    if full_rebuild:
+      ensure_project_support_files()
+      project_dirs = [path for path in sorted(PROJECTS_DIR.iterdir()) if path.is_dir()]
+    else:
+      project_dirs = []
+      for project_name in sorted(name for name in affected if name):
+        path = PROJECTS_DIR / project_name
+        if path.is_dir():
+          ensure_project_timeline_file(path)
+          ensure_project_features_file(path)
+          ensure_project_control_file(path)
+          project_dirs.append(path)
+
+    synced = 0
+    for path in project_dirs:
+      if write_project_sprints_file(path, sprint_order, sprints):
+        synced += 1
+
+    _project_sprints_index = sprints
+    save_project_sprints_index(sprints)
   return synced
 
 
+def ensure_project_sprints_file(project_dir: Path):
+  if not project_dir.exists() or not project_dir.is_dir():
+    return
+  if (project_dir / PROJECT_SPRINTS_FILE_NAME).exists():
+    return
+  with _project_sprints_lock:
+    sprints = _project_sprints_index
+    if sprints is None:
+      sprints = load_project_sprints_index() or {}
+    sprint_order = sorted(sprints.keys(), key=sprint_sort_key)
+    write_project_sprints_file(project_dir, sprint_order, sprints)
+
+
+_projects_tree_lock = threading.Lock()
+_projects_tree = {"dirs": {}, "revision": "", "listing": None}
+
+
+def projects_rel_parts(rel: str):
+  return rel.split("/")
+
+
+def join_projects_rel(parent: str, name: str) -> str:
+  return f"{parent}/{name}" if parent else name
+
+
+def projects_dir_path(rel: str) -> Path:
+  return PROJECTS_DIR / rel if rel else PROJECTS_DIR
+
+
+def projects_dir_mtime(rel: str):
+  stamp = file_stamp(projects_dir_path(rel))
+  return stamp[0] if stamp else None
+
+
+def scan_projects_dir(rel: str):
+  path = projects_dir_path(rel)
+  entry = {"mtime": path.stat().st_mtime_ns, "dirs": [], "files": {}}
+  with os.scandir(path) as items:
+    for item in items:
+      if item.is_dir():
+        entry["dirs"].append(item.name)
+      elif item.is_file() and not item.name.startswith(TEMP_FILE_PREFIX):
+        stat = item.stat()
+        entry["files"][item.name] = (stat.st_size, stat.st_mtime_ns)
+  entry["dirs"].sort()
+  return entry
+
+
+def drop_projects_subtree(dirs: dict, rel: str):
+  prefix = f"{rel}/"
+  for key in [key for key in dirs if key == rel or key.startswith(prefix)]:
+    dirs.pop(key, None)
+
+
+def refresh_projects_tree():
+  PROJECTS_DIR.mkdir(parents=True, exist_ok=True)
+  with _projects_tree_lock:
+    dirs = _projects_tree["dirs"]
+    stale = [rel for rel, entry in dirs.items() if entry["mtime"] is None or projects_dir_mtime(rel) != entry["mtime"]]
+    if "" not in dirs:
+      stale.append("")
+    changed = bool(stale)
+    while stale:
+      rel = stale.pop()
+      old = dirs.get(rel)
+      try:
+        entry = scan_projects_dir(rel)
+      except OSError:
+        drop_projects_subtree(dirs, rel)
+        continue
+      dirs[rel] = entry
+      for name in entry["dirs"]:
+        child = join_projects_rel(rel, name)
+        if child not in dirs:
+          stale.append(child)
+      for name in set(old["dirs"] if old else []) - set(entry["dirs"]):
+        drop_projects_subtree(dirs, join_projects_rel(rel, name))
+    if changed or _projects_tree["listing"] is None:
+      all_dirs = sorted((rel for rel in dirs if rel), key=projects_rel_parts)
+      all_files = sorted(
+        (join_projects_rel(rel, name) for rel, entry in dirs.items() for name in entry["files"]),
+        key=projects_rel_parts,
+      )
+      _projects_tree["listing"] = {"dirs": all_dirs, "files": all_files}
+      _projects_tree["revision"] = content_revision(json.dumps([all_dirs, all_files], ensure_ascii=False))
+    return _projects_tree["revision"], _projects_tree["listing"]
+
+
+def invalidate_projects_tree(path: Path):
+  try:
+    rel = path.resolve().relative_to(PROJECTS_DIR.resolve()).as_posix()
+  except ValueError:
+    return
+  parts = [] if rel == "." else rel.split("/")
+  with _projects_tree_lock:
+    for i in range(len(parts)):
+      entry = _projects_tree["dirs"].get("/".join(parts[:i]))
+      if entry:
+        entry["mtime"] = None
+
+
+def list_projects_folder(rel: str, depth: int):
+  refresh_projects_tree()
+  with _projects_tree_lock:
+    dirs = _projects_tree["dirs"]
+    if rel not in dirs:
+      return None
+    entries = []
+    pending = deque([(rel, 1)])
+    while pending:
+      current, level = pending.popleft()
+      entry = dirs.get(current)
+      if not entry:
+        continue
+      for name in entry["dirs"]:
+        child = join_projects_rel(current, name)
+        child_entry = dirs.get(child)
+        entries.append({"path": child, "type": "dir", "mtime": child_entry["mtime"] if child_entry else None})
+        if level < depth:
+          pending.append((child, level + 1))
+      for name, (size, mtime) in sorted(entry["files"].items()):
+        entries.append({"path": join_projects_rel(current, name), "type": "file", "mtime": mtime, "size": size})
+  entries.sort(key=lambda item: projects_rel_parts(item["path"]))
+  return entries
+
+
+def sprint_file_paths():
+  SPRINTS_DIR.mkdir(parents=True, exist_ok=True)
+  paths = {path.name: path for path in SPRINTS_DIR.glob("*.md")}
+  for path, content in file_writer.queued_in(SPRINTS_DIR):
+    if path.suffix != ".md":
+      continue
+    if content is None:
+      paths.pop(path.name, None)
+    else:
+      paths[path.name] = path
+  return sorted(paths.values())
+
+
+def query_value(query: dict, name: str) -> str:
+  return str((query.get(name) or [""])[0]).strip()
+
+
+def select_sprint_window(query: dict):
+  paths = sorted(sprint_file_paths(), key=lambda path: sprint_sort_key(path.stem))
+  from_name = query_value(query, "from")
+  to_name = query_value(query, "to")
+  cursor = query_value(query, "cursor")
+  latest_raw = query_value(query, "latest")
+  latest = 0
+  if latest_raw:
+    if not latest_raw.isdigit() or int(latest_raw) < 1:
+      raise ValueError("latest must be a positive integer")
+    latest = int(latest_raw)
+  if from_name:
+    paths = [path for path in paths if sprint_sort_key(path.stem) >= sprint_sort_key(safe_name(from_name))]
+  if to_name:
+    paths = [path for path in paths if sprint_sort_key(path.stem) <= sprint_sort_key(safe_name(to_name))]
+  if cursor:
+    paths = [path for path in paths if sprint_sort_key(path.stem) < sprint_sort_key(safe_name(cursor))]
+  total = len(paths)
+  if latest:
+    paths = paths[-latest:]
+  next_cursor = paths[0].stem if paths and len(paths) < total else ""
+  return paths, {"total": total, "returned": len(paths), "nextCursor": next_cursor}
+
+
+def sprint_file_entry(path: Path):
+  return {
+    "name": path.name,
+    "content": read_text_cached(path),
+    "revision": content_cache.derive(path, "revision", content_revision),
+  }
+
+
+def read_sprint_files(paths=None):
+  return [sprint_file_entry(path) for path in (sprint_file_paths() if paths is None else paths)]
+
+
+class SprintEditConflict(ValueError):
+  def __init__(self, message: str, sprints=()):
+    super().__init__(message)
+    self.sprints = list(sprints)
+
+
+class TextEditConflict(ValueError):
+  def __init__(self, message: str, revision: str):
+    super().__init__(message)
+    self.revision = revision
+
+
+_text_edit_lock = threading.Lock()
+
+
+def apply_text_edits(content: str, edits) -> str:
+  if not isinstance(edits, list):
+    raise ValueError("Invalid edits payload")
+  ranges = []
+  for edit in edits:
+    if not isinstance(edit, dict):
+      raise ValueError("Invalid edit")
+    start = int(edit.get("start", 0))
+    ranges.append((start, int(edit.get("end", start)), str(edit.get("text", ""))))
+  data = bytearray(content.encode("utf-16-le"))
+  end_before = len(data) // 2
+  for start, end, text in sorted(ranges, reverse=True):
+    if not 0 <= start <= end <= end_before:
+      raise ValueError("Edit range out of bounds or overlapping")
+    data[start * 2:end * 2] = text.encode("utf-16-le")
+    end_before = start
+  try:
+    return data.decode("utf-16-le")
+  except UnicodeDecodeError:
+    raise ValueError("Edit splits a character") from None
+
+
+def save_text_file(path: Path, payload: dict):
+  with _text_edit_lock:
+    if "edits" in payload:
+      if not file_exists(path):
+        raise ValueError("File not found")
+      current = content_cache.derive(path, "revision", content_revision)
+      if str(payload.get("base", "")) != current:
+        raise TextEditConflict("File changed on disk", current)
+      content = apply_text_edits(read_text_cached(path), payload.get("edits"))
+    else:
+      content = str(payload.get("content", ""))
+    write_revision = write_text_file(path, content)
+    return write_revision, content_cache.derive(path, "revision", content_revision)
+
+
+_sprint_edit_lock = threading.Lock()
+
+
+def sprint_file_path(name: str) -> Path:
+  path = SPRINTS_DIR / f"{safe_name(str(name or '').replace('.md', ''))}.md"
+  if not file_exists(path):
+    raise ValueError(f"Sprint not found: {name}")
+  return path
+
+
+def map_sprint_lines(lines: list):
+  topics = []
+  current = None
+  for i, raw_line in enumerate(lines):
+    line = js_trim(raw_line)
+    if not line or line.startswith("# ") or GOAL_RE.match(line):
+      continue
+    if TOPIC_RE.match(line):
+      current = {"start": i, "heading": line, "items": []}
+      topics.append(current)
+      continue
+    checkbox_m = CHECKBOX_ITEM_RE.match(line)
+    if checkbox_m or BULLET_ITEM_RE.match(line):
+      body = line[checkbox_m.end():] if checkbox_m else line[2:]
+      if not parse_item_text_and_responsibles(body)["text"]:
+        continue
+      if current is None:
+        current = {"start": i, "heading": "", "items": []}
+        topics.append(current)
+      current["items"].append(i)
+  for index, topic in enumerate(topics):
+    topic["end"] = topics[index + 1]["start"] if index + 1 < len(topics) else len(lines)
+  return topics
+
+
+def sprint_topic_at(topics: list, index, expect: str = ""):
+  if not isinstance(index, int) or not 0 <= index < len(topics):
+    raise SprintEditConflict(f"Topic not found: {index}")
+  topic = topics[index]
+  if expect and js_trim(expect) != topic["heading"]:
+    raise SprintEditConflict("Topic changed on disk")
+  return topic
+
+
+def sprint_item_line(lines: list, topics: list, topic_index, item_index, expect: str = "") -> int:
+  items = sprint_topic_at(topics, topic_index)["items"]
+  if not isinstance(item_index, int) or not 0 <= item_index < len(items):
+    raise SprintEditConflict(f"Item not found: {item_index}")
+  line_no = items[item_index]
+  if expect and js_trim(expect) != js_trim(lines[line_no]):
+    raise SprintEditConflict("Item changed on disk")
+  return line_no
+
+
+def sprint_item_markdown(line: str) -> str:
+  text = js_trim(line)
+  checkbox_m = CHECKBOX_ITEM_RE.match(text)
+  if "\n" in text or not (checkbox_m or BULLET_ITEM_RE.match(text)):
+    raise ValueError("Item line must be a single '- [ ] ...' line")
+  body = text[checkbox_m.end():] if checkbox_m else text[2:]
+  if not parse_item_text_and_responsibles(body)["text"]:
+    raise ValueError("Item text is required")
+  return text
+
+
+def sprint_topic_markdown(markdown: str) -> list:
+  block = str(markdown or "").replace("\r\n", "\n").replace("\r", "\n").strip()
+  lines = block.split("\n")
+  topics = map_sprint_lines(lines)
+  if not TOPIC_RE.match(lines[0]) or len(topics) != 1:
+    raise ValueError("Topic markdown must contain exactly one '## ' heading")
+  return lines + [""]
+
+
+def insert_sprint_topic(lines: list, block: list, index=None, expect_count=None) -> list:
+  topics = map_sprint_lines(lines)
+  if isinstance(expect_count, int) and expect_count != len(topics):
+    raise SprintEditConflict("Topics changed on disk")
+  if index is None or index == len(topics):
+    while lines and not lines[-1].strip():
+      lines.pop()
+    return lines + [""] + block
+  if not isinstance(index, int) or not 0 <= index < len(topics):
+    raise SprintEditConflict(f"Topic position not found: {index}")
+  start = topics[index]["start"]
+  return lines[:start] + block + lines[start:]
+
+
+def remove_sprint_topic(lines: list, index, expect: str = ""):
+  topic = sprint_topic_at(map_sprint_lines(lines), index, expect)
+  block = "\n".join(lines[topic["start"]:topic["end"]]).strip().split("\n") + [""]
+  return lines[:topic["start"]] + lines[topic["end"]:], block
+
+
+def read_sprint_lines(path: Path) -> list:
+  return read_text_cached(path).split("\n")
+
+
+def write_sprint_lines(path: Path, lines: list) -> str:
+  content = "\n".join(lines).rstrip() + "\n"
+  write_text_if_changed(path, content)
+  return content_revision(content)
+
+
+def apply_sprint_op(buffers: dict, op: str, payload: dict):
+  def lines_of(path: Path):
+    if path not in buffers:
+      buffers[path] = read_sprint_lines(path)
+    return buffers[path]
+
+  if op == "topic/move":
+    source = sprint_file_path(payload.get("from"))
+    target = sprint_file_path(payload.get("to"))
+    buffers[source], block = remove_sprint_topic(lines_of(source), payload.get("topic"), str(payload.get("expect", "")))
+    buffers[target] = insert_sprint_topic(lines_of(target), block, payload.get("index"), payload.get("targetTopics"))
+    return
+  path = sprint_file_path(payload.get("sprint"))
+  lines = lines_of(path)
+  expect = str(payload.get("expect", ""))
+  if op == "item/toggle":
+    line_no = sprint_item_line(lines, map_sprint_lines(lines), payload.get("topic"), payload.get("item"), expect)
+    raw_line = lines[line_no]
+    text = js_trim(raw_line)
+    checkbox_m = CHECKBOX_ITEM_RE.match(text)
+    body = text[checkbox_m.end():] if checkbox_m else text[2:]
+    indent = raw_line[:len(raw_line) - len(raw_line.lstrip())]
+    lines[line_no] = f"{indent}- [{'x' if payload.get('done') else ' '}] {body}"
+  elif op == "item/save":
+    line_no = sprint_item_line(lines, map_sprint_lines(lines), payload.get("topic"), payload.get("item"), expect)
+    lines[line_no] = sprint_item_markdown(str(payload.get("line", "")))
+  elif op == "topic/add":
+    buffers[path] = insert_sprint_topic(lines, sprint_topic_markdown(payload.get("markdown")), payload.get("index"), payload.get("topics"))
+  elif op == "topic/remove":
+    buffers[path], _ = remove_sprint_topic(lines, payload.get("topic"), expect)
+  else:
+    raise ValueError(f"Unknown sprint operation: {op}")
+
+
+def apply_sprint_edits(ops: list):
+  if not isinstance(ops, list) or not ops:
+    raise ValueError("ops must be a non-empty list")
+  if len(ops) > SPRINT_EDIT_MAX_OPS:
+    raise ValueError(f"At most {SPRINT_EDIT_MAX_OPS} sprint operations per request")
+  with _sprint_edit_lock:
+    buffers = {}
+    for op in ops:
+      if not isinstance(op, dict):
+        raise ValueError("Invalid sprint operation")
+      try:
+        apply_sprint_op(buffers, str(op.get("op", "")), op)
+      except SprintEditConflict as exc:
+        raise SprintEditConflict(str(exc), sorted({str(op[key]) for key in ("sprint", "from", "to") if op.get(key)})) from exc
+    revisions = {path.stem: write_sprint_lines(path, lines) for path, lines in buffers.items()}
+    changed = [path for path in buffers if is_sprint_after_threshold(path.stem)]
+    synced_projects = 0
+    if changed:
+      synced_projects = sync_project_sprints_files([sprint_file_entry(path) for path in changed], partial=True)
+  return {
+    "ok": True,
+    "applied": len(ops),
+    "revisions": revisions,
+    "synced_project_sprints": synced_projects,
+    "write_revision": file_writer.latest(),
+  }
+
+
+def backlog_item_index(items: list, item_id: str) -> int:
+  for index, item in enumerate(items):
+    if isinstance(item, dict) and str(item.get("id") or "") == item_id:
+      return index
+  return -1
+
+
+def apply_backlog_op(items: list, op: dict):
+  if not isinstance(op, dict):
+    raise ValueError("Invalid backlog operation")
+  kind = op.get("op")
+  if kind == "replace":
+    if not isinstance(op.get("items"), list):
+      raise ValueError("Backlog replace needs an items list")
+    items[:] = [item for item in op["items"] if isinstance(item, dict)]
+    return
+  if kind == "order":
+    ids = [str(item_id) for item_id in op.get("ids") or []]
+    rank = {item_id: index for index, item_id in enumerate(ids)}
+    items.sort(key=lambda item: rank.get(str(item.get("id") or ""), len(ids)))
+    return
+  item = op.get("item")
+  item_id = str(op.get("id") or (item.get("id") if isinstance(item, dict) else "") or "")
+  if not item_id:
+    raise ValueError("Backlog operation needs an item id")
+  index = backlog_item_index(items, item_id)
+  if kind in ("add", "update"):
+    if not isinstance(item, dict):
+      raise ValueError("Backlog operation needs an item")
+    item = {**item, "id": item_id}
+    if index >= 0:
+      items[index] = item
+    elif kind == "add" and isinstance(op.get("index"), int):
+      items.insert(max(0, min(op["index"], len(items))), item)
+    else:
+      items.append(item)
+  elif kind in ("move", "delete"):
+    if index >= 0:
+      items.pop(index)
+  else:
+    raise ValueError(f"Unknown backlog operation: {kind}")
+
+
+def backlog_ops_diff(previous: list, items: list) -> list:
+  before_ids = [str(item.get("id") or "") for item in previous]
+  ids = [str(item.get("id") or "") for item in items]
+  if not all(before_ids + ids) or len(set(before_ids)) != len(before_ids) or len(set(ids)) != len(ids):
+    return [] if previous == items else [{"op": "replace", "items": items}]
+  before = dict(zip(before_ids, previous))
+  after = set(ids)
+  ops = [{"op": "delete", "id": item_id} for item_id in before_ids if item_id not in after]
+  for index, (item_id, item) in enumerate(zip(ids, items)):
+    if item_id not in before:
+      ops.append({"op": "add", "id": item_id, "index": index, "item": item})
+    elif before[item_id] != item:
+      ops.append({"op": "update", "id": item_id, "item": item})
+  if [item_id for item_id in before_ids if item_id in after] != [item_id for item_id in ids if item_id in before]:
+    ops.append({"op": "order", "ids": ids})
+  return ops
+
+
+class BacklogStore:
+  def __init__(self):
+    self.lock = threading.RLock()
+    self.items = None
+    self.stamp = None
+    self.ops = []
+    self.error = ""
+    self.view_revision = None
+    self.timer = None
+    self.compacting = False
+
+  def _read_journal(self):
+    try:
+      raw = BACKLOG_JOURNAL_FILE.read_text(encoding="utf-8")
+    except OSError:
+      return [], False
+    ops = []
+    lines = raw.split("\n")
+    torn = bool(lines[-1])
+    for line in lines[:-1]:
+      try:
+        op = json.loads(line)
+      except ValueError:
+        torn = True
+        break
+      ops.append(op)
+    return ops, torn
+
+  def _write_journal(self, ops: list):
+    if ops:
+      atomic_write_text(BACKLOG_JOURNAL_FILE, "".join(json.dumps(op, ensure_ascii=False) + "\n" for op in ops))
+    else:
+      BACKLOG_JOURNAL_FILE.unlink(missing_ok=True)
+
+  def _load(self):
+    stamp = file_stamp(BACKLOG_FILE)
+    if self.items is not None and stamp == self.stamp:
+      return
+    base = self.items if self.items is not None else []
+    error = ""
+    if file_exists(BACKLOG_FILE):
+      try:
+        payload = content_cache.derive(BACKLOG_FILE, "json", json.loads)
+        if not isinstance(payload, dict) or not isinstance(payload.get("items"), list):
+          raise ValueError("missing items list")
+        base = payload["items"]
+      except (OSError, ValueError) as exc:
+        error = f"{BACKLOG_FILE.name} could not be read: {exc}"
+    elif self.items is None:
+      base = []
+    ops, torn = self._read_journal()
+    items = [dict(item) for item in base if isinstance(item, dict)]
+    for op in ops:
+      try:
+        apply_backlog_op(items, op)
+      except ValueError:
+        continue
+    if torn:
+      self._write_journal(ops)
+    self.items = items
+    self.stamp = stamp
+    self.ops = ops
+    self.error = error
+    self.view_revision = None
+    if ops and not error:
+      self._schedule()
+
+  def view(self) -> list:
+    with self.lock:
+      self._load()
+      return list(self.items)
+
+  def revision(self) -> str:
+    with self.lock:
+      self._load()
+      if self.view_revision is None:
+        self.view_revision = content_revision(json.dumps(self.items, ensure_ascii=False, sort_keys=True))
+      return self.view_revision
+
+  def snapshot(self):
+    with self.lock:
+      return self.view(), self.revision(), self.error
+
+  def check_writable(self):
+    with self.lock:
+      self._load()
+      if self.error:
+        raise ValueError(f"{self.error}; repair it before editing the backlog")
+
+  def status(self) -> dict:
+    with self.lock:
+      self._load()
+      return {"items": len(self.items), "journal": len(self.ops), "error": self.error}
+
+  def append(self, ops: list) -> str:
+    if not isinstance(ops, list) or not ops:
+      raise ValueError("ops must be a non-empty list")
+    with self.lock:
+      self.check_writable()
+      previous = self.revision()
+      items = list(self.items)
+      for op in ops:
+        apply_backlog_op(items, op)
+      BACKLOG_JOURNAL_FILE.parent.mkdir(parents=True, exist_ok=True)
+      lines = "".join(json.dumps(op, ensure_ascii=False) + "\n" for op in ops)
+      with timed("disk"), BACKLOG_JOURNAL_FILE.open("a", encoding="utf-8", newline="\n") as handle:
+        handle.write(lines)
+        handle.flush()
+        os.fsync(handle.fileno())
+      metrics.count("disk_writes")
+      metrics.count("disk_written_bytes", len(lines.encode("utf-8")))
+      note_file_access("write")
+      self.items = items
+      self.ops.extend(ops)
+      self.view_revision = None
+      self._schedule()
+      update = {"previous": previous, "revision": self.revision(), "ops": ops}
+    change_feed.publish(BACKLOG_FILE, getattr(request_context, "origin", ""), update)
+    return update["revision"]
+
+  def replace(self, items) -> bool:
+    items = [item for item in items if isinstance(item, dict)] if isinstance(items, list) else []
+    with self.lock:
+      self.check_writable()
+      ops = backlog_ops_diff(self.items, items)
+    if not ops:
+      return False
+    self.append(ops)
+    return True
+
+  def _schedule(self):
+    if self.timer:
+      self.timer.cancel()
+    delay = 0 if len(self.ops) >= BACKLOG_COMPACT_OPS else BACKLOG_COMPACT_IDLE_SECONDS
+    self.timer = threading.Timer(delay, self.compact)
+    self.timer.daemon = True
+    self.timer.start()
+
+  def compact(self) -> bool:
+    with self.lock:
+      self._load()
+      if not self.ops or self.error or self.compacting:
+        return False
+      self.compacting = True
+      count = len(self.ops)
+      content = json.dumps({"items": self.items}, ensure_ascii=False, indent=2)
+    try:
+      BACKLOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+      revision = write_text_file(BACKLOG_FILE, content)
+      try:
+        durable = file_writer.wait(revision, WRITE_WAIT_MAX_SECONDS, revision - 1)
+      except WriteFailed:
+        durable = False
+      with self.lock:
+        if durable:
+          self.ops = self.ops[count:]
+          self._write_journal(self.ops)
+          self.stamp = file_stamp(BACKLOG_FILE)
+        return durable
+    finally:
+      with self.lock:
+        self.compacting = False
+
+
+backlog_store = BacklogStore()
+
+
 def read_backlog_items():
-  if not BACKLOG_FILE.exists() or not BACKLOG_FILE.is_file():
-    return []
+  return backlog_store.view()
+
+
+def write_backlog_items(items) -> bool:
+  return backlog_store.replace(items)
+
+
+TASK_STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+  source TEXT PRIMARY KEY,
+  revision TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sprints (
+  name TEXT PRIMARY KEY,
+  source TEXT NOT NULL,
+  sort_key TEXT NOT NULL,
+  goal TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS topics (
+  id INTEGER PRIMARY KEY,
+  source TEXT NOT NULL,
+  sprint TEXT NOT NULL,
+  position INTEGER NOT NULL,
+  title TEXT NOT NULL,
+  project_key TEXT NOT NULL COLLATE NOCASE,
+  status TEXT NOT NULL,
+  start_date TEXT NOT NULL,
+  delivery_date TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS items (
+  id INTEGER PRIMARY KEY,
+  source TEXT NOT NULL,
+  sprint TEXT,
+  sort_key TEXT,
+  topic_id INTEGER,
+  position INTEGER NOT NULL,
+  backlog_id TEXT,
+  text TEXT NOT NULL,
+  done INTEGER NOT NULL,
+  project_key TEXT NOT NULL COLLATE NOCASE,
+  status TEXT NOT NULL,
+  priority TEXT NOT NULL,
+  blocked INTEGER NOT NULL,
+  blocked_reason TEXT NOT NULL,
+  followed INTEGER NOT NULL,
+  feature TEXT NOT NULL COLLATE NOCASE
+);
+CREATE TABLE IF NOT EXISTS item_responsibles (
+  item_id INTEGER NOT NULL REFERENCES items(id) ON DELETE CASCADE,
+  responsible TEXT NOT NULL COLLATE NOCASE
+);
+CREATE TABLE IF NOT EXISTS item_areas (
+  item_id INTEGER NOT NULL REFERENCES items(id) ON DELETE CASCADE,
+  area TEXT NOT NULL COLLATE NOCASE
+);
+CREATE TABLE IF NOT EXISTS projects (
+  key TEXT PRIMARY KEY COLLATE NOCASE,
+  source TEXT NOT NULL,
+  status TEXT NOT NULL,
+  data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_source ON items(source);
+CREATE INDEX IF NOT EXISTS items_sort_key ON items(sort_key);
+CREATE INDEX IF NOT EXISTS items_project ON items(project_key, sort_key);
+CREATE INDEX IF NOT EXISTS items_status ON items(status, sort_key);
+CREATE INDEX IF NOT EXISTS items_feature ON items(feature, sort_key);
+CREATE INDEX IF NOT EXISTS items_blocked ON items(blocked, sort_key);
+CREATE INDEX IF NOT EXISTS topics_source ON topics(source);
+CREATE INDEX IF NOT EXISTS item_responsibles_name ON item_responsibles(responsible, item_id);
+CREATE INDEX IF NOT EXISTS item_responsibles_item ON item_responsibles(item_id);
+CREATE INDEX IF NOT EXISTS item_areas_name ON item_areas(area, item_id);
+CREATE INDEX IF NOT EXISTS item_areas_item ON item_areas(item_id);
+"""
+
+
+def sprint_order_key(name: str) -> str:
+  major, minor, label = sprint_sort_key(name)
+  return f"{major:03d}-{minor:03d}-{label}"
+
+
+class TaskStore:
+  def __init__(self, path: Path):
+    self.path = path
+    self.conn = None
+    self.lock = threading.Lock()
+
+  def _open(self):
+    conn = sqlite3.connect(str(self.path), check_same_thread=False)
+    try:
+      if conn.execute("PRAGMA user_version").fetchone()[0] not in (0, TASK_STORE_VERSION):
+        raise sqlite3.DatabaseError("Task store version changed")
+      conn.execute("PRAGMA foreign_keys = ON")
+      conn.execute("PRAGMA journal_mode = WAL")
+      conn.execute("PRAGMA synchronous = NORMAL")
+      conn.executescript(TASK_STORE_SCHEMA)
+      conn.execute(f"PRAGMA user_version = {TASK_STORE_VERSION}")
+    except BaseException:
+      conn.close()
+      raise
+    return conn
+
+  def _reset(self):
+    if self.conn is not None:
+      self.conn.close()
+      self.conn = None
+    for suffix in ("", "-wal", "-shm"):
+      Path(f"{self.path}{suffix}").unlink(missing_ok=True)
+
+  def _connect(self):
+    if self.conn is not None:
+      return self.conn
+    self.path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+      conn = self._open()
+    except sqlite3.DatabaseError:
+      self._reset()
+      conn = self._open()
+    self.conn = conn
+    return conn
+
+  def sources(self):
+    sources = {f"sprint:{path.stem}": path for path in sprint_file_paths()}
+    sources["backlog"] = BACKLOG_FILE
+    if PROJECTS_DIR.is_dir():
+      for path in PROJECTS_DIR.glob(f"*/{PROJECT_CONTROL_FILE_NAME}"):
+        sources[f"project:{path.parent.name}"] = path
+    return sources
+
+  def _drop(self, conn, source: str):
+    for table in ("items", "topics", "sprints", "projects", "sources"):
+      conn.execute(f"DELETE FROM {table} WHERE source = ?", (source,))
+
+  def _insert_item(self, conn, source: str, item: dict, position: int, sprint=None, topic_id=None, backlog_id=None):
+    cursor = conn.execute(
+      "INSERT INTO items (source, sprint, sort_key, topic_id, position, backlog_id, text, done, project_key, status, priority, blocked, blocked_reason, followed, feature)"
+      " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+      (
+        source,
+        sprint,
+        sprint_order_key(sprint) if sprint else None,
+        topic_id,
+        position,
+        backlog_id,
+        str(item.get("text") or ""),
+        1 if item.get("done") else 0,
+        normalize_project_key(item.get("projectKey")),
+        normalize_task_flow_status(item.get("status")),
+        "high" if item.get("priority") == "high" else "normal",
+        1 if item.get("blocked") else 0,
+        str(item.get("blockedReason") or ""),
+        1 if item.get("followed") else 0,
+        js_trim(item.get("featureName")),
+      ),
+    )
+    item_id = cursor.lastrowid
+    responsibles = item.get("responsibles") if isinstance(item.get("responsibles"), list) else []
+    conn.executemany(
+      "INSERT INTO item_responsibles (item_id, responsible) VALUES (?, ?)",
+      [(item_id, js_trim(name)) for name in responsibles if js_trim(name)],
+    )
+    conn.executemany(
+      "INSERT INTO item_areas (item_id, area) VALUES (?, ?)",
+      [(item_id, area) for area in normalize_task_areas(item.get("areas") or [])],
+    )
+
+  def _load(self, conn, source: str, path: Path):
+    if source.startswith("sprint:"):
+      model = parse_sprint_file(path)
+      conn.execute(
+        "INSERT OR REPLACE INTO sprints (name, source, sort_key, goal) VALUES (?, ?, ?, ?)",
+        (path.stem, source, sprint_order_key(path.stem), model["goal"]),
+      )
+      for topic_index, topic in enumerate(model["topics"]):
+        topic_id = conn.execute(
+          "INSERT INTO topics (source, sprint, position, title, project_key, status, start_date, delivery_date) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+          (source, path.stem, topic_index, topic["title"], topic["projectKey"], topic["status"], topic["startDate"], topic["deliveryDate"]),
+        ).lastrowid
+        for item_index, item in enumerate(topic["items"]):
+          self._insert_item(conn, source, item, item_index, sprint=path.stem, topic_id=topic_id)
+    elif source == "backlog":
+      for position, item in enumerate(read_backlog_items()):
+        if isinstance(item, dict):
+          self._insert_item(conn, source, item, position, backlog_id=str(item.get("id") or ""))
+    else:
+      try:
+        data = content_cache.derive(path, "json", json.loads)
+      except ValueError:
+        data = {}
+      data = data if isinstance(data, dict) else {}
+      conn.execute(
+        "INSERT OR REPLACE INTO projects (key, source, status, data) VALUES (?, ?, ?, ?)",
+        (path.parent.name, source, normalize_project_status(data.get("status")), json.dumps(data, ensure_ascii=False)),
+      )
+
+  def sync(self) -> int:
+    try:
+      return self._sync()
+    except sqlite3.DatabaseError:
+      with self.lock:
+        self._reset()
+      return self._sync()
+
+  def _sync(self) -> int:
+    sources = self.sources()
+    with self.lock:
+      conn = self._connect()
+      known = dict(conn.execute("SELECT source, revision FROM sources"))
+      changed = 0
+      with conn:
+        for source in set(known) - set(sources):
+          self._drop(conn, source)
+          changed += 1
+        for source, path in sources.items():
+          try:
+            revision = backlog_store.revision() if source == "backlog" else content_cache.derive(path, "revision", content_revision)
+          except OSError:
+            continue
+          if known.get(source) == revision:
+            continue
+          self._drop(conn, source)
+          self._load(conn, source, path)
+          conn.execute("INSERT INTO sources (source, revision) VALUES (?, ?)", (source, revision))
+          changed += 1
+      return changed
+
+  @timed("sqlite")
+  def query(self, filters: dict, sprint_range=None, offset: int = 0, limit: int = TASK_QUERY_LIMIT):
+    self.sync()
+    where = []
+    params = []
+    scope = filters.get("scope") or "sprints"
+    if scope == "sprints":
+      where.append("items.sprint IS NOT NULL")
+    elif scope == "backlog":
+      where.append("items.sprint IS NULL")
+    if sprint_range is not None:
+      where.append("items.sort_key BETWEEN ? AND ?")
+      params.extend(sprint_range)
+    if filters.get("responsible"):
+      where.append("items.id IN (SELECT item_id FROM item_responsibles WHERE responsible = ?)")
+      params.append(filters["responsible"])
+    if filters.get("area"):
+      where.append("items.id IN (SELECT item_id FROM item_areas WHERE area = ?)")
+      params.append(normalize_team_area(filters["area"]) or filters["area"])
+    for name, column in (("status", "items.status"), ("project", "items.project_key"), ("feature", "items.feature")):
+      if filters.get(name):
+        where.append(f"{column} = ?")
+        params.append(filters[name].lower() if name == "status" else filters[name])
+    for name, column in (("blocked", "items.blocked"), ("done", "items.done"), ("followed", "items.followed")):
+      if filters.get(name) in ("0", "1"):
+        where.append(f"{column} = ?")
+        params.append(int(filters[name]))
+    if filters.get("high") in ("0", "1"):
+      where.append("items.priority = ?")
+      params.append("high" if filters["high"] == "1" else "normal")
+    if filters.get("projectStatus"):
+      where.append("items.project_key IN (SELECT key FROM projects WHERE status = ?)")
+      params.append(normalize_project_status(filters["projectStatus"]))
+    clause = f"WHERE {' AND '.join(where)}" if where else ""
+    with self.lock:
+      conn = self._connect()
+      total = conn.execute(f"SELECT COUNT(*) FROM items {clause}", params).fetchone()[0]
+      rows = conn.execute(
+        "SELECT items.id, items.sprint, topics.title, topics.position, items.position, items.backlog_id, items.text, items.done,"
+        " items.project_key, projects.status, items.status, items.priority, items.blocked, items.blocked_reason, items.followed, items.feature,"
+        " (SELECT group_concat(responsible, char(31)) FROM item_responsibles WHERE item_id = items.id),"
+        " (SELECT group_concat(area, char(31)) FROM item_areas WHERE item_id = items.id)"
+        f" FROM items LEFT JOIN topics ON topics.id = items.topic_id LEFT JOIN projects ON projects.key = items.project_key {clause}"
+        " ORDER BY items.sort_key DESC, topics.position, items.position LIMIT ? OFFSET ?",
+        params + [limit, offset],
+      ).fetchall()
+    items = []
+    for row in rows:
+      items.append(
+        {
+          "sprint": row[1],
+          "topic": row[2],
+          "topicIndex": row[3],
+          "itemIndex": row[4],
+          "backlogId": row[5],
+          "text": row[6],
+          "done": bool(row[7]),
+          "projectKey": row[8],
+          "projectStatus": row[9] or "",
+          "status": row[10],
+          "priority": row[11],
+          "blocked": bool(row[12]),
+          "blockedReason": row[13],
+          "followed": bool(row[14]),
+          "featureName": row[15],
+          "responsibles": row[16].split("\x1f") if row[16] else [],
+          "areas": row[17].split("\x1f") if row[17] else [],
+        }
+      )
+    return total, items
+
+
+task_store = TaskStore(TASK_STORE_FILE)
+
+
+ROLLUP_GROUPS = ("projects", "responsibles", "areas", "statuses")
+ROLLUP_FIELDS = ("items", "done", "blocked", "high", "carriedOver")
+
+
+def rollup_counts():
+  return {"totals": [0] * len(ROLLUP_FIELDS), **{group: {} for group in ROLLUP_GROUPS}}
+
+
+def rollup_add(counts: dict, row: tuple, values: list):
+  _, project, responsibles, areas, status = row[:5]
+  targets = [counts["totals"]]
+  for group, keys in (("projects", [project]), ("responsibles", responsibles), ("areas", areas), ("statuses", [status or "none"])):
+    for key in keys:
+      targets.append(counts[group].setdefault(key, [0] * len(ROLLUP_FIELDS)))
+  for target in targets:
+    for i, value in enumerate(values):
+      target[i] += value
+
+
+def rollup_merge(left: dict, right: dict, sign: int = 1):
+  merged = {"totals": [a + sign * b for a, b in zip(left["totals"], right["totals"])]}
+  for group in ROLLUP_GROUPS:
+    values = {key: list(counts) for key, counts in left[group].items()}
+    for key, counts in right[group].items():
+      current = values.setdefault(key, [0] * len(ROLLUP_FIELDS))
+      for i, value in enumerate(counts):
+        current[i] += sign * value
+    merged[group] = {key: counts for key, counts in values.items() if any(counts)}
+  return merged
+
+
+def rollup_payload(counts: dict):
+  payload = {"totals": dict(zip(ROLLUP_FIELDS, counts["totals"]))}
+  for group in ROLLUP_GROUPS:
+    payload[group] = {key: dict(zip(ROLLUP_FIELDS, values)) for key, values in sorted(counts[group].items())}
+  return payload
+
+
+def sprint_rollup_rows(model: dict):
+  rows = []
+  for topic in model["topics"]:
+    for item in topic["items"]:
+      project = normalize_project_key(item.get("projectKey") or topic.get("projectKey"))
+      rows.append(
+        (
+          (project.lower(), js_trim(item.get("text")).lower()),
+          project,
+          tuple(dict.fromkeys(js_trim(name) for name in item.get("responsibles") or [] if js_trim(name))),
+          tuple(item.get("areas") or []),
+          item.get("status") or "",
+          bool(item.get("done")),
+          bool(item.get("blocked")),
+          item.get("priority") == "high",
+        )
+      )
+  return rows
+
+
+class RollupIndex:
+  def __init__(self):
+    self.order = []
+    self.entries = {}
+    self.prefix = []
+    self.lock = threading.Lock()
+
+  def _build(self, path: Path, revision: str):
+    rows = sprint_rollup_rows(parse_sprint_file(path))
+    base = rollup_counts()
+    for row in rows:
+      rollup_add(base, row, [1, int(row[5]), int(row[6]), int(row[7]), 0])
+    return {
+      "revision": revision,
+      "rows": rows,
+      "base": base,
+      "open": {row[0] for row in rows if not row[5]},
+      "sprint": base,
+    }
+
+  def refresh(self):
+    paths = sorted(sprint_file_paths(), key=lambda path: sprint_sort_key(path.stem))
+    names = [path.stem for path in paths]
+    with self.lock:
+      stale = set()
+      for name in set(self.entries) - set(names):
+        self.entries.pop(name, None)
+      for path in paths:
+        try:
+          revision = content_cache.derive(path, "revision", content_revision)
+        except OSError:
+          continue
+        entry = self.entries.get(path.stem)
+        if entry is None or entry["revision"] != revision:
+          self.entries[path.stem] = self._build(path, revision)
+          stale.add(path.stem)
+      order = [name for name in names if name in self.entries]
+      recarry = set()
+      for i, name in enumerate(order):
+        if name in stale or i >= len(self.order) or self.order[i] != name:
+          recarry.update((i, i + 1))
+      if len(order) != len(self.order):
+        recarry.add(len(order))
+      self.order = order
+      if not recarry:
+        return
+      dirty = min(recarry)
+      del self.prefix[dirty:]
+      for i in range(dirty, len(self.order)):
+        entry = self.entries[self.order[i]]
+        if i in recarry:
+          previous_open = self.entries[self.order[i - 1]]["open"] if i else set()
+          carry = rollup_counts()
+          for row in entry["rows"]:
+            if row[0] in previous_open:
+              rollup_add(carry, row, [0, 0, 0, 0, 1])
+          entry["sprint"] = rollup_merge(entry["base"], carry)
+        self.prefix.append(rollup_merge(self.prefix[-1], entry["sprint"]) if self.prefix else entry["sprint"])
+
+  @timed("rollup")
+  def window(self, names: list, per_sprint: bool = False):
+    self.refresh()
+    with self.lock:
+      positions = [self.order.index(name) for name in names if name in self.entries]
+      if not positions:
+        counts = rollup_counts()
+      elif positions[0]:
+        counts = rollup_merge(self.prefix[positions[-1]], self.prefix[positions[0] - 1], -1)
+      else:
+        counts = self.prefix[positions[-1]]
+      payload = rollup_payload(counts)
+      if per_sprint:
+        payload["sprints"] = []
+        for i in positions:
+          counts = self.entries[self.order[i]]["sprint"]
+          payload["sprints"].append(
+            {
+              "name": self.order[i],
+              **dict(zip(ROLLUP_FIELDS, counts["totals"])),
+              "projects": {key: dict(zip(ROLLUP_FIELDS, values)) for key, values in sorted(counts["projects"].items())},
+            }
+          )
+    return payload
+
+
+rollup_index = RollupIndex()
+
+
+def sprint_topics_diff(old_topics: list, new_topics: list):
+  old_keys = [json.dumps(topic, sort_keys=True, ensure_ascii=False) for topic in old_topics]
+  new_keys = [json.dumps(topic, sort_keys=True, ensure_ascii=False) for topic in new_topics]
+  ops = []
+  for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, old_keys, new_keys, autojunk=False).get_opcodes():
+    if tag != "equal":
+      ops.append({"op": tag, "from": [i1, i2], "to": [j1, j2], "topics": new_topics[j1:j2]})
+  return ops
+
+
+class ChangeFeed:
+  def __init__(self):
+    self.seq = 0
+    self.events = deque(maxlen=CHANGE_HISTORY_SIZE)
+    self.known = {}
+    self.sprint_models = {}
+    self.snapshot = {}
+    self.publish_lock = threading.Lock()
+    self.cond = threading.Condition()
+    self.listeners = []
+
+  def kind_of(self, path: Path):
+    try:
+      rel = path.resolve().relative_to(ROOT_DIR.resolve())
+    except ValueError:
+      return None
+    parts = rel.parts
+    if parts[0] == "projects":
+      return "project", rel.as_posix()
+    if parts[0] != "tech" or len(parts) < 2:
+      return None
+    if parts[1] == "sprints" and len(parts) == 3 and path.suffix == ".md":
+      return "sprint", rel.as_posix()
+    if parts[1] == "team":
+      return "team", rel.as_posix()
+    if path == BACKLOG_FILE:
+      return "backlog", rel.as_posix()
+    return "tech", rel.as_posix()
+
+  def publish(self, path: Path, origin: str = "", update=None):
+    target = self.kind_of(path)
+    if not target:
+      return
+    kind, rel = target
+    key = str(path.resolve())
+    with self.publish_lock:
+      try:
+        revision = backlog_store.revision() if path == BACKLOG_FILE else content_revision(read_text_cached(path))
+      except OSError:
+        revision = None
+      previous = self.known.get(key)
+      if key in self.known and previous == revision:
+        return
+      self.known[key] = revision
+      event = {"kind": kind, "path": rel, "revision": revision, "previous": previous, "deleted": revision is None, "origin": origin}
+      if kind == "sprint":
+        event["name"] = path.stem
+        old_model = self.sprint_models.pop(path.stem, None)
+        old_topics = old_model["topics"] if old_model else []
+        if revision is not None:
+          model = parse_sprint_file(path)
+          self.sprint_models[path.stem] = model
+          event["goal"] = model["goal"]
+          event["diff"] = sprint_topics_diff(old_topics, model["topics"])
+      elif kind == "backlog":
+        event["error"] = backlog_store.status()["error"]
+        if update and update["revision"] == revision:
+          event["previous"] = update["previous"]
+          event["ops"] = update["ops"]
+      with self.cond:
+        self.seq += 1
+        event["seq"] = self.seq
+        self.events.append(event)
+        self.cond.notify_all()
+      for listener in list(self.listeners):
+        listener()
+
+  def latest(self) -> int:
+    with self.cond:
+      return self.seq
+
+  def resume_seq(self, last_id: str) -> int:
+    last_id = str(last_id or "").strip()
+    return int(last_id) if last_id.isdigit() else self.latest()
+
+  def wait_events(self, after: int, timeout: float):
+    with self.cond:
+      if after > self.seq:
+        return [], True
+      self.cond.wait_for(lambda: self.seq > after, timeout)
+      if self.events and self.events[0]["seq"] > after + 1:
+        return [], True
+      return [event for event in self.events if event["seq"] > after], False
+
+  def scan(self):
+    stamps = {}
+    stack = [ROOT_DIR / "tech", PROJECTS_DIR]
+    while stack:
+      directory = stack.pop()
+      try:
+        items = list(os.scandir(directory))
+      except OSError:
+        continue
+      for item in items:
+        if item.name.startswith("."):
+          continue
+        if item.is_dir(follow_symlinks=False):
+          stack.append(item.path)
+        elif item.is_file():
+          stat = item.stat()
+          stamps[str(Path(item.path).resolve())] = (stat.st_mtime_ns, stat.st_size)
+    return stamps
+
+  def seed(self):
+    with self.publish_lock:
+      for path in sprint_file_paths():
+        try:
+          model = parse_sprint_file(path)
+        except OSError:
+          continue
+        self.known[str(path.resolve())] = model["revision"]
+        self.sprint_models[path.stem] = model
+    self.snapshot = self.scan()
+
+  def poll_forever(self):
+    self.seed()
+    while True:
+      time.sleep(CHANGE_POLL_SECONDS)
+      current = self.scan()
+      previous = self.snapshot
+      for key in sorted(set(previous) | set(current)):
+        if previous.get(key) != current.get(key):
+          path = Path(key)
+          search_index.touch(path)
+          invalidate_projects_tree(path)
+          self.publish(path)
+      self.snapshot = current
+
+
+change_feed = ChangeFeed()
+
+
+def change_event_frames(events: list, reset: bool, seq: int):
+  frames = []
+  if reset:
+    seq = change_feed.latest()
+    frames.append(f"id: {seq}\nevent: reset\ndata: {{}}\n\n")
+  elif not events:
+    frames.append(": keepalive\n\n")
+  for event in events:
+    seq = event["seq"]
+    data = json.dumps(event, ensure_ascii=False, separators=(",", ":"))
+    frames.append(f"id: {seq}\nevent: change\ndata: {data}\n\n")
+  return "".join(frames).encode("utf-8"), seq
+
+
+def restore_projects_tree(dirs: dict):
+  with _projects_tree_lock:
+    if _projects_tree["dirs"]:
+      return
+    _projects_tree["dirs"] = {
+      rel: {"mtime": entry["mtime"], "dirs": list(entry["dirs"]), "files": {name: tuple(value) for name, value in entry["files"].items()}}
+      for rel, entry in dirs.items()
+    }
+    _projects_tree["listing"] = None
+
+
+def warm_start():
+  try:
+    snapshot = json.loads(WARM_START_FILE.read_text(encoding="utf-8"))
+  except (OSError, ValueError):
+    snapshot = {}
+  if not isinstance(snapshot, dict) or snapshot.get("version") != WARM_START_VERSION or snapshot.get("root") != str(ROOT_DIR):
+    snapshot = {}
+  revisions = {}
+  for key, entry in (snapshot.get("files") or {}).items():
+    stamp = tuple(entry.get("stamp") or ())
+    if stamp and file_stamp(Path(key)) == stamp:
+      content_cache.seed(Path(key), stamp, entry["content"], entry.get("derived") or {})
+      revisions[key] = (entry.get("derived") or {}).get("revision")
+  models = snapshot.get("sprints") or {}
+  paths = sprint_file_paths()
+  stale = []
+  for path in paths:
+    model = models.get(path.stem)
+    if model and revisions.get(str(path)) == model.get("revision"):
+      remember_sprint_model(path.name, model)
+    else:
+      stale.append(str(path))
+  if len(stale) >= WARM_START_POOL_THRESHOLD:
+    with ProcessPoolExecutor() as pool:
+      rebuilt = list(pool.map(load_sprint_source, stale))
+  else:
+    rebuilt = [load_sprint_source(path_name) for path_name in stale]
+  for path_name, (stamp, content, model) in zip(stale, rebuilt):
+    if stamp and file_stamp(Path(path_name)) == stamp:
+      content_cache.seed(Path(path_name), stamp, content, {"revision": model["revision"]})
+    remember_sprint_model(Path(path_name).name, model)
+  restore_projects_tree(snapshot.get("tree") or {})
+  search_index.restore(snapshot.get("search") or {})
+  return {"reused": len(paths) - len(stale), "rebuilt": len(stale)}
+
+
+def save_warm_start():
+  with _projects_tree_lock:
+    tree = json.loads(json.dumps(_projects_tree["dirs"]))
+  snapshot = {
+    "version": WARM_START_VERSION,
+    "root": str(ROOT_DIR),
+    "files": content_cache.export(ROOT_DIR / "tech"),
+    "sprints": {path.stem: parse_sprint_file(path) for path in sprint_file_paths()},
+    "tree": tree,
+    "search": search_index.export(),
+  }
+  atomic_write_text(WARM_START_FILE, json.dumps(snapshot, ensure_ascii=False, separators=(",", ":")))
+
+
+def stop_on_signal(signum, frame):
+  raise KeyboardInterrupt
+
+
+def finish_warm_start():
+  search_index.refresh(force=True)
+  refresh_projects_tree()
+  task_store.sync()
+  rollup_index.refresh()
+  save_warm_start()
+
+
+_static_lock = threading.Lock()
+_static_state = {"stamps": None, "routes": {}}
+
+
+def fingerprinted_asset_name(name: str, data: bytes) -> str:
+  stem, ext = name.rsplit(".", 1)
+  return f"{stem}.{hashlib.sha1(data).hexdigest()[:10]}.{ext}"
+
+
+def build_static_asset(data: bytes, content_type: str):
+  return {
+    "type": content_type,
+    "data": data,
+    "gzip": gzip.compress(data, compresslevel=9, mtime=0),
+    "etag": f'"{hashlib.sha1(data).hexdigest()[:20]}"',
+  }
+
+
+def load_static_assets():
+  names = list(STATIC_ASSET_TYPES.keys()) + [STATIC_INDEX_FILE_NAME]
+  stamps = tuple(file_stamp(BASE_DIR / name) for name in names)
+  with _static_lock:
+    if _static_state["stamps"] == stamps:
+      return _static_state["routes"]
+    routes = {}
+    html = (BASE_DIR / STATIC_INDEX_FILE_NAME).read_text(encoding="utf-8")
+    for name, content_type in STATIC_ASSET_TYPES.items():
+      data = (BASE_DIR / name).read_bytes()
+      asset = build_static_asset(data, content_type)
+      hashed = fingerprinted_asset_name(name, data)
+      routes[f"/{name}"] = (asset, False)
+      routes[f"/{hashed}"] = (asset, True)
+      html = re.sub(rf'(src|href)="{re.escape(name)}"', rf'\1="{hashed}"', html)
+    index = build_static_asset(html.encode("utf-8"), "text/html; charset=utf-8")
+    routes["/"] = (index, False)
+    routes[f"/{STATIC_INDEX_FILE_NAME}"] = (index, False)
+    _static_state["stamps"] = stamps
+    _static_state["routes"] = routes
+    return routes
+
+
+def accepts_gzip(header: str) -> bool:
+  for part in str(header or "").split(","):
+    token, _, params = part.strip().partition(";")
+    if token.strip().lower() in ("gzip", "*"):
+      return params.replace(" ", "").lower() not in ("q=0", "q=0.0")
+  return False
+
+
+def request_body_limit(path: str) -> int:
+  return REQUEST_BODY_LIMITS.get(path, REQUEST_BODY_DEFAULT_LIMIT)
+
+
+def read_json_body(rfile, length: int):
+  body = bytearray()
+  while len(body) < length:
+    chunk = rfile.read(min(length - len(body), REQUEST_READ_CHUNK))
+    if not chunk:
+      raise ValueError("Request body ended early")
+    body += chunk
+  return json.loads(body)
+
+
+def busy_response(version: str, keep_alive: bool = False) -> bytes:
+  body = json.dumps({"error": "Server busy, retry shortly", "retry_after": SERVER_RETRY_AFTER_SECONDS}).encode("utf-8")
+  connection = "keep-alive" if keep_alive else "close"
+  head = (
+    f"{version} 503 Service Unavailable\r\nContent-Type: application/json; charset=utf-8\r\n"
+    f"Content-Length: {len(body)}\r\nRetry-After: {SERVER_RETRY_AFTER_SECONDS}\r\nConnection: {connection}\r\n\r\n"
+  )
+  return head.encode("latin-1") + body
+
+
+def stream_change_events(write, seq: int):
   try:
-    payload = json.loads(BACKLOG_FILE.read_text(encoding="utf-8", errors="ignore"))
-  except Exception:
-    return []
-  items = payload.get("items", [])
-  return items if isinstance(items, list) else []
+    while True:
+      events, reset = change_feed.wait_events(seq, CHANGE_KEEPALIVE_SECONDS)
+      frames, seq = change_event_frames(events, reset, seq)
+      write(frames)
+  except (BrokenPipeError, ConnectionAbortedError, ConnectionResetError, TimeoutError):
+    pass
+
+
+def save_sprint_files(files: list, backlog=None):
+  if backlog is not None:
+    backlog_store.check_writable()
+  SPRINTS_DIR.mkdir(parents=True, exist_ok=True)
+  written = []
+  skipped = []
+  revisions = {}
+  for file_data in files:
+    name = safe_name(str(file_data.get("name", "")).replace(".md", ""))
+    content = str(file_data.get("content", ""))
+    out = SPRINTS_DIR / f"{name}.md"
+    if write_text_if_changed(out, content):
+      written.append(name)
+    else:
+      skipped.append(name)
+    revisions[name] = content_revision(content)
+
+  backlog_saved = False
+  if backlog is not None:
+    backlog_saved = write_backlog_items(backlog)
+  synced_projects = 0
+  if written:
+    synced_projects = sync_project_sprints_files(read_sprint_files([SPRINTS_DIR / f"{name}.md" for name in written]), partial=True)
+  return {
+    "ok": True,
+    "saved": len(written),
+    "written": written,
+    "skipped": skipped,
+    "revisions": revisions,
+    "backlog_saved": backlog_saved,
+    "synced_project_sprints": synced_projects,
+    "project_sprints_after": PROJECT_SPRINTS_FROM,
+    "write_revision": file_writer.latest(),
+  }
 
 
-def write_backlog_items(items):
-  BACKLOG_FILE.parent.mkdir(parents=True, exist_ok=True)
-  payload = {"items": items if isinstance(items, list) else []}
-  BACKLOG_FILE.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8", newline="\n")
+class SaveAllCoalescer:
+  def __init__(self):
+    self.cond = threading.Condition()
+    self.clients = {}
+
+  def submit(self, client: str, files: list, backlog=None):
+    named = []
+    for file_data in files:
+      if not isinstance(file_data, dict):
+        raise ValueError("Invalid files payload")
+      named.append((safe_name(str(file_data.get("name", "")).replace(".md", "")), file_data))
+    with self.cond:
+      state = self.clients.get(client)
+      if state is None:
+        self._prune()
+        state = self.clients[client] = {"running": False, "next": None, "last": 0.0}
+      batch = state["next"]
+      if batch is None:
+        batch = state["next"] = {"files": {}, "backlog": None, "requests": 0, "done": False, "result": None, "error": None}
+      for name, file_data in named:
+        batch["files"][name] = file_data
+      if backlog is not None:
+        batch["backlog"] = backlog
+      batch["requests"] += 1
+      while not batch["done"]:
+        if state["running"] or state["next"] is not batch:
+          self.cond.wait()
+          continue
+        delay = state["last"] + SAVE_ALL_MIN_INTERVAL_SECONDS - time.monotonic()
+        if delay > 0:
+          self.cond.wait(delay)
+          continue
+        state["running"] = True
+        state["next"] = None
+        break
+      if batch["done"]:
+        if batch["error"]:
+          raise batch["error"]
+        return {**batch["result"], "coalesced": batch["requests"]}
+    try:
+      batch["result"] = save_sprint_files(list(batch["files"].values()), batch["backlog"])
+    except Exception as exc:
+      batch["error"] = exc
+    with self.cond:
+      batch["done"] = True
+      state["running"] = False
+      state["last"] = time.monotonic()
+      self.cond.notify_all()
+    if batch["error"]:
+      raise batch["error"]
+    return {**batch["result"], "coalesced": batch["requests"]}
+
+  def _prune(self):
+    if len(self.clients) < SAVE_ALL_CLIENTS_MAX:
+      return
+    cutoff = time.monotonic() - 60
+    for client, state in list(self.clients.items()):
+      if not state["running"] and state["next"] is None and state["last"] < cutoff:
+        del self.clients[client]
+
+
+save_all_coalescer = SaveAllCoalescer()
 
 
 class Handler(SimpleHTTPRequestHandler):
+  timeout = REQUEST_TIMEOUT_SECONDS
+
   def translate_path(self, path):
     parsed = urlparse(path).path
     rel = parsed.lstrip("/") or "index.html"
     return str(BASE_DIR / rel)
 
-  def _json(self, code: int, payload: dict):
-    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+  def handle_one_request(self):
+    self._instrumented(super().handle_one_request)
+
+  def _instrumented(self, handle):
+    self.command = None
+    self.response_status = 0
+    self.response_bytes = 0
+    request_context.origin = ""
+    begin_request_metrics()
+    profiler = start_request_profile()
+    try:
+      handle()
+    finally:
+      if profiler:
+        profiler.disable()
+      self._record_request(profiler)
+
+  def _record_request(self, profiler):
+    seconds = time.perf_counter() - request_context.started
+    phases, files = request_context.phases, request_context.files
+    request_context.phases = None
+    request_context.files = None
+    if not self.command:
+      return
+    route = metrics_route(self.path, self.response_status)
+    metrics.observe(self.command, route, self.response_status, seconds, self.response_bytes, phases, files)
+    if profiler and seconds * 1000 >= SLOW_REQUEST_MS and route != "/api/events":
+      try:
+        dump_slow_request(profiler, self.command, route, seconds)
+      except OSError:
+        pass
+
+  def send_response(self, code, message=None):
+    self.response_status = code
+    super().send_response(code, message)
+
+  def send_header(self, keyword, value):
+    if keyword.lower() == "content-length":
+      self.response_bytes = int(value)
+    super().send_header(keyword, value)
+
+  def end_headers(self):
+    if getattr(self, "path", "").startswith("/api/") and getattr(request_context, "phases", None) is not None:
+      super().send_header("Server-Timing", server_timing_header())
+    super().end_headers()
+
+  def _accept_body(self, parsed: str) -> bool:
+    try:
+      length = int(self.headers.get("Content-Length") or 0)
+    except ValueError:
+      length = -1
+    limit = request_body_limit(parsed)
+    if 0 <= length <= limit:
+      self.body_length = length
+      return True
+    self.close_connection = True
+    if length < 0:
+      self._json(400, {"error": "Invalid Content-Length"})
+    else:
+      metrics.count("requests_rejected_too_large")
+      self._json(413, {"error": f"Request body too large ({length} bytes, limit {limit})", "limit": limit})
+    return False
+
+  def _read_json(self):
+    remaining = getattr(self, "body_length", 0)
+    self.body_length = 0
+    return read_json_body(self.rfile, remaining)
+
+  def _json(self, code: int, payload: dict, etag: str = ""):
+    with timed("json"):
+      body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
     try:
       self.send_response(code)
       self.send_header("Content-Type", "application/json; charset=utf-8")
       self.send_header("Content-Length", str(len(body)))
+      if etag:
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
       self.end_headers()
       self.wfile.write(body)
     except (BrokenPipeError, ConnectionAbortedError, ConnectionResetError):
       return
 
+  def _json_stream(self, code: int, payload: dict, etag: str = ""):
+    pieces = iter_json(payload)
+    buffer = bytearray()
+    with timed("json"):
+      for piece in pieces:
+        buffer += piece
+        if len(buffer) >= RESPONSE_WRITE_CHUNK:
+          break
+      else:
+        pieces = None
+    chunked = pieces is not None and self.protocol_version == "HTTP/1.1" and self.request_version == "HTTP/1.1"
+    try:
+      self.send_response(code)
+      self.send_header("Content-Type", "application/json; charset=utf-8")
+      if pieces is None:
+        self.send_header("Content-Length", str(len(buffer)))
+      elif chunked:
+        self.send_header("Transfer-Encoding", "chunked")
+      else:
+        self.send_header("Connection", "close")
+        self.close_connection = True
+      if etag:
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+      self.end_headers()
+      if pieces is not None:
+        with timed("json"):
+          for piece in pieces:
+            if len(buffer) >= RESPONSE_WRITE_CHUNK:
+              self._write_chunk(buffer, chunked)
+              buffer.clear()
+            buffer += piece
+        self._write_chunk(buffer, chunked)
+        if chunked:
+          self.wfile.write(b"0\r\n\r\n")
+      else:
+        self.wfile.write(buffer)
+    except (BrokenPipeError, ConnectionAbortedError, ConnectionResetError):
+      self.close_connection = True
+
+  def _write_chunk(self, data: bytearray, chunked: bool):
+    if not data:
+      return
+    self.response_bytes += len(data)
+    self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data) if chunked else data)
+
+  def _not_modified(self, etag: str) -> bool:
+    header = self.headers.get("If-None-Match", "")
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()]
+    if etag not in tags and "*" not in tags:
+      return False
+    try:
+      self.send_response(304)
+      self.send_header("ETag", etag)
+      self.send_header("Cache-Control", "no-cache")
+      self.end_headers()
+    except (BrokenPipeError, ConnectionAbortedError, ConnectionResetError):
+      pass
+    return True
+
+  def _static(self, parsed: str, head_only: bool = False) -> bool:
+    try:
+      route = load_static_assets().get(parsed)
+    except OSError:
+      return False
+    if not route:
+      return False
+    asset, immutable = route
+    try:
+      if not immutable and self._not_modified(asset["etag"]):
+        return True
+      body = asset["data"]
+      use_gzip = accepts_gzip(self.headers.get("Accept-Encoding", ""))
+      if use_gzip:
+        body = asset["gzip"]
+      self.send_response(200)
+      self.send_header("Content-Type", asset["type"])
+      self.send_header("Content-Length", str(len(body)))
+      self.send_header("Vary", "Accept-Encoding")
+      if use_gzip:
+        self.send_header("Content-Encoding", "gzip")
+      self.send_header("ETag", asset["etag"])
+      if immutable:
+        self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+      else:
+        self.send_header("Cache-Control", "no-cache")
+      self.end_headers()
+      if not head_only:
+        self.wfile.write(body)
+    except (BrokenPipeError, ConnectionAbortedError, ConnectionResetError):
+      pass
+    return True
+
+  def copyfile(self, source, outputfile):
+    sendfile = getattr(os, "sendfile", None)
+    try:
+      in_fd = source.fileno()
+      out_fd = self.connection.fileno()
+    except (AttributeError, OSError, ValueError):
+      sendfile = None
+    if sendfile is None:
+      return super().copyfile(source, outputfile)
+    outputfile.flush()
+    offset = 0
+    while True:
+      sent = sendfile(out_fd, in_fd, offset, 1 << 20)
+      if not sent:
+        break
+      offset += sent
+
+  def do_HEAD(self):
+    if self._static(urlparse(self.path).path, head_only=True):
+      return
+    return super().do_HEAD()
+
   def do_GET(self):
     parsed_url = urlparse(self.path)
     parsed = parsed_url.path
+    if self._static(parsed):
+      return
     if parsed == "/favicon.ico":
       self.send_response(204)
       self.end_headers()
       return
     if parsed == "/api/pjs":
       PJS_FILE.parent.mkdir(parents=True, exist_ok=True)
-      if not PJS_FILE.exists():
-        PJS_FILE.write_text("# PJs\n", encoding="utf-8", newline="\n")
+      if not file_exists(PJS_FILE):
+        write_text_file(PJS_FILE, "# PJs\n", wait=True)
+      etag = stamps_etag([PJS_FILE])
+      if self._not_modified(etag):
+        return
       self._json(
         200,
         {
           "path": "tech/pjs.md",
-          "content": PJS_FILE.read_text(encoding="utf-8", errors="ignore"),
+          "content": read_text_cached(PJS_FILE),
         },
+        etag,
       )
       return
-    if parsed == "/api/sprint-files":
-      SPRINTS_DIR.mkdir(parents=True, exist_ok=True)
-      files = []
-      for path in sorted(SPRINTS_DIR.glob("*.md")):
-        files.append(
-          {
-            "name": path.name,
-            "content": path.read_text(encoding="utf-8", errors="ignore"),
-          }
-        )
-      self._json(200, {"files": files, "backlog": read_backlog_items()})
+    if parsed in ("/api/sprint-files", "/api/sprints"):
+      try:
+        paths, window = select_sprint_window(parse_qs(parsed_url.query or ""))
+      except ValueError as exc:
+        self._json(400, {"error": str(exc)})
+        return
+      etag = stamps_etag(paths, json.dumps([window, backlog_store.revision()]))
+      if self._not_modified(etag):
+        return
+      if parsed == "/api/sprints":
+        payload = {"sprints": (parse_sprint_file(path) for path in paths)}
+      else:
+        payload = {"files": (sprint_file_entry(path) for path in paths)}
+      backlog, payload["backlogRevision"], payload["backlogError"] = backlog_store.snapshot()
+      payload["backlog"] = (item for item in backlog)
+      payload["range"] = window
+      self._json_stream(200, payload, etag)
       return
     if parsed == "/api/team-members":
-      members = list_team_members()
-      self._json(200, {"root": "tech/team", "members": members})
+      TEAM_DIR.mkdir(parents=True, exist_ok=True)
+      summary = query_value(parse_qs(parsed_url.query or ""), "summary") in ("1", "true")
+      etag = stamps_etag(sorted(TEAM_DIR.glob("*.md")), "summary" if summary else "")
+      if self._not_modified(etag):
+        return
+      self._json_stream(200, {"root": "tech/team", "members": iter_team_members(summary)}, etag)
       return
     if parsed == "/api/team-metrics":
-      if not TEAM_METRICS_FILE.exists() or not TEAM_METRICS_FILE.is_file():
+      if not file_exists(TEAM_METRICS_FILE):
         self._json(404, {"error": "Metrics file not found"})
         return
+      etag = stamps_etag([TEAM_METRICS_FILE])
+      if self._not_modified(etag):
+        return
       self._json(
         200,
         {
           "path": "tech/métricas.md",
-          "content": TEAM_METRICS_FILE.read_text(encoding="utf-8", errors="ignore"),
+          "content": read_text_cached(TEAM_METRICS_FILE),
         },
+        etag,
       )
       return
     if parsed == "/api/team-member/file":
@@ -420,10 +3580,13 @@ class Handler(SimpleHTTPRequestHandler):
         query = parse_qs(parsed_url.query or "")
         rel = safe_rel_team_path((query.get("path") or [""])[0])
         file_path = resolve_team_file(rel)
-        if not file_path.exists() or not file_path.is_file():
+        if not file_exists(file_path):
           self._json(404, {"error": "File not found"})
           return
-        content = file_path.read_text(encoding="utf-8", errors="ignore")
+        etag = stamps_etag([file_path])
+        if self._not_modified(etag):
+          return
+        content = read_text_cached(file_path)
         self._json(
           200,
           {
@@ -431,110 +3594,352 @@ class Handler(SimpleHTTPRequestHandler):
             "name": parse_member_name_from_content(file_path, content),
             "nickname": parse_nickname_from_content(content),
             "content": content,
+            "revision": content_cache.derive(file_path, "revision", content_revision),
           },
+          etag,
         )
       except Exception as exc:
         self._json(400, {"error": str(exc)})
       return
     if parsed == "/api/projects/tree":
-      PROJECTS_DIR.mkdir(parents=True, exist_ok=True)
-      ensure_project_support_files()
-      dirs = []
-      files = []
-      for path in sorted(PROJECTS_DIR.rglob("*")):
-        rel = path.relative_to(PROJECTS_DIR).as_posix()
-        if path.is_dir():
-          dirs.append(rel)
-        elif path.is_file():
-          files.append(rel)
-      self._json(200, {"root": "projects", "dirs": dirs, "files": files})
+      query = parse_qs(parsed_url.query or "")
+      if "path" not in query and "depth" not in query:
+        revision, listing = refresh_projects_tree()
+        etag = f'"{revision}"'
+        if self._not_modified(etag):
+          return
+        self._json(200, {"root": "projects", "dirs": listing["dirs"], "files": listing["files"]}, etag)
+        return
+      try:
+        raw_path = query_value(query, "path")
+        rel = safe_rel_projects_path(raw_path) if raw_path else ""
+        if rel:
+          resolve_projects_file(rel)
+        depth_raw = query_value(query, "depth") or "1"
+        if not depth_raw.isdigit() or int(depth_raw) < 1:
+          raise ValueError("depth must be a positive integer")
+        entries = list_projects_folder(rel.rstrip("/"), int(depth_raw))
+        if entries is None:
+          self._json(404, {"error": "Folder not found"})
+          return
+        self._json(200, {"root": "projects", "path": rel.rstrip("/"), "depth": int(depth_raw), "entries": entries})
+      except Exception as exc:
+        self._json(400, {"error": str(exc)})
+      return
+    if parsed == "/api/projects/bundle":
+      try:
+        query = parse_qs(parsed_url.query or "")
+        projects = [value for value in query.get("project", []) if value.strip()]
+        paths = [value for value in query.get("path", []) if value.strip()]
+        include = [part for part in (query_value(query, "include") or ",".join(PROJECT_BUNDLE_FILES)).split(",") if part]
+        unknown = [part for part in include if part not in PROJECT_BUNDLE_FILES]
+        if unknown:
+          raise ValueError(f"Unknown bundle part: {unknown[0]}")
+        if not projects and not paths:
+          raise ValueError("project or path is required")
+        with_content = query_value(query, "content") != "0"
+        etag = stamps_etag(project_bundle_paths(projects, include, paths), parsed_url.query)
+        if self._not_modified(etag):
+          return
+        files = []
+        missing = []
+        for raw in paths:
+          rel = safe_rel_projects_path(raw)
+          entry = project_file_entry(rel, resolve_projects_file(rel), with_content)
+          if entry:
+            files.append(entry)
+          else:
+            missing.append(rel)
+        payload = {
+          "projects": (read_project_bundle(project, include, with_content) for project in projects),
+          "files": files,
+          "missing": missing,
+        }
+        self._json_stream(200, payload, etag)
+      except Exception as exc:
+        self._json(400, {"error": str(exc)})
+      return
+    if parsed == "/api/events":
+      self._events(parsed_url)
+      return
+    if parsed == "/api/writes":
+      self._json(200, file_writer.status())
+      return
+    if parsed == "/api/_metrics":
+      body = metrics.render().encode("utf-8")
+      try:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+      except (BrokenPipeError, ConnectionAbortedError, ConnectionResetError):
+        pass
+      return
+    if parsed == "/api/backlog":
+      etag = stamps_etag([], backlog_store.revision())
+      if self._not_modified(etag):
+        return
+      backlog, revision, _ = backlog_store.snapshot()
+      self._json(200, {"backlog": backlog, "revision": revision, **backlog_store.status()}, etag)
+      return
+    if parsed == "/api/writes/wait":
+      try:
+        query = parse_qs(parsed_url.query or "")
+        revision_raw = query_value(query, "revision") or str(file_writer.latest())
+        timeout_raw = query_value(query, "timeout") or "10"
+        if not revision_raw.isdigit():
+          raise ValueError("revision must be an integer")
+        timeout = min(max(float(timeout_raw), 0.0), WRITE_WAIT_MAX_SECONDS)
+        try:
+          durable = file_writer.wait(int(revision_raw), timeout)
+        except WriteFailed:
+          durable = False
+        failed = file_writer.failed(int(revision_raw))
+        status = file_writer.status()
+        self._json(
+          500 if failed else 200 if durable else 202,
+          {
+            "ok": durable,
+            "revision": int(revision_raw),
+            "durable": status["durable"],
+            "pending": status["pending"],
+            "failed": failed,
+            "last_error": status["last_error"],
+          },
+        )
+      except Exception as exc:
+        self._json(400, {"error": str(exc)})
+      return
+    if parsed == "/api/rollups":
+      try:
+        query = parse_qs(parsed_url.query or "")
+        paths, window = select_sprint_window(query)
+        per_sprint = query_value(query, "perSprint") == "1"
+        etag = stamps_etag(sprint_file_paths(), json.dumps([window, per_sprint]))
+        if self._not_modified(etag):
+          return
+        payload = rollup_index.window([path.stem for path in paths], per_sprint)
+        payload["range"] = {"from": paths[0].stem if paths else "", "to": paths[-1].stem if paths else "", **window}
+        self._json(200, payload, etag)
+      except Exception as exc:
+        self._json(400, {"error": str(exc)})
+      return
+    if parsed == "/api/tasks/query":
+      try:
+        query = parse_qs(parsed_url.query or "")
+        filters = {
+          name: query_value(query, name)
+          for name in ("scope", "responsible", "area", "status", "project", "feature", "blocked", "done", "high", "followed", "projectStatus")
+        }
+        if filters["scope"] and filters["scope"] not in ("sprints", "backlog", "all"):
+          raise ValueError("scope must be sprints, backlog or all")
+        sprint_range = None
+        window = None
+        if any(query_value(query, name) for name in ("from", "to", "latest", "cursor")):
+          paths, _ = select_sprint_window(query)
+          sprint_range = (sprint_order_key(paths[0].stem), sprint_order_key(paths[-1].stem)) if paths else ("", "")
+          window = {"from": paths[0].stem, "to": paths[-1].stem} if paths else {"from": "", "to": ""}
+        offset_raw = query_value(query, "offset") or "0"
+        limit_raw = query_value(query, "limit") or str(TASK_QUERY_LIMIT)
+        if not offset_raw.isdigit() or not limit_raw.isdigit() or not 1 <= int(limit_raw) <= 1000:
+          raise ValueError("offset and limit (1-1000) must be integers")
+        total, items = task_store.query(filters, sprint_range, int(offset_raw), int(limit_raw))
+        result = {
+          "total": total,
+          "offset": int(offset_raw),
+          "limit": int(limit_raw),
+          "range": window,
+          "items": items,
+        }
+        if filters["scope"] in ("backlog", "all"):
+          result["backlogError"] = backlog_store.status()["error"]
+        self._json(200, result)
+      except Exception as exc:
+        self._json(400, {"error": str(exc)})
+      return
+    if parsed == "/api/search":
+      try:
+        query = parse_qs(parsed_url.query or "")
+        q = query_value(query, "q")
+        scope = query_value(query, "scope")
+        if scope and scope not in ("projects", "sprints", "team"):
+          raise ValueError("scope must be projects, sprints or team")
+        offset_raw = query_value(query, "offset") or "0"
+        limit_raw = query_value(query, "limit") or str(SEARCH_PAGE_SIZE)
+        if not offset_raw.isdigit() or not limit_raw.isdigit() or not 1 <= int(limit_raw) <= 100:
+          raise ValueError("offset and limit (1-100) must be integers")
+        total, results = search_index.search(q, scope, int(offset_raw), int(limit_raw))
+        self._json(
+          200,
+          {
+            "query": q,
+            "scope": scope,
+            "total": total,
+            "offset": int(offset_raw),
+            "limit": int(limit_raw),
+            "results": results,
+          },
+        )
+      except Exception as exc:
+        self._json(400, {"error": str(exc)})
       return
     if parsed == "/api/projects/file":
       try:
         query = parse_qs(parsed_url.query or "")
         rel = safe_rel_projects_path((query.get("path") or [""])[0])
         file_path = resolve_projects_file(rel)
-        if not file_path.exists() or not file_path.is_file():
+        if not file_exists(file_path):
           self._json(404, {"error": "File not found"})
           return
+        etag = stamps_etag([file_path])
+        if self._not_modified(etag):
+          return
         self._json(
           200,
           {
             "path": rel,
-            "content": file_path.read_text(encoding="utf-8", errors="ignore"),
+            "content": read_text_cached(file_path),
+            "revision": content_cache.derive(file_path, "revision", content_revision),
           },
+          etag,
         )
       except Exception as exc:
         self._json(400, {"error": str(exc)})
       return
     return super().do_GET()
 
+  def _events(self, parsed_url):
+    query = parse_qs(parsed_url.query or "")
+    seq = change_feed.resume_seq(self.headers.get("Last-Event-ID") or query_value(query, "since"))
+    self.close_connection = True
+    pooled = hasattr(self.server, "claim_event_stream")
+    if pooled and not self.server.claim_event_stream():
+      metrics.count("requests_rejected_busy")
+      self.send_response(503)
+      self.send_header("Retry-After", str(SERVER_RETRY_AFTER_SECONDS))
+      self.send_header("Content-Length", "0")
+      self.end_headers()
+      return
+    self.send_response(200)
+    self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+    self.send_header("Cache-Control", "no-cache")
+    self.send_header("X-Accel-Buffering", "no")
+    self.end_headers()
+    try:
+      self.wfile.write(b"retry: 2000\n\n")
+      self.wfile.flush()
+    except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
+      if pooled:
+        self.server.streams.release()
+      return
+    if pooled:
+      self.server.start_event_stream(self.request, seq)
+    else:
+      stream_change_events(self.wfile.write, seq)
+
   def do_POST(self):
+    request_context.origin = str(self.headers.get("X-Client-Id", ""))[:64]
     parsed = urlparse(self.path).path
+    if not self._accept_body(parsed):
+      return
     if parsed == "/api/pjs/save":
       try:
-        length = int(self.headers.get("Content-Length", "0"))
-        raw = self.rfile.read(length)
-        payload = json.loads(raw.decode("utf-8"))
+        payload = self._read_json()
         content = str(payload.get("content", ""))
         PJS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        PJS_FILE.write_text(content, encoding="utf-8", newline="\n")
-        self._json(200, {"ok": True, "path": "tech/pjs.md"})
+        revision = write_text_file(PJS_FILE, content)
+        self._json(200, {"ok": True, "path": "tech/pjs.md", "write_revision": revision})
       except Exception as exc:
         self._json(400, {"error": str(exc)})
       return
     if parsed == "/api/sprint-files/save-all":
       try:
-        length = int(self.headers.get("Content-Length", "0"))
-        raw = self.rfile.read(length)
-        payload = json.loads(raw.decode("utf-8"))
+        payload = self._read_json()
         files = payload.get("files", [])
         backlog = payload.get("backlog", [])
         if not isinstance(files, list):
           raise ValueError("Invalid files payload")
         if not isinstance(backlog, list):
           raise ValueError("Invalid backlog payload")
-
-        SPRINTS_DIR.mkdir(parents=True, exist_ok=True)
-        for file_data in files:
-          name = safe_name(str(file_data.get("name", "")).replace(".md", ""))
-          content = str(file_data.get("content", ""))
-          out = SPRINTS_DIR / f"{name}.md"
-          out.write_text(content, encoding="utf-8", newline="\n")
-
-        write_backlog_items(backlog)
-        synced_projects = sync_project_sprints_files(files)
-        self._json(
-          200,
-          {
-            "ok": True,
-            "saved": len(files),
-            "synced_project_sprints": synced_projects,
-            "project_sprints_after": PROJECT_SPRINTS_FROM,
-          },
-        )
+        client = request_context.origin or self.client_address[0]
+        self._json(200, save_all_coalescer.submit(client, files, backlog if "backlog" in payload else None))
+      except Exception as exc:
+        self._json(400, {"error": str(exc)})
+      return
+    if parsed in SPRINT_EDIT_ROUTES:
+      try:
+        payload = self._read_json()
+        if not isinstance(payload, dict):
+          raise ValueError("Invalid payload")
+        if parsed == "/api/sprints/edits":
+          self._json(200, apply_sprint_edits(payload.get("ops")))
+        else:
+          self._json(200, apply_sprint_edits([{**payload, "op": parsed[len("/api/sprints/"):]}]))
+      except SprintEditConflict as exc:
+        self._json(409, {"error": str(exc), "conflict": True, "sprints": exc.sprints})
+      except Exception as exc:
+        self._json(400, {"error": str(exc)})
+      return
+    if parsed == "/api/backlog/ops":
+      try:
+        payload = self._read_json()
+        ops = payload.get("ops") if isinstance(payload, dict) else None
+        revision = backlog_store.append(ops)
+        self._json(200, {"ok": True, "applied": len(ops), "revision": revision, **backlog_store.status()})
       except Exception as exc:
         self._json(400, {"error": str(exc)})
       return
     if parsed == "/api/projects/file/save":
       try:
-        length = int(self.headers.get("Content-Length", "0"))
-        raw = self.rfile.read(length)
-        payload = json.loads(raw.decode("utf-8"))
+        payload = self._read_json()
         rel = safe_rel_projects_path(str(payload.get("path", "")))
-        content = str(payload.get("content", ""))
         out = resolve_projects_file(rel)
         out.parent.mkdir(parents=True, exist_ok=True)
-        out.write_text(content, encoding="utf-8", newline="\n")
-        self._json(200, {"ok": True, "path": rel})
+        write_revision, revision = save_text_file(out, payload)
+        invalidate_projects_tree(out)
+        self._json(200, {"ok": True, "path": rel, "revision": revision, "write_revision": write_revision})
+      except TextEditConflict as exc:
+        self._json(409, {"error": str(exc), "conflict": True, "revision": exc.revision})
+      except Exception as exc:
+        self._json(400, {"error": str(exc)})
+      return
+    if parsed == "/api/projects/bundle/save":
+      try:
+        payload = self._read_json()
+        files = payload.get("files", [])
+        if not isinstance(files, list) or not files:
+          raise ValueError("Invalid files payload")
+        batch = {}
+        for file_data in files:
+          if not isinstance(file_data, dict):
+            raise ValueError("Invalid files payload")
+          rel = safe_rel_projects_path(str(file_data.get("path", "")))
+          out = resolve_projects_file(rel)
+          if out.is_dir():
+            raise ValueError(f"Path is a folder: {rel}")
+          batch[rel] = (out, str(file_data.get("content", "")))
+        for out, _ in batch.values():
+          out.parent.mkdir(parents=True, exist_ok=True)
+        revision = write_text_files(list(batch.values()), wait=bool(payload.get("wait")))
+        for out, _ in batch.values():
+          invalidate_projects_tree(out)
+        self._json(
+          200,
+          {
+            "ok": True,
+            "saved": len(batch),
+            "revisions": {rel: content_revision(content) for rel, (_, content) in batch.items()},
+            "write_revision": revision,
+          },
+        )
       except Exception as exc:
         self._json(400, {"error": str(exc)})
       return
     if parsed == "/api/projects/folder/create":
       try:
-        length = int(self.headers.get("Content-Length", "0"))
-        raw = self.rfile.read(length)
-        payload = json.loads(raw.decode("utf-8"))
+        payload = self._read_json()
         rel = safe_rel_projects_path(str(payload.get("path", "")))
         out = resolve_projects_file(rel)
         if out.exists() and not out.is_dir():
@@ -543,106 +3948,110 @@ class Handler(SimpleHTTPRequestHandler):
         ensure_project_timeline_file(out)
         ensure_project_features_file(out)
         ensure_project_control_file(out)
+        if out.parent == PROJECTS_DIR.resolve():
+          ensure_project_sprints_file(out)
+        invalidate_projects_tree(out / PROJECT_SPRINTS_FILE_NAME)
         self._json(200, {"ok": True, "path": rel})
       except Exception as exc:
         self._json(400, {"error": str(exc)})
       return
     if parsed == "/api/projects/file/create":
       try:
-        length = int(self.headers.get("Content-Length", "0"))
-        raw = self.rfile.read(length)
-        payload = json.loads(raw.decode("utf-8"))
+        payload = self._read_json()
         rel = safe_rel_projects_path(str(payload.get("path", "")))
         if not rel.lower().endswith(".md"):
           raise ValueError("Only .md files are supported")
         out = resolve_projects_file(rel)
-        if out.exists():
+        if out.exists() or file_exists(out):
           raise ValueError("File already exists")
         out.parent.mkdir(parents=True, exist_ok=True)
-        out.write_text("", encoding="utf-8", newline="\n")
+        write_text_file(out, "", wait=True)
+        invalidate_projects_tree(out)
         self._json(200, {"ok": True, "path": rel})
       except Exception as exc:
         self._json(400, {"error": str(exc)})
       return
     if parsed == "/api/projects/file/delete":
       try:
-        length = int(self.headers.get("Content-Length", "0"))
-        raw = self.rfile.read(length)
-        payload = json.loads(raw.decode("utf-8"))
+        payload = self._read_json()
         rel = safe_rel_projects_path(str(payload.get("path", "")))
         out = resolve_projects_file(rel)
-        if not out.exists() or not out.is_file():
+        if not file_exists(out):
           raise ValueError("File not found")
-        out.unlink()
+        delete_file(out)
+        invalidate_projects_tree(out)
         self._json(200, {"ok": True, "path": rel})
       except Exception as exc:
         self._json(400, {"error": str(exc)})
       return
     if parsed == "/api/team-members/save":
       try:
-        length = int(self.headers.get("Content-Length", "0"))
-        raw = self.rfile.read(length)
-        payload = json.loads(raw.decode("utf-8"))
+        payload = self._read_json()
         members = payload.get("members", [])
         if not isinstance(members, list):
           raise ValueError("Invalid members payload")
         TEAM_DIR.mkdir(parents=True, exist_ok=True)
 
+        changes = []
+        skipped = []
         for item in members:
           rel = safe_rel_team_path(str(item.get("path", "")))
           nickname = str(item.get("nickname", "")).strip()
           out = resolve_team_file(rel)
-          if not out.exists() or not out.is_file():
+          if not file_exists(out):
             raise ValueError(f"Team member file not found: {rel}")
-          content = out.read_text(encoding="utf-8", errors="ignore")
-          updated = replace_nickname_line(content, nickname)
-          out.write_text(updated, encoding="utf-8", newline="\n")
+          fields = content_cache.derive(out, "member", lambda content: parse_team_member_fields(out, content))
+          if fields["nickname"] == nickname:
+            skipped.append(rel)
+            continue
+          changes.append((out, rel, replace_nickname_line(read_text_cached(out), nickname)))
 
-        self._json(200, {"ok": True, "saved": len(members)})
+        written = []
+        for out, rel, updated in changes:
+          if write_text_if_changed(out, updated):
+            written.append(rel)
+          else:
+            skipped.append(rel)
+        self._json(200, {"ok": True, "saved": len(written), "written": written, "skipped": skipped, "write_revision": file_writer.latest()})
       except Exception as exc:
         self._json(400, {"error": str(exc)})
       return
     if parsed == "/api/team-member/file/save":
       try:
-        length = int(self.headers.get("Content-Length", "0"))
-        raw = self.rfile.read(length)
-        payload = json.loads(raw.decode("utf-8"))
+        payload = self._read_json()
         rel = safe_rel_team_path(str(payload.get("path", "")))
-        content = str(payload.get("content", ""))
         out = resolve_team_file(rel)
-        if not out.exists() or not out.is_file():
+        if not file_exists(out):
           raise ValueError("Team member file not found")
-        out.write_text(content, encoding="utf-8", newline="\n")
-        self._json(200, {"ok": True, "path": rel})
+        write_revision, revision = save_text_file(out, payload)
+        self._json(200, {"ok": True, "path": rel, "revision": revision, "write_revision": write_revision})
+      except TextEditConflict as exc:
+        self._json(409, {"error": str(exc), "conflict": True, "revision": exc.revision})
       except Exception as exc:
         self._json(400, {"error": str(exc)})
       return
     if parsed == "/api/team-member/file/create":
       try:
-        length = int(self.headers.get("Content-Length", "0"))
-        raw = self.rfile.read(length)
-        payload = json.loads(raw.decode("utf-8"))
+        payload = self._read_json()
         rel = safe_rel_team_path(str(payload.get("path", "")))
         content = str(payload.get("content", ""))
         out = resolve_team_file(rel)
-        if out.exists():
+        if out.exists() or file_exists(out):
           raise ValueError("Team member file already exists")
         out.parent.mkdir(parents=True, exist_ok=True)
-        out.write_text(content, encoding="utf-8", newline="\n")
+        write_text_file(out, content, wait=True)
         self._json(200, {"ok": True, "path": rel})
       except Exception as exc:
         self._json(400, {"error": str(exc)})
       return
     if parsed == "/api/team-member/file/delete":
       try:
-        length = int(self.headers.get("Content-Length", "0"))
-        raw = self.rfile.read(length)
-        payload = json.loads(raw.decode("utf-8"))
+        payload = self._read_json()
         rel = safe_rel_team_path(str(payload.get("path", "")))
         out = resolve_team_file(rel)
-        if not out.exists() or not out.is_file():
+        if not file_exists(out):
           raise ValueError("Team member file not found")
-        out.unlink()
+        delete_file(out)
         self._json(200, {"ok": True, "path": rel})
       except Exception as exc:
         self._json(400, {"error": str(exc)})
@@ -652,6 +4061,7 @@ class Handler(SimpleHTTPRequestHandler):
       return
 
   def do_DELETE(self):
+    request_context.origin = str(self.headers.get("X-Client-Id", ""))[:64]
     parsed_url = urlparse(self.path)
     parsed = parsed_url.path
     if parsed == "/api/projects/file":
@@ -659,9 +4069,10 @@ class Handler(SimpleHTTPRequestHandler):
         query = parse_qs(parsed_url.query or "")
         rel = safe_rel_projects_path((query.get("path") or [""])[0])
         out = resolve_projects_file(rel)
-        if not out.exists() or not out.is_file():
+        if not file_exists(out):
           raise ValueError("File not found")
-        out.unlink()
+        delete_file(out)
+        invalidate_projects_tree(out)
         self._json(200, {"ok": True, "path": rel})
       except Exception as exc:
         self._json(400, {"error": str(exc)})
@@ -671,9 +4082,9 @@ class Handler(SimpleHTTPRequestHandler):
         query = parse_qs(parsed_url.query or "")
         rel = safe_rel_team_path((query.get("path") or [""])[0])
         out = resolve_team_file(rel)
-        if not out.exists() or not out.is_file():
+        if not file_exists(out):
           raise ValueError("Team member file not found")
-        out.unlink()
+        delete_file(out)
         self._json(200, {"ok": True, "path": rel})
       except Exception as exc:
         self._json(400, {"error": str(exc)})
@@ -681,9 +4092,358 @@ class Handler(SimpleHTTPRequestHandler):
     self._json(404, {"error": "Not found"})
 
 
+class PooledHTTPServer(ThreadingHTTPServer):
+  def __init__(self, address, handler, workers: int = SERVER_WORKERS, queue_size: int = SERVER_QUEUE_SIZE):
+    super().__init__(address, handler)
+    self.pending = queue.SimpleQueue()
+    self.slots = threading.BoundedSemaphore(workers + queue_size)
+    self.streams = threading.BoundedSemaphore(MAX_EVENT_STREAMS)
+    self.detached = set()
+    metrics.gauges["request_queue_depth"] = self.pending.qsize
+    for index in range(workers):
+      threading.Thread(target=self._work, name=f"sprint-hub-http-{index}", daemon=True).start()
+
+  def process_request(self, request, client_address):
+    if self.slots.acquire(blocking=False):
+      self.pending.put((request, client_address))
+      return
+    metrics.count("requests_rejected_busy")
+    try:
+      request.sendall(busy_response("HTTP/1.0"))
+    except OSError:
+      pass
+    self.shutdown_request(request)
+
+  def _work(self):
+    while True:
+      request, client_address = self.pending.get()
+      try:
+        self.finish_request(request, client_address)
+      except Exception:
+        self.handle_error(request, client_address)
+      finally:
+        self.slots.release()
+        if request in self.detached:
+          self.detached.discard(request)
+        else:
+          self.shutdown_request(request)
+
+  def claim_event_stream(self) -> bool:
+    return self.streams.acquire(blocking=False)
+
+  def start_event_stream(self, request, seq: int):
+    self.detached.add(request)
+
+    def run():
+      try:
+        stream_change_events(request.sendall, seq)
+      finally:
+        self.streams.release()
+        self.shutdown_request(request)
+
+    threading.Thread(target=run, name="sprint-hub-events", daemon=True).start()
+
+
+class AsyncResponseWriter:
+  def __init__(self, connection):
+    self.connection = connection
+    self.chunked = False
+
+  def write(self, data) -> int:
+    data = bytes(data)
+    if data:
+      self.connection.send(b"%x\r\n%s\r\n" % (len(data), data) if self.chunked else data)
+    return len(data)
+
+  def flush(self):
+    pass
+
+  def finish(self):
+    if self.chunked:
+      self.chunked = False
+      self.connection.send(b"0\r\n\r\n")
+
+
+class AsyncRequestHandler(Handler):
+  protocol_version = "HTTP/1.1"
+
+  def __init__(self, connection, request: bytes):
+    line, _, rest = request.partition(b"\r\n")
+    self.client_address = connection.peer
+    self.server = connection.engine
+    self.connection = None
+    self.directory = os.getcwd()
+    self.raw_requestline = line + b"\r\n"
+    self.rfile = io.BytesIO(rest)
+    self.wfile = AsyncResponseWriter(connection)
+    self.close_connection = True
+    self.response_has_length = False
+
+  def run(self) -> bool:
+    try:
+      self._instrumented(self._dispatch)
+      self.wfile.finish()
+    except (BrokenPipeError, ConnectionAbortedError, ConnectionResetError):
+      return True
+    return self.close_connection
+
+  def _dispatch(self):
+    if not self.parse_request():
+      return
+    method = getattr(self, f"do_{self.command}", None)
+    if method is None:
+      self.send_error(501, f"Unsupported method ({self.command!r})")
+      return
+    method()
+
+  def handle_expect_100(self):
+    return True
+
+  def send_response(self, code, message=None):
+    self.response_has_length = False
+    super().send_response(code, message)
+
+  def send_header(self, keyword, value):
+    if keyword.lower() in ("content-length", "transfer-encoding"):
+      self.response_has_length = True
+    super().send_header(keyword, value)
+
+  def end_headers(self):
+    chunked = not self.response_has_length and self.response_status >= 200 and self.response_status not in (204, 304) and self.command != "HEAD"
+    if chunked:
+      self.send_header("Transfer-Encoding", "chunked")
+    super().end_headers()
+    self.wfile.chunked = chunked
+
+
+def parse_request_head(head: bytes):
+  lines = head.split(b"\r\n")
+  headers = {}
+  for line in lines[1:]:
+    name, _, value = line.partition(b":")
+    if name:
+      headers[name.strip().lower().decode("latin-1")] = value.strip().decode("latin-1")
+  return lines[0].decode("latin-1").split(" "), headers
+
+
+class AsyncConnection(asyncio.Protocol):
+  def __init__(self, engine):
+    self.engine = engine
+    self.loop = engine.loop
+    self.buffer = bytearray()
+    self.busy = False
+    self.closed = False
+    self.continued = False
+    self.writable = threading.Event()
+    self.writable.set()
+    self.idle_timer = None
+    self.stream = None
+
+  def connection_made(self, transport):
+    self.transport = transport
+    self.peer = (transport.get_extra_info("peername") or ("", 0))[:2]
+    self.engine.connections.add(self)
+    self._arm_idle()
+
+  def connection_lost(self, exc):
+    self.closed = True
+    self.writable.set()
+    self.engine.connections.discard(self)
+    if self.idle_timer:
+      self.idle_timer.cancel()
+    if self.stream:
+      self.stream.cancel()
+
+  def pause_writing(self):
+    self.writable.clear()
+
+  def resume_writing(self):
+    self.writable.set()
+
+  def data_received(self, data: bytes):
+    self.buffer.extend(data)
+    if self.busy and len(self.buffer) > ASYNC_MAX_HEADER_BYTES:
+      self.transport.pause_reading()
+    self._next()
+
+  def _arm_idle(self):
+    if self.idle_timer:
+      self.idle_timer.cancel()
+    self.idle_timer = self.loop.call_later(ASYNC_KEEPALIVE_SECONDS, self._close_idle)
+
+  def _close_idle(self):
+    if not self.busy:
+      self.transport.close()
+
+  def _reject(self, status: int, reason: str):
+    body = reason.encode("utf-8")
+    self.transport.write(b"HTTP/1.1 %d %s\r\nContent-Type: text/plain\r\nContent-Length: %d\r\nConnection: close\r\n\r\n%s" % (status, body, len(body), body))
+    self.transport.close()
+    self.closed = True
+
+  def _next(self):
+    if self.busy or self.closed:
+      return
+    end = self.buffer.find(b"\r\n\r\n")
+    if end < 0:
+      if len(self.buffer) > ASYNC_MAX_HEADER_BYTES:
+        self._reject(431, "Request Header Fields Too Large")
+      return
+    request_line, headers = parse_request_head(bytes(self.buffer[:end]))
+    try:
+      length = int(headers.get("content-length") or 0)
+    except ValueError:
+      self._reject(400, "Bad Request")
+      return
+    if len(request_line) == 3 and request_line[0] in ("POST", "PUT") and length > request_body_limit(urlparse(request_line[1]).path):
+      metrics.count("requests_rejected_too_large")
+      self._reject(413, "Payload Too Large")
+      return
+    size = end + 4 + length
+    if len(self.buffer) < size:
+      if headers.get("expect", "").lower() == "100-continue" and not self.continued:
+        self.continued = True
+        self.transport.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+      return
+    request = bytes(self.buffer[:size])
+    del self.buffer[:size]
+    self.continued = False
+    self.busy = True
+    self.idle_timer.cancel()
+    if len(request_line) == 3 and request_line[0] == "GET" and urlparse(request_line[1]).path == "/api/events":
+      if len(self.engine.streams) >= MAX_EVENT_STREAMS:
+        self._busy()
+        return
+      self.stream = self.loop.create_task(self._events(request_line[1], headers))
+      self.engine.streams.add(self.stream)
+      self.stream.add_done_callback(self.engine.streams.discard)
+      return
+    if self.engine.active >= self.engine.capacity:
+      self._busy()
+      return
+    self.engine.active += 1
+    future = self.loop.run_in_executor(self.engine.executor, AsyncRequestHandler(self, request).run)
+    future.add_done_callback(self._done)
+
+  def _busy(self):
+    metrics.count("requests_rejected_busy")
+    self.transport.write(busy_response("HTTP/1.1", keep_alive=True))
+    self.busy = False
+    self._arm_idle()
+    if self.buffer:
+      self.loop.call_soon(self._next)
+
+  def _done(self, future):
+    self.engine.active -= 1
+    self.busy = False
+    if future.cancelled() or future.exception() is not None or future.result() or self.closed:
+      self.transport.close()
+      return
+    self.transport.resume_reading()
+    self._arm_idle()
+    if self.buffer:
+      self._next()
+
+  def send(self, data: bytes):
+    if self.closed or not self.writable.wait(ASYNC_WRITE_TIMEOUT_SECONDS) or self.closed:
+      raise BrokenPipeError("client went away")
+    self.loop.call_soon_threadsafe(self._write, data)
+
+  def _write(self, data: bytes):
+    if not self.closed:
+      self.transport.write(data)
+
+  def _chunk(self, data: bytes):
+    self.transport.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+  async def _events(self, target: str, headers: dict):
+    query = parse_qs(urlparse(target).query or "")
+    seq = change_feed.resume_seq(headers.get("last-event-id") or query_value(query, "since"))
+    metrics.observe("GET", "/api/events", 200, 0.0, 0, {}, {})
+    self.transport.write(
+      b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream; charset=utf-8\r\nCache-Control: no-cache\r\n"
+      b"X-Accel-Buffering: no\r\nTransfer-Encoding: chunked\r\n\r\n"
+    )
+    self._chunk(b"retry: 2000\n\n")
+    while not self.closed:
+      changed = self.engine.changed
+      events, reset = change_feed.wait_events(seq, 0)
+      if not events and not reset:
+        try:
+          await asyncio.wait_for(changed.wait(), CHANGE_KEEPALIVE_SECONDS)
+          continue
+        except asyncio.TimeoutError:
+          pass
+      frames, seq = change_event_frames(events, reset, seq)
+      self._chunk(frames)
+
+
+class AsyncEngine:
+  def __init__(self, address, workers: int = SERVER_WORKERS, queue_size: int = SERVER_QUEUE_SIZE):
+    self.address = address
+    self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sprint-hub-http")
+    self.capacity = workers + queue_size
+    self.active = 0
+    self.streams = set()
+    self.connections = set()
+    metrics.gauges["request_queue_depth"] = lambda: max(0, self.active - workers)
+    self.loop = None
+    self.changed = None
+
+  def notify_change(self):
+    try:
+      self.loop.call_soon_threadsafe(self._wake)
+    except RuntimeError:
+      pass
+
+  def _wake(self):
+    self.changed.set()
+    self.changed = asyncio.Event()
+
+  async def _serve(self):
+    self.loop = asyncio.get_running_loop()
+    self.changed = asyncio.Event()
+    change_feed.listeners.append(self.notify_change)
+    server = await self.loop.create_server(lambda: AsyncConnection(self), *self.address)
+    async with server:
+      await server.serve_forever()
+
+  def serve_forever(self):
+    asyncio.run(self._serve())
+
+  def server_close(self):
+    if self.notify_change in change_feed.listeners:
+      change_feed.listeners.remove(self.notify_change)
+    self.executor.shutdown(wait=True, cancel_futures=True)
+
+
 if __name__ == "__main__":
-  server = ThreadingHTTPServer((HOST, PORT), Handler)
-  print(f"Sprint Hub server running on http://{HOST}:{PORT}")
+  parser = argparse.ArgumentParser(description="Sprint Hub file server and JSON API.")
+  parser.add_argument("--engine", choices=("threading", "asyncio"), default=os.environ.get("SPRINT_HUB_ENGINE") or "threading", help="threading: HTTP/1.0 with a bounded worker pool; asyncio: HTTP/1.1 keep-alive with a bounded worker pool")
+  parser.add_argument("--workers", type=int, default=SERVER_WORKERS, help="worker threads handling requests")
+  parser.add_argument("--queue", type=int, default=SERVER_QUEUE_SIZE, help="requests allowed to wait for a worker before answering 503")
+  args = parser.parse_args()
+  started = time.perf_counter()
+  ensure_project_support_files()
+  warm = warm_start()
+  load_static_assets()
+  threading.Thread(target=finish_warm_start, name="warm-start", daemon=True).start()
+  threading.Thread(target=change_feed.poll_forever, name="change-feed", daemon=True).start()
+  if args.engine == "asyncio":
+    server = AsyncEngine((HOST, PORT), max(1, args.workers), max(1, args.queue))
+  else:
+    server = PooledHTTPServer((HOST, PORT), Handler, max(1, args.workers), max(1, args.queue))
+  print(f"Sprint Hub server running on http://{HOST}:{PORT} ({args.engine} engine)")
   print(f"Serving app from: {BASE_DIR}")
   print(f"Managing sprint files in: {SPRINTS_DIR}")
-  server.serve_forever()
+  print(f"Warm start: {warm['reused']} sprints reused, {warm['rebuilt']} rebuilt in {(time.perf_counter() - started) * 1000:.0f} ms")
+  signal.signal(signal.SIGTERM, stop_on_signal)
+  try:
+    server.serve_forever()
+  except KeyboardInterrupt:
+    pass
+  finally:
+    server.server_close()
+    backlog_store.compact()
+    file_writer.flush()
+    save_warm_start()